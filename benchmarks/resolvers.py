@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Benchmark the resolve time of the dispatch resolvers
+(:class:`django_crucrudile.resolvers.TrieResolver` and
+:class:`django_crucrudile.resolvers.AlternationResolver`), against
+Django's :class:`django.core.urlresolvers.RegexURLResolver`, for
+resolvers with 10, 100 and 1000 URL patterns.
+
+Run from the repository root : ::
+
+  python benchmarks/resolvers.py
+
+"""
+import os
+import sys
+from timeit import repeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+from django.conf.urls import url
+from django.core.urlresolvers import RegexURLResolver
+
+from django_crucrudile.resolvers import AlternationResolver, TrieResolver
+
+
+SIZES = (10, 100, 1000)
+NUMBER = 1000
+REPEAT = 5
+
+
+def view(request, *args, **kwargs):  # pragma: no cover
+    pass
+
+
+def make_url_patterns(size):
+    """Make ``size`` URL patterns, shaped like the URL patterns of model
+    routers (argument-less and argument patterns)"""
+    url_patterns = []
+    for index in range(size):
+        if index % 2:
+            regex = r'^model{}/detail/(?P<pk>\d+)$'.format(index)
+        else:
+            regex = r'^model{}/list$'.format(index)
+        url_patterns.append(url(regex, view, name='url{}'.format(index)))
+    return url_patterns
+
+
+def make_resolvers(size):
+    url_patterns = make_url_patterns(size)
+    return [
+        ('RegexURLResolver', RegexURLResolver('^', url_patterns)),
+        ('TrieResolver', TrieResolver('^', lambda: url_patterns)),
+        ('AlternationResolver',
+         AlternationResolver('^', lambda: url_patterns)),
+    ]
+
+
+def get_paths(size):
+    """Return paths matching the first, middle and last URL patterns"""
+    return [
+        'model0/list',
+        'model{}/detail/42'.format(size // 2 | 1),
+        'model{}/detail/42'.format(size - 1),
+    ]
+
+
+def main():
+    print('{:>6} {:<20} {:>12} {:>12} {:>12}'.format(
+        'size', 'resolver', 'first (us)', 'middle (us)', 'last (us)'
+    ))
+    for size in SIZES:
+        for name, resolver in make_resolvers(size):
+            timings = []
+            for path in get_paths(size):
+                resolver.resolve(path)  # warm up (populate, compile)
+                timing = min(repeat(
+                    lambda: resolver.resolve(path),
+                    number=NUMBER, repeat=REPEAT
+                ))
+                timings.append(timing / NUMBER * 1e6)
+            print('{:>6} {:<20} {:>12.2f} {:>12.2f} {:>12.2f}'.format(
+                size, name, *timings
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Benchmark the URL builders
+(:class:`django_crucrudile.urlutils.URLBuilder`), using the compiled
+URL builder (see
+:func:`django_crucrudile.urlutils.get_compiled_url_builder`) and
+using the parsers, and the URL regexs generation of a route with
+argument combinations
+(:func:`django_crucrudile.routes.base.BaseRoute.get_url_regexs`).
+
+Run from the repository root : ::
+
+  python benchmarks/urlbuilder.py
+
+"""
+import os
+import sys
+from timeit import repeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+from django_crucrudile.routes import CallbackRoute
+from django_crucrudile.urlutils import URLBuilder
+
+
+NUMBER = 10000
+REPEAT = 5
+
+CASES = [
+    ('empty', []),
+    ('single part', ['list']),
+    ('prefix/name/suffix', ['prefix', 'documentmodel-detail',
+                            (True, r'(?P<pk>\d+)')]),
+    ('optional parts', ['documentmodel', (False, 'detail'), None,
+                        (False, r'(?P<pk>\d+)'), '', (True, 'edit')]),
+]
+
+
+def make_builder(items, compiled):
+    builder = URLBuilder(items)
+    builder.compiled = compiled
+    return builder
+
+
+def make_route():
+    return CallbackRoute(
+        'detail', 'detail', callback=lambda request: None,
+        arguments_spec=[
+            [r'(?P<pk>\d+)', r'(?P<slug>[\w-]+)'],
+            (False, ['json', 'xml', 'html']),
+        ]
+    )
+
+
+def time_call(func, number=NUMBER):
+    func()  # warm up (compile)
+    return min(repeat(func, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def main():
+    print('{:<24} {:>14} {:>14} {:>8}'.format(
+        'case', 'parsers (us)', 'compiled (us)', 'speedup'
+    ))
+    for name, items in CASES:
+        parsers = time_call(make_builder(items, False))
+        compiled = time_call(make_builder(items, True))
+        print('{:<24} {:>14.2f} {:>14.2f} {:>7.1f}x'.format(
+            name, parsers, compiled, parsers / compiled
+        ))
+
+    route = make_route()
+    timings = []
+    for compiled in (False, True):
+        URLBuilder.compiled = compiled
+        timings.append(time_call(
+            lambda: list(route.get_url_regexs()), number=NUMBER // 10
+        ))
+    URLBuilder.compiled = True
+    print('{:<24} {:>14.2f} {:>14.2f} {:>7.1f}x'.format(
+        'route.get_url_regexs()', timings[0], timings[1],
+        timings[0] / timings[1]
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""This module contains the URL cache, an opt-in persistent cache that
+stores the URL regexs and names computed by routes (see
+:func:`django_crucrudile.routes.base.BaseRoute.get_url_regexs_names`)
+in a file, so that they don't need to be computed again (from the URL
+specifications, and argument combinations) when the process restarts.
+
+Each route is stored using a fingerprint of its configuration (see
+:func:`django_crucrudile.routes.base.BaseRoute.get_url_cache_fingerprint`),
+so that routes whose configuration changed don't use stale entries.
+
+To use the URL cache, set the
+:attr:`django_crucrudile.routes.base.BaseRoute.url_cache` attribute
+(on :class:`django_crucrudile.routes.base.BaseRoute`, or on a route
+class), and save the cache once the URL patterns are generated
+(:func:`django_crucrudile.routers.Router.warmup` saves the caches it
+finds) : ::
+
+  from django_crucrudile.cache import URLCache
+  from django_crucrudile.routes.base import BaseRoute
+
+  BaseRoute.url_cache = URLCache('/var/cache/myproject/urls.json',
+                                 version=MYPROJECT_VERSION)
+  ...
+  urlpatterns = list(router.patterns())
+  BaseRoute.url_cache.save()
+
+.. warning::
+
+   The fingerprint is made of the route configuration (route class,
+   model, model URL name and part, URL name and part, URL builder
+   separators, argument specifications, parser and separators), but
+   not of the code of the route classes. Use the
+   ``version`` argument of :class:`URLCache` to invalidate the cache
+   when this code changes (the version of this package is always
+   used).
+
+"""
+import json
+import os
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+from threading import RLock
+
+from django_crucrudile import __version__
+
+
+__all__ = ['URLCache', 'get_fingerprint', 'get_class_path']
+
+
+def get_class_path(klass):
+    """Return the module and qualified name of a class, used in
+    fingerprints
+
+    :argument klass: Class
+    :type klass: class
+
+    :returns: Class path
+    :rtype: str
+
+    >>> get_class_path(URLCache)
+    'django_crucrudile.cache.URLCache'
+
+    """
+    return '{}.{}'.format(
+        klass.__module__,
+        getattr(klass, '__qualname__', klass.__name__)
+    )
+
+
+def get_fingerprint(parts):
+    """Return a fingerprint of the given parts (a digest of their
+    representation)
+
+    :argument parts: Fingerprint parts
+    :type parts: iterable
+
+    :returns: Fingerprint
+    :rtype: str
+
+    >>> get_fingerprint([('name', 'list')]) == (
+    ...   get_fingerprint([('name', 'list')])
+    ... )
+    True
+    >>> get_fingerprint([('name', 'list')]) == (
+    ...   get_fingerprint([('name', 'detail')])
+    ... )
+    False
+
+    """
+    return sha1(repr(tuple(parts)).encode('utf-8')).hexdigest()
+
+
+class URLCache:
+    """Persistent URL cache, storing values (lists of lists of strings)
+    in a JSON file, by fingerprint.
+
+    The file is read on first access, and written by :func:`save`
+    (which only stores the entries that were read or written in this
+    process, so that entries of routes that don't exist anymore are
+    dropped). If the file is missing, unreadable, or if it was written
+    with another version, the cache starts empty.
+
+    .. inheritance-diagram:: URLCache
+
+    >>> import os
+    >>> from tempfile import TemporaryDirectory
+    >>>
+    >>> directory = TemporaryDirectory()
+    >>> path = os.path.join(directory.name, 'urls.json')
+    >>>
+    >>> cache = URLCache(path, version='1')
+    >>> cache.get('key') is None
+    True
+    >>> cache.set('key', [['^list$', 'list']])
+    >>> cache.save()
+    >>>
+    >>> URLCache(path, version='1').get('key')
+    [['^list$', 'list']]
+    >>> URLCache(path, version='2').get('key') is None
+    True
+    >>> cache.hits, cache.misses
+    (0, 1)
+    >>>
+    >>> directory.cleanup()
+
+    """
+    def __init__(self, path, version=None):
+        """Initialize URL cache
+
+        :argument path: Path of the cache file
+        :type path: str
+        :argument version: Version of the cached data (the cache is
+                           invalidated when it changes)
+        :type version: str
+        """
+        self.path = path
+        self.version = '{}:{}'.format(__version__, version)
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._used = {}
+        self._lock = RLock()
+
+    def load(self):
+        """Read the cache file (if it was not read yet)
+
+        :returns: Cache entries
+        :rtype: dict
+        """
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    entries = {}
+                    try:
+                        with open(self.path) as cache_file:
+                            data = json.load(cache_file)
+                        if data.get('version') == self.version:
+                            entries = data['entries']
+                    except (OSError, ValueError, KeyError,
+                            AttributeError, TypeError):
+                        # missing or invalid cache file
+                        pass
+                    self._entries = entries
+        return self._entries
+
+    def get(self, key):
+        """Return the value cached for ``key``
+
+        :argument key: Cache key (fingerprint)
+        :type key: str
+
+        :returns: Cached value, or ``None`` if not found
+        :rtype: list
+        """
+        value = self.load().get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._used[key] = value
+        return value
+
+    def set(self, key, value):
+        """Cache ``value`` for ``key``
+
+        :argument key: Cache key (fingerprint)
+        :type key: str
+        :argument value: Value to cache
+        :type value: list of lists of str
+        """
+        with self._lock:
+            self.load()[key] = value
+            self._used[key] = value
+
+    def save(self):
+        """Write the cache entries that were used in this process in the
+        cache file (writing a temporary file that replaces the cache
+        file, so that other processes never read a partial file)
+        """
+        with self._lock:
+            data = {'version': self.version, 'entries': self._used}
+            directory = os.path.dirname(os.path.abspath(self.path))
+            with NamedTemporaryFile(
+                    'w', dir=directory, delete=False
+            ) as cache_file:
+                json.dump(data, cache_file)
+            os.replace(cache_file.name, self.path)
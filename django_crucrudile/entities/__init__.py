@@ -7,11 +7,73 @@ an URL pattern tree.
               - :class:`django_crucrudile.routers.Router` (concrete)
               - :class:`django_crucrudile.routes.base.BaseRoute` (abstract)
 
+The URL patterns of entities are cached (see
+:func:`Entity.get_cached_patterns`), until the entity, or one of the
+entities registered in it, changes (see :func:`Entity.patterns_changed`).
+
 """
 from abc import ABCMeta, abstractmethod
+from weakref import WeakSet
+
+from django_crucrudile.table import RouteTable
+
+
+class EntityMetaclass(ABCMeta):
+    """Collect the :attr:`Entity.patterns_attributes` defined by the
+    entity class and by its bases (including mixins that do not
+    subclass :class:`Entity`), and mark the entity instances as
+    initialized once their ``__init__`` has returned (see
+    :func:`Entity.__setattr__`).
+
+    .. inheritance-diagram:: EntityMetaclass
+
+    >>> class Mixin:
+    ...   patterns_attributes = ('mixin_attribute',)
+    >>>
+    >>> class Base(metaclass=EntityMetaclass):
+    ...   patterns_attributes = ('base_attribute',)
+    >>>
+    >>> class Child(Mixin, Base):
+    ...   patterns_attributes = ('child_attribute',)
+    >>>
+    >>> sorted(Child._patterns_attributes)
+    ['base_attribute', 'child_attribute', 'mixin_attribute']
+    >>> Child()._initialized
+    True
+
+    """
+    def __init__(cls, name, bases, attrs):
+        """Set :attr:`Entity._patterns_attributes` to the union of the
+        ``patterns_attributes`` defined in the class MRO.
+
+        :argument name: New class name
+        :type name: str
+        :argument bases: New class bases
+        :type bases: tuple
+        :argument attrs: New class attributes
+        :type attrs: dict
+
+        """
+        super().__init__(name, bases, attrs)
+        cls._patterns_attributes = frozenset(
+            attribute
+            for klass in cls.__mro__
+            for attribute in klass.__dict__.get('patterns_attributes', ())
+        )
+
+    def __call__(cls, *args, **kwargs):
+        """Create the instance, and set its ``_initialized`` attribute to
+        ``True``.
+
+        :returns: New instance
+        :rtype: object
+        """
+        instance = super().__call__(*args, **kwargs)
+        instance._initialized = True
+        return instance
 
 
-class Entity(metaclass=ABCMeta):
+class Entity(metaclass=EntityMetaclass):
     """An entity is an abstract class of objects that can be used to make
 an URL pattern tree.
 
@@ -38,16 +100,254 @@ an URL pattern tree.
                       it should be registered as index.
     :type index: bool
     """
+    cache_patterns = True
+    """
+    :attribute cache_patterns: Cache the URL patterns generated by
+                               :func:`patterns` (see
+                               :func:`get_cached_patterns`)
+    :type cache_patterns: bool
+    """
+    _patterns_generation = 0
+    """
+    :attribute _patterns_generation: Incremented when the patterns
+                                     cache gets invalidated (see
+                                     :func:`patterns_changed`)
+    :type _patterns_generation: int
+    """
+    patterns_attributes = ('index', 'redirect')
+    """
+    :attribute patterns_attributes: Attributes used to generate the URL
+                                    patterns (setting them calls
+                                    :func:`patterns_changed`). Each
+                                    class (or mixin) only lists its
+                                    own attributes, they are collected
+                                    by :class:`EntityMetaclass`.
+    :type patterns_attributes: tuple of str
+    """
+    _patterns_attributes = frozenset()
+    """
+    :attribute _patterns_attributes: Attributes listed in
+                                     :attr:`patterns_attributes` by
+                                     the class and its bases
+    :type _patterns_attributes: frozenset of str
+    """
+    _initialized = False
+    """
+    :attribute _initialized: Set to ``True`` when ``__init__`` returns
+                             (see :class:`EntityMetaclass`)
+    :type _initialized: bool
+    """
+    redirect_attributes = ('redirect',)
+    """
+    :attribute redirect_attributes: Attributes used when following
+                                    redirect attributes (setting them
+                                    calls :func:`redirect_changed`)
+    :type redirect_attributes: tuple of str
+    """
+    _redirect_generation = 0
+    """
+    :attribute _redirect_generation: Incremented when the memoized
+                                     redirect target gets invalidated
+                                     (see :func:`redirect_changed`)
+    :type _redirect_generation: int
+    """
     def __init__(self, index=None):
         """Initialize entity, allow setting :attr:`index` from arguments, and
         add ``redirect`` instance attribute
 
+        Also initialize the patterns cache, and the set of entity stores
+        in which the entity is registered (see
+        :func:`patterns_changed`).
+
         :argument index: See :attr:`index`
         """
+        self._patterns_cache = {}
+        self._parents = WeakSet()
+        self._redirect_dependents = WeakSet()
         if index is not None:  # pragma: no cover
             self.index = index
         self.redirect = None
 
+    def __setattr__(self, name, value):
+        """Invalidate the patterns cache (see :func:`patterns_changed`)
+        when setting one of the :attr:`patterns_attributes`, and the
+        memoized redirect target (see :func:`redirect_changed`) when
+        setting one of the :attr:`redirect_attributes`.
+
+        Nothing is invalidated while the entity is being initialized
+        (as nothing can be cached yet).
+
+        .. note::
+
+           Setting an attribute on the entity class (or altering an
+           attribute value in place, or setting an attribute that is
+           not listed in :attr:`patterns_attributes`) does not
+           invalidate the patterns cache : :func:`patterns_changed`
+           should then be called explicitly (or
+           :attr:`cache_patterns` set to ``False``).
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> generation = route._patterns_generation
+        >>> route.unrelated = True
+        >>> route._patterns_generation == generation
+        True
+        >>> route.url_part = 'new_url_part'
+        >>> route._patterns_generation == generation
+        False
+
+        """
+        super().__setattr__(name, value)
+        if self._initialized:
+            if name in self._patterns_attributes:
+                self.patterns_changed()
+            if name in self.redirect_attributes:
+                self.redirect_changed()
+
+    def redirect_changed(self):
+        """Invalidate the redirect target memoized on this entity, and on
+        the entities whose redirect target was found by following this
+        entity (recursively).
+
+        Called when setting one of the :attr:`redirect_attributes` (see
+        :func:`__setattr__`).
+
+        .. seealso::
+
+           For more information on redirect targets, see
+           :func:`django_crucrudile.routers.Router.get_redirect_target`
+
+        """
+        visited = set()
+        entities = [self]
+        while entities:
+            entity = entities.pop()
+            if id(entity) in visited:
+                continue
+            visited.add(id(entity))
+            entity._redirect_generation += 1
+            entity.__dict__.pop('_redirect_target', None)
+            entities.extend(entity.__dict__.get('_redirect_dependents', ()))
+
+    def patterns_changed(self):
+        """Invalidate the patterns cache of this entity, and of the
+        entities in which it is registered (recursively). The patterns
+        cache of the other entities (siblings, and their descendants) is
+        kept, so that the next :func:`patterns` call only rebuilds the
+        patterns of the entities that changed and of their parents.
+
+        The patterns generation counter of the invalidated entities is
+        also incremented, so that patterns generated (in another thread)
+        while the entity changed are not cached.
+
+        Called when setting one of the :attr:`patterns_attributes` (see
+        :func:`__setattr__`), and when the entity store of a router
+        changes (see
+        :func:`django_crucrudile.routers.Router.store_changed`).
+
+        >>> from django_crucrudile.routers import Router
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> parent, child, sibling = Router(), Router(), Router()
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> parent.register(child) is child
+        True
+        >>> parent.register(sibling) is sibling
+        True
+        >>> child.register(route) is route
+        True
+        >>>
+        >>> _ = list(parent.patterns())
+        >>> [bool(entity._patterns_cache)
+        ...  for entity in (parent, child, sibling, route)]
+        [True, True, True, True]
+        >>>
+        >>> route.url_part = 'new_url_part'
+        >>> [bool(entity._patterns_cache)
+        ...  for entity in (parent, child, sibling, route)]
+        [False, False, True, False]
+        >>>
+        >>> print(parent.get_str_tree())
+        ... # doctest: +NORMALIZE_WHITESPACE
+         - Router  @ ^
+           - Router  @ ^
+             - name @ ^new_url_part$ <lambda>
+           - Router  @ ^
+
+        """
+        visited = set()
+        entities = [self]
+        while entities:
+            entity = entities.pop()
+            if id(entity) in visited:
+                continue
+            visited.add(id(entity))
+            if isinstance(entity, Entity):
+                patterns_cache = entity.__dict__.get('_patterns_cache')
+                if patterns_cache is not None:
+                    entity._patterns_generation += 1
+                    patterns_cache.clear()
+                entities.extend(entity.__dict__.get('_parents', ()))
+            else:
+                # entity store that is not an entity
+                entity.store_changed()
+
+    def get_cached_patterns(self, cache_key, make_patterns):
+        """Return the patterns cached for ``cache_key``, or get them from
+        ``make_patterns`` (and cache them).
+
+        The patterns are not cached if :attr:`cache_patterns` is
+        ``False``, if ``cache_key`` is not hashable, or if the entity
+        changed while ``make_patterns`` was called.
+
+        :argument cache_key: Patterns cache key (should identify the
+                             arguments used to generate the patterns)
+        :type cache_key: hashable
+        :argument make_patterns: Function returning the URL patterns
+        :type make_patterns: callable
+
+        :returns: URL patterns
+        :rtype: tuple
+
+        >>> from mock import Mock
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> make_patterns = Mock(return_value=['pattern'])
+        >>>
+        >>> route.get_cached_patterns('key', make_patterns)
+        ('pattern',)
+        >>> route.get_cached_patterns('key', make_patterns)
+        ('pattern',)
+        >>> make_patterns.call_count
+        1
+        >>>
+        >>> route.cache_patterns = False
+        >>> route.get_cached_patterns('key', make_patterns)
+        ('pattern',)
+        >>> make_patterns.call_count
+        2
+
+        """
+        patterns_cache = self.__dict__.get('_patterns_cache')
+        if not self.cache_patterns or patterns_cache is None:
+            return tuple(make_patterns())
+        try:
+            cached_patterns = patterns_cache.get(cache_key)
+        except TypeError:  # pragma: no cover
+            # unhashable key, don't use the cache
+            return tuple(make_patterns())
+        if cached_patterns is not None:
+            return cached_patterns
+        # if the entity changes while we generate the patterns, the
+        # generated patterns should not be cached
+        generation = self._patterns_generation
+        patterns = tuple(make_patterns())
+        if generation == self._patterns_generation:
+            patterns_cache[cache_key] = patterns
+        return patterns
+
     @abstractmethod
     def patterns(self, parents=None,
                  add_redirect=None,
@@ -69,6 +369,79 @@ an URL pattern tree.
         """
         pass
 
+    def get_route_records(self, *args, **kwargs):
+        """Yield the route records (see
+        :class:`django_crucrudile.table.RouteRecord`) of this entity.
+
+        The base implementation makes the route records from the URL
+        patterns returned by :func:`patterns` (called with the given
+        arguments). Implementations should make the records without
+        building Django URL objects.
+
+        :returns: Route records
+        :rtype: iterable of :class:`django_crucrudile.table.RouteRecord`
+
+        """
+        return RouteTable.records_from_patterns(
+            self.patterns(*args, **kwargs)
+        )
+
+    def get_route_table(self, patterns_kwargs=None):
+        """Compile the route table (see
+        :class:`django_crucrudile.table.RouteTable`) of this entity,
+        using :func:`get_route_records`
+
+        :argument patterns_kwargs: Keyword arguments to pass to
+                                   :func:`get_route_records`
+        :type patterns_kwargs: dict
+
+        :returns: Route table
+        :rtype: :class:`django_crucrudile.table.RouteTable`
+
+        >>> import tests.unit
+        >>> from django.db.models import Model
+        >>> from django_crucrudile.routers import Router
+        >>>
+        >>> # needed to subclass Django Model
+        >>> __name__ = "tests.doctests"
+        >>>
+        >>> class TestModel(Model):
+        ...   pass
+
+        >>> router = Router(generic=True)
+        >>> router.register(TestModel) is not None
+        True
+        >>>
+        >>> table = router.get_route_table()
+        >>> list(table)
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [<RouteRecord testmodel-list-redirect ^testmodel/$>,
+         <RouteRecord testmodel-delete ^testmodel/delete/(?P<pk>\d+)$>,
+         <RouteRecord testmodel-delete ^testmodel/delete/(?P<slug>[\w-]+)$>,
+         <RouteRecord testmodel-update ^testmodel/update/(?P<pk>\d+)$>,
+         <RouteRecord testmodel-update ^testmodel/update/(?P<slug>[\w-]+)$>,
+         <RouteRecord testmodel-create ^testmodel/create$>,
+         <RouteRecord testmodel-detail ^testmodel/detail/(?P<pk>\d+)$>,
+         <RouteRecord testmodel-detail ^testmodel/detail/(?P<slug>[\w-]+)$>,
+         <RouteRecord testmodel-list ^testmodel/list$>]
+
+        The route table is the same as the route table made from the
+        URL patterns returned by :func:`patterns`, and from the URL
+        patterns made from the route table itself :
+
+        >>> RouteTable(
+        ...   RouteTable.records_from_patterns(router.patterns())
+        ... ) == table
+        True
+        >>> RouteTable(
+        ...   RouteTable.records_from_patterns(table.patterns())
+        ... ) == table
+        True
+
+        """
+        patterns_kwargs = patterns_kwargs or {}
+        return RouteTable(self.get_route_records(**patterns_kwargs))
+
     def get_str_tree(self, patterns_kwargs=None,
                      indent_char=' ', indent_size=2):
         """Return the representation of a entity patterns structure
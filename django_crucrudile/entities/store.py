@@ -18,9 +18,25 @@ in which case the register functions will compare their argument to
 any of the elements in the mapping key, and match even if only a
 single item in the mapping key matches the argument.
 
+The matching mapping key is cached for each entity type (see
+:func:`find_register_map_key`), so that registering many objects of
+the same kind does not test each of them against every mapping key.
+
 The base store is copied on each class definition, using a metaclass,
 so that using register functions that class-level won't alter the base
-store of other class definitions.
+store of other class definitions. These copies are copy-on-write (see
+:class:`CopyOnWriteList` and :class:`CopyOnWriteOrderedDict`) : the
+items are shared with the parent class store until one of the stores
+is altered.
+
+Entity stores can be altered concurrently (from several threads) :
+the functions that alter an entity store (:func:`EntityStore.register`,
+:func:`EntityStore.unregister`, ...) hold a lock specific to the
+entity store, and the functions that alter class-level stores and
+mappings (:func:`EntityStore.register_class`,
+:func:`EntityStore.set_register_mapping`, ...) hold a class-level
+lock. Reading an entity store (iterating over it, or generating URL
+patterns) does not need any lock.
 
 This module also contains a :func:`provides` decorator, that
 decorates a entity store class, adding an object to its base store.
@@ -33,9 +49,162 @@ mean.
 
 """
 from collections import OrderedDict
+from collections.abc import MutableSequence, MutableMapping
+from functools import lru_cache
+from threading import RLock
+from weakref import WeakSet
 from abc import ABCMeta
 
-__all__ = ['provides', 'EntityStoreMetaclass', 'EntityStore']
+from django_crucrudile.entities import Entity, EntityMetaclass
+
+try:
+    from abc import get_cache_token
+except ImportError:  # pragma: no cover
+    # Python < 3.4
+    def get_cache_token():
+        """Return the ABC invalidation counter (incremented when a class
+        gets registered as a virtual subclass of an ABC)."""
+        return ABCMeta._abc_invalidation_counter
+
+__all__ = [
+    'provides', 'Registration', 'EntityStoreMetaclass', 'EntityStore'
+]
+
+
+_class_lock = RLock()
+"""
+:data _class_lock: Lock held when altering the class-level stores and
+                   mappings of entity stores
+"""
+
+_index_lock = RLock()
+"""
+:data _index_lock: Lock held when altering the entity store lists and
+                   the store indexes (and the descendants indexes of
+                   their ancestors). The descendants indexes span
+                   several entity stores, so they can't be updated
+                   under the lock of each store without taking locks
+                   both from a child to its parents (when registering
+                   in the child) and from a parent to its children
+                   (when registering the child), which could deadlock.
+"""
+
+REGISTER_MAP_CACHE_SIZE = 1024
+"""
+:data REGISTER_MAP_CACHE_SIZE: Maximum number of entries in the
+                               register mapping resolution cache (see
+                               :func:`find_register_map_key`)
+"""
+
+
+def match_register_map_key(bases, entity, test):
+    """Return the index of the first register mapping key in ``bases``
+    that matches ``entity``, using ``test`` (:func:`issubclass` or
+    :func:`isinstance`).
+
+    :argument bases: Register mapping keys
+    :type bases: tuple
+    :argument entity: Object to match against the keys
+    :type entity: object or class
+    :argument test: Test to use when comparing ``entity`` to a key
+    :type test: callable
+
+    :returns: Index of the matching key, ``None`` if no key matched
+    :rtype: int
+
+    >>> class Class:
+    ...   pass
+    >>> class OtherClass:
+    ...   pass
+    >>>
+    >>> match_register_map_key((OtherClass, Class), Class, issubclass)
+    1
+    >>> match_register_map_key(((OtherClass, Class), ), Class(), isinstance)
+    0
+    >>> match_register_map_key((OtherClass, None), Class, issubclass)
+    1
+    >>> match_register_map_key((OtherClass, ), Class, issubclass) is None
+    True
+
+    """
+    for index, base in enumerate(bases):
+        if base is None:
+            return index
+        elif isinstance(base, (list, tuple)):
+            if any(test(entity, _base) for _base in base):
+                return index
+        elif test(entity, base):
+            return index
+    return None
+
+
+@lru_cache(maxsize=REGISTER_MAP_CACHE_SIZE)
+def _cached_register_map_key(bases, entity_type, cache_token):
+    """Cached version of :func:`match_register_map_key`, using
+    :func:`issubclass` on ``entity_type``. ``cache_token`` is the ABC
+    cache token, so that registering a virtual subclass on an ABC
+    invalidates the cached results."""
+    return match_register_map_key(bases, entity_type, issubclass)
+
+
+def find_register_map_key(bases, entity):
+    """Return the index of the first register mapping key in ``bases``
+    that matches ``entity``, using a resolution cache indexed by the
+    mapping keys and by the entity type.
+
+    Classes are matched using :func:`issubclass`, other objects are
+    matched using :func:`isinstance` (which gives the same result as
+    :func:`issubclass` on the object type, that we use as cache key).
+    Objects whose type can't be used as cache key (unhashable mapping
+    keys, objects lying about their ``__class__``) are matched without
+    using the cache.
+
+    :argument bases: Register mapping keys
+    :type bases: tuple
+    :argument entity: Object to match against the keys
+    :type entity: object or class
+
+    :returns: Index of the matching key, ``None`` if no key matched
+    :rtype: int
+
+    >>> class Class:
+    ...   pass
+    >>> class SubClass(Class):
+    ...   pass
+    >>>
+    >>> _cached_register_map_key.cache_clear()
+    >>>
+    >>> find_register_map_key((None, ), SubClass())
+    0
+    >>> find_register_map_key((Class, ), SubClass())
+    0
+    >>> find_register_map_key((Class, ), SubClass())
+    0
+    >>> find_register_map_key((Class, ), SubClass)
+    0
+    >>> find_register_map_key((Class, ), Class())
+    0
+    >>>
+    >>> info = _cached_register_map_key.cache_info()
+    >>> info.hits, info.misses
+    (2, 3)
+
+    """
+    if isinstance(entity, type):
+        entity_type = entity
+    else:
+        entity_type = type(entity)
+        if getattr(entity, '__class__', entity_type) is not entity_type:
+            return match_register_map_key(bases, entity, isinstance)
+    try:
+        return _cached_register_map_key(
+            bases, entity_type, get_cache_token()
+        )
+    except TypeError:
+        # unhashable key
+        if isinstance(entity, type):
+            return match_register_map_key(bases, entity, issubclass)
+        return match_register_map_key(bases, entity, isinstance)
 
 
 def provides(provided, **kwargs):
@@ -59,6 +228,210 @@ def provides(provided, **kwargs):
     return register_obj_in_store
 
 
+class CopyOnWriteList(MutableSequence):
+    """List whose copies (obtained with :func:`copy`) share their items
+    until one of them is altered. The items are then copied, and only
+    the altered instance uses the new item list.
+
+    This is used for the base stores, that are copied on each class
+    definition (see :class:`EntityStoreMetaclassMixin`), but rarely
+    altered.
+
+    The item list is never altered in place : changes are made (while
+    holding a lock) on a copy of the item list, that then replaces
+    it. Readers (iterating over the list, or copying it) always see a
+    consistent item list, without needing the lock.
+
+    .. inheritance-diagram:: CopyOnWriteList
+
+    >>> store = CopyOnWriteList([1, 2])
+    >>> copied = store.copy()
+    >>>
+    >>> copied._items is store._items
+    True
+    >>> copied.append(3)
+    >>> copied._items is store._items
+    False
+    >>>
+    >>> store, copied
+    ([1, 2], [1, 2, 3])
+    >>> store == [1, 2]
+    True
+
+    Altering the original instance does not alter the copy :
+
+    >>> copied = store.copy()
+    >>> store[0] = 0
+    >>> del store[1]
+    >>> store, copied
+    ([0], [1, 2])
+
+    """
+    def __init__(self, iterable=None):
+        """Initialize list, using given items
+
+        :argument iterable: Initial items
+        :type iterable: iterable
+        """
+        self._items = list(iterable) if iterable is not None else []
+        self._lock = RLock()
+
+    def copy(self):
+        """Return a copy of this list, sharing its items until one of the
+        lists is altered.
+
+        :returns: Copy-on-write copy
+        :rtype: :class:`CopyOnWriteList`
+        """
+        new = type(self).__new__(type(self))
+        new._items = self._items
+        new._lock = RLock()
+        return new
+
+    def _write(self, operation, *args):
+        """Apply ``operation`` (with ``args``) to a copy of the item list,
+        and use this copy as item list."""
+        with self._lock:
+            items = list(self._items)
+            operation(items, *args)
+            self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __setitem__(self, index, value):
+        self._write(list.__setitem__, index, value)
+
+    def __delitem__(self, index):
+        self._write(list.__delitem__, index)
+
+    def insert(self, index, value):
+        self._write(list.insert, index, value)
+
+    def append(self, value):
+        self._write(list.append, value)
+
+    def __eq__(self, other):
+        if isinstance(other, CopyOnWriteList):
+            other = other._items
+        return self._items == other
+
+    def __repr__(self):
+        return repr(self._items)
+
+
+class CopyOnWriteOrderedDict(MutableMapping):
+    """Ordered mapping whose copies (obtained with :func:`copy`) share
+    their items until one of them is altered (see
+    :class:`CopyOnWriteList`).
+
+    .. inheritance-diagram:: CopyOnWriteOrderedDict
+
+    >>> mapping = CopyOnWriteOrderedDict()
+    >>> mapping['a'] = 1
+    >>> copied = mapping.copy()
+    >>>
+    >>> copied._items is mapping._items
+    True
+    >>> copied['b'] = 2
+    >>> copied._items is mapping._items
+    False
+    >>>
+    >>> list(mapping.items()), list(copied.items())
+    ([('a', 1)], [('a', 1), ('b', 2)])
+    >>> mapping == {'a': 1}
+    True
+
+    """
+    def __init__(self, iterable=None):
+        """Initialize mapping, using given items
+
+        :argument iterable: Initial items
+        :type iterable: mapping or iterable of 2-tuples
+        """
+        self._items = OrderedDict(iterable) if iterable is not None \
+            else OrderedDict()
+        self._lock = RLock()
+
+    def copy(self):
+        """Return a copy of this mapping, sharing its items until one of
+        the mappings is altered.
+
+        :returns: Copy-on-write copy
+        :rtype: :class:`CopyOnWriteOrderedDict`
+        """
+        new = type(self).__new__(type(self))
+        new._items = self._items
+        new._lock = RLock()
+        return new
+
+    def _write(self, operation, *args):
+        """Apply ``operation`` (with ``args``) to a copy of the item
+        mapping, and use this copy as item mapping."""
+        with self._lock:
+            items = OrderedDict(self._items)
+            operation(items, *args)
+            self._items = items
+
+    def __getitem__(self, key):
+        return self._items[key]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __setitem__(self, key, value):
+        self._write(OrderedDict.__setitem__, key, value)
+
+    def __delitem__(self, key):
+        self._write(OrderedDict.__delitem__, key)
+
+    def __repr__(self):
+        return repr(self._items)
+
+
+class Registration:
+    """Entity to register using :func:`EntityStore.register_many`,
+    with the keyword arguments to pass to :func:`EntityStore.register`
+    for this entity.
+
+    .. inheritance-diagram:: Registration
+
+    >>> registration = Registration('entity', index=True)
+    >>> registration
+    <Registration 'entity' {'index': True}>
+    >>> registration.entity, registration.kwargs
+    ('entity', {'index': True})
+
+    """
+    __slots__ = ('entity', 'kwargs')
+
+    def __init__(self, entity, **kwargs):
+        """Initialize registration
+
+        :argument entity: Entity to register
+        :type entity: object
+
+        Other keyword arguments are passed to
+        :func:`EntityStore.register`.
+        """
+        self.entity = entity
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return '<{} {!r} {!r}>'.format(
+            self.__class__.__name__, self.entity, self.kwargs
+        )
+
+
 class BaseStoreMetaclassMixin(type):
     """Allows :class:`EntityStore` to use different
     :attr:`_base_register_map` and :attr:`_base_register_map`
@@ -91,30 +464,34 @@ class BaseStoreMetaclassMixin(type):
     True
 
     """
-    _base_register_map = OrderedDict()
-    _base_register_class_map = OrderedDict()
+    _base_register_map = CopyOnWriteOrderedDict()
+    _base_register_class_map = CopyOnWriteOrderedDict()
     """
     :attribute _base_register_map: Base register map (see
                                    :func:`EntityStore.get_register_map`
                                    and
                                    :func:`EntityStore.register`). Use
-                                   OrderedDict because mappings should
-                                   be used in the order they are added
-                                   (as multiple mappings may match).
-    :type _base_store: dict
+                                   an ordered mapping because mappings
+                                   should be used in the order they
+                                   are added (as multiple mappings may
+                                   match).
+    :type _base_register_map: :class:`CopyOnWriteOrderedDict`
     :attribute _base_register_class_map: Base register class map (see
                                          :func:`EntityStore.get_register_class_map`
                                          and
                                          :func:`EntityStore.register_class`).
-                                         Use OrderedDict because
-                                         mappings should be used in
-                                         the order they are added (as
-                                         multiple mappings may match).
-    :type _base_register_class_map: dict
+                                         Use an ordered mapping
+                                         because mappings should be
+                                         used in the order they are
+                                         added (as multiple mappings
+                                         may match).
+    :type _base_register_class_map: :class:`CopyOnWriteOrderedDict`
     """
     def __init__(cls, name, bases, attrs):
-        """Replace :attr:`_base_store`, :attr:`_base_register_map` and
-        :attr:`_base_register_class_map` by copies of themselves
+        """Replace :attr:`_base_register_map` and
+        :attr:`_base_register_class_map` by copies of themselves (these
+        copies share their items with the originals until one of them
+        is altered, see :class:`CopyOnWriteOrderedDict`)
 
         :argument name: New class name
         :type name: str
@@ -157,20 +534,30 @@ class EntityStoreMetaclassMixin(type):
     ...  Store._base_store)
     False
 
+    The items are shared until one of the stores is altered :
+
+    >>> (NewStore._base_store._items is
+    ...  Store._base_store._items)
+    True
+    >>> NewStore._base_store.append(None)
+    >>> NewStore._base_store, Store._base_store
+    ([None], [])
+
     >>> (FailNewStore._fail_store is
     ...  FailStore._fail_store)
     True
 
     """
-    _base_store = []
+    _base_store = CopyOnWriteList()
     """
     :attribute _base_store: Routed entity class store, instantiated
                                upon Router instantiation.
-    :type _base_store: list
+    :type _base_store: :class:`CopyOnWriteList`
     """
     def __init__(cls, name, bases, attrs):
-        """Replace :attr:`_base_store`, :attr:`_base_register_map` and
-        :attr:`_base_register_class_map` by copies of themselves
+        """Replace :attr:`_base_store` by a copy of itself (this copy
+        shares its items with the original until one of them is
+        altered, see :class:`CopyOnWriteList`)
 
         :argument name: New class name
         :type name: str
@@ -191,7 +578,7 @@ class EntityStoreMetaclassMixin(type):
 
 class EntityStoreMetaclass(EntityStoreMetaclassMixin,
                            BaseStoreMetaclassMixin,
-                           ABCMeta):
+                           EntityMetaclass):
     """Use the entity store and base store metaclass mixins, that handle
     creating a new instance of the stores for each class definition.
 
@@ -200,9 +587,11 @@ class EntityStoreMetaclass(EntityStoreMetaclassMixin,
 
     .. note::
 
-       Also subclasses :class:`abc.ABCMeta` because it will be used as
-       the metaclass for an entity, and entity are abstract classes,
-       which needs the :class:`âbc.ABCMeta` base class.
+       Also subclasses
+       :class:`django_crucrudile.entities.EntityMetaclass` (a subclass
+       of :class:`abc.ABCMeta`) because it will be used as the
+       metaclass for an entity, and entity are abstract classes,
+       which needs the :class:`abc.ABCMeta` base class.
 
     .. inheritance-diagram:: EntityStoreMetaclass
 
@@ -218,13 +607,66 @@ class EntityStore(metaclass=EntityStoreMetaclass):
 
     .. inheritance-diagram:: EntityStore
     """
-    def __init__(self):
+    _register_batch = None
+    """
+    :attribute _register_batch: Register mapping and mapping arguments
+                                used while registering a batch of
+                                entities (see :func:`register_many`)
+    :type _register_batch: tuple
+    """
+    lazy_base_store = False
+    """
+    :attribute lazy_base_store: If ``True``, do not instantiate and
+                                register the entity classes in the base
+                                store when the entity store gets
+                                instantiated, but when the store is
+                                first used (iterated over, or when an
+                                entity gets registered). See
+                                :func:`register_lazy_base_store`.
+    :type lazy_base_store: bool
+    """
+    def __init__(self, lazy_base_store=None):
         """Initialize router (create empty store and register base
-        store)
+        store, unless :attr:`lazy_base_store` is ``True``)
+
+        :argument lazy_base_store: Optional. See :attr:`lazy_base_store`
         """
         super().__init__()
+        if lazy_base_store is not None:
+            self.lazy_base_store = lazy_base_store
+        self._lock = RLock()
         self._store = []
-        self.register_base_store()
+        self._store_index = {}
+        self._descendants_index = {}
+        self._lazy_descendants = WeakSet()
+        self._parents = WeakSet()
+        self._base_store_registered = False
+        self._base_store_ready = False
+        if not self.lazy_base_store:
+            self.register_base_store()
+
+    def __iter__(self):
+        """Iterate over the registered entities, registering the base
+        store first if needed (see :attr:`lazy_base_store`).
+
+        :returns: Registered entities
+        :rtype: iterator
+
+        >>> class Store(EntityStore):
+        ...   pass
+        >>>
+        >>> Store.register_class(lambda: 'base entity') is not None
+        True
+        >>>
+        >>> store = Store(lazy_base_store=True)
+        >>> store._store
+        []
+        >>> list(store)
+        ['base entity']
+
+        """
+        self.register_lazy_base_store()
+        return iter(self._store)
 
     @staticmethod
     def register_apply_map(entity, mapping,
@@ -247,6 +689,14 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         :raises LookupError: If ``silent`` is ``False``, and no
                              matching mapping was found
 
+        .. note::
+
+           The matching mapping key is found using
+           :func:`find_register_map_key`, that caches its result for
+           each entity type and set of mapping keys (the first
+           matching key is still used). Registering many objects of
+           the same kind only walks the mapping keys once.
+
         >>> from mock import Mock
         >>>
         >>> class Class:
@@ -368,69 +818,38 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         if transform_kwargs is None:
             transform_kwargs = {}
 
-        def _match_entity(base, test):
-            """Match the current entity against a given base,
-            with a given test
-
-            """
-            if base is None:
-                return True
-            elif isinstance(base, (list, tuple)):
-                return any(
-                    test(entity, _base)
-                    for _base in base
-                )
-            else:
-                return test(entity, base)
+        bases = tuple(mapping)
+        index = find_register_map_key(bases, entity)
 
-        def _make_entity(func):
-            """Make the new entity using the given function"""
-            return func(
+        if index is not None:
+            # matching key, use value to make entity
+            return mapping[bases[index]](
                 entity,
                 **transform_kwargs
             )
-
-        def _find_entity(test):
-            """Find an entity matching the given test in register_map keys, then,
-            with the matching value, return :func:`_make_entity(value)`.
-
-            If no key matches, return original entity or fail with a
-            ``LookupError`` if silent is False.
-
-            """
-            for base, func in mapping.items():
-                if _match_entity(base, test):
-                    # matching key, use value to make entity
-                    return _make_entity(func)
-            else:
-                # not returned, so no match found
-                if silent:
-                    return entity
-                else:
-                    def _get_base_names():
-                        for base, key in mapping.items():
-                            if isinstance(base, tuple):
-                                yield ', '.join(b.__name__ for b in base)
-                            else:
-                                yield base.__name__
-
-                    raise LookupError(
-                        "Could not find matching key in register mapping. "
-                        "Used test '{}', register mapping bases are '{}', "
-                        "tested against '{}'".format(
-                            test.__name__,
-                            ', '.join(_get_base_names()),
-                            type(entity).__name__
-                            if not isinstance(entity, type) else
-                            entity.__name__
-                        )
-                    )
-        if isinstance(entity, type):
-            # entity is a class, test with issubclass
-            return _find_entity(issubclass)
+        elif silent:
+            # no match found
+            return entity
         else:
-            # entity is not a class, test with isinstance
-            return _find_entity(isinstance)
+            def _get_base_names():
+                for base in bases:
+                    if isinstance(base, tuple):
+                        yield ', '.join(b.__name__ for b in base)
+                    else:
+                        yield base.__name__
+
+            raise LookupError(
+                "Could not find matching key in register mapping. "
+                "Used test '{}', register mapping bases are '{}', "
+                "tested against '{}'".format(
+                    'issubclass' if isinstance(entity, type) else
+                    'isinstance',
+                    ', '.join(_get_base_names()),
+                    type(entity).__name__
+                    if not isinstance(entity, type) else
+                    entity.__name__
+                )
+            )
 
     @classmethod
     def get_register_class_map(self):
@@ -459,6 +878,57 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         """
         return OrderedDict(self._base_register_class_map)
 
+    @classmethod
+    def get_cached_register_class_map(cls):
+        """Return the mapping returned by :func:`get_register_class_map`,
+        memoized for this class.
+
+        The memoized mapping is invalidated when
+        :func:`set_register_class_mapping` is called on this class, or
+        on any of its bases. The cache key is made of the mapping
+        version of each class in the MRO, so that a subclass does not
+        use a mapping computed before one of its bases changed.
+
+        :returns: Register class mapping (should not be altered)
+        :rtype: :class:`collections.OrderedDict`
+
+        >>> from mock import Mock
+        >>>
+        >>> class Class:
+        ...   pass
+        >>> class Store(EntityStore):
+        ...   pass
+        >>> class SubStore(Store):
+        ...   pass
+        >>>
+        >>> mapping = SubStore.get_cached_register_class_map()
+        >>> mapping
+        OrderedDict()
+        >>> SubStore.get_cached_register_class_map() is mapping
+        True
+        >>>
+        >>> mock_mapping_func = Mock()
+        >>> Store.set_register_class_mapping(Class, mock_mapping_func)
+        >>>
+        >>> SubStore.get_cached_register_class_map() is mapping
+        False
+        >>> Store.get_cached_register_class_map() == (
+        ...   {Class: mock_mapping_func}
+        ... )
+        True
+
+        """
+        token = tuple(
+            klass.__dict__.get('_register_class_map_version', 0)
+            for klass in cls.__mro__
+        )
+        cached = cls.__dict__.get('_register_class_map_cache')
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        mapping = cls.get_register_class_map()
+        cls._register_class_map_cache = (token, mapping)
+        return mapping
+
     @classmethod
     def get_register_class_map_kwargs(cls):
         """Arguments passed when applying register map, in
@@ -536,7 +1006,14 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         ... )
         True
         """
-        self._base_register_class_map[key] = value
+        with _class_lock:
+            self._base_register_class_map[key] = value
+            # invalidate memoized class mappings (see
+            # get_cached_register_class_map), for this class and its
+            # subclasses
+            self._register_class_map_version = (
+                self.__dict__.get('_register_class_map_version', 0) + 1
+            )
 
     @classmethod
     def set_register_mapping(self, key, value):
@@ -565,15 +1042,17 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         ... )
         True
         """
-        self._base_register_map[key] = value
+        with _class_lock:
+            self._base_register_map[key] = value
 
     @classmethod
     def register_class(cls, register_cls, map_kwargs=None):
         """Add a route class to :attr:`_base_store`, appling mapping from
-        :func:`get_register_class_map` where required. This route class will
-        be instantiated (with kwargs from :func:`get_base_store_kwargs`)
-        when the Router is itself instiated, using
-        :func:`register_base_store`.
+        :func:`get_register_class_map` (memoized by
+        :func:`get_cached_register_class_map`) where required. This route
+        class will be instantiated (with kwargs from
+        :func:`get_base_store_kwargs`) when the Router is itself
+        instiated, using :func:`register_base_store`.
 
         :argument register_cls: Object to register (usually Route or
                                 Router classes, but could be anything
@@ -612,7 +1091,7 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         >>> store._store == [mock_entity_instance]
         True
         """
-        register_class_map = cls.get_register_class_map()
+        register_class_map = cls.get_cached_register_class_map()
         if register_class_map:
             if map_kwargs is None:
                 map_kwargs = {}
@@ -626,7 +1105,8 @@ class EntityStore(metaclass=EntityStoreMetaclass):
                 register_class_map,
                 map_kwargs
             )
-        cls._base_store.append(register_cls)
+        with _class_lock:
+            cls._base_store.append(register_cls)
         return register_cls
 
     def register(self, entity, map_kwargs=None):
@@ -663,12 +1143,30 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         >>> store._store == [mock_entity_instance]
         True
         """
-        register_map = self.get_register_map()
+        self.register_lazy_base_store()
+        with self._lock:
+            entity = self._apply_register_map(entity, map_kwargs)
+            self.add_to_store(entity)
+        return entity
+
+    def _apply_register_map(self, entity, map_kwargs=None):
+        """Apply the register mappings (from :func:`get_register_map`, or
+        from the current :func:`register_many` batch) to ``entity``, and
+        return the (possibly transformed) entity."""
+        if self._register_batch is not None:
+            # inside register_many(), use the mapping computed for the
+            # whole batch
+            register_map, register_map_kwargs = self._register_batch
+        else:
+            register_map = self.get_register_map()
+            register_map_kwargs = (
+                self.get_register_map_kwargs() if register_map else None
+            )
         if register_map:
             if map_kwargs is None:
                 map_kwargs = {}
             map_kwargs = dict(
-                self.get_register_map_kwargs(),
+                register_map_kwargs,
                 **map_kwargs
             )
 
@@ -677,9 +1175,542 @@ class EntityStore(metaclass=EntityStoreMetaclass):
                 register_map,
                 map_kwargs
             )
-        self._store.append(entity)
         return entity
 
+    def unregister(self, entity):
+        """Unregister an entity, removing it from the entity store (see
+        :func:`remove_from_store`).
+
+        :argument entity: Entity to unregister (as returned by
+                          :func:`register`, compared by identity)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: The unregistered entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        :raises ValueError: If ``entity`` is not registered in this
+                            entity store
+
+        >>> store = EntityStore()
+        >>> store.register('foo')
+        'foo'
+        >>> store.register('bar')
+        'bar'
+        >>>
+        >>> store.unregister('foo')
+        'foo'
+        >>> store._store
+        ['bar']
+
+        """
+        self.register_lazy_base_store()
+        with self._lock:
+            self.remove_from_store(entity)
+        return entity
+
+    def replace(self, entity, new_entity, map_kwargs=None):
+        """Replace a registered entity by another one, at the same
+        position in the entity store. The register mappings are applied
+        to ``new_entity``, as in :func:`register`.
+
+        :argument entity: Entity to replace (as returned by
+                          :func:`register`, compared by identity)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+        :argument new_entity: Entity to register instead
+        :type new_entity: :class:`django_crucrudile.entities.Entity`
+        :argument map_kwargs: Argument to pass to mapping value if
+                              ``new_entity`` gets transformed.
+        :type map_kwargs: dict
+
+        :returns: The registered entity, transformed by register
+                  mappings if there was a matching mapping
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        :raises ValueError: If ``entity`` is not registered in this
+                            entity store
+
+        >>> class Store(EntityStore):
+        ...   @classmethod
+        ...   def get_register_map(self):
+        ...     return {int: str}
+        >>>
+        >>> store = Store()
+        >>> store.register(1)
+        '1'
+        >>> foo = store.register('foo')
+        >>>
+        >>> store.replace(foo, 2)
+        '2'
+        >>> store._store
+        ['1', '2']
+
+        """
+        self.register_lazy_base_store()
+        with self._lock:
+            # fail before applying the mappings
+            self._get_store_position(entity)
+            new_entity = self._apply_register_map(new_entity, map_kwargs)
+            self.replace_in_store(entity, new_entity)
+        return new_entity
+
+    def add_to_store(self, entity):
+        """Append an entity to the entity store, and add it to the store
+        indexes (using the index keys returned by
+        :func:`get_store_index_keys`). Called by :func:`register`, once
+        the register mappings are applied.
+
+        :argument entity: Entity to add
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        >>> class Store(EntityStore):
+        ...   def get_store_index_keys(self, entity):
+        ...     yield 'first_letter', entity[0]
+        >>>
+        >>> store = Store()
+        >>> store.add_to_store('foo')
+        >>> store.add_to_store('bar')
+        >>> store.add_to_store('baz')
+        >>>
+        >>> store._store
+        ['foo', 'bar', 'baz']
+        >>> store.get_indexed('first_letter', 'b')
+        ['bar', 'baz']
+
+        """
+        with self._lock, _index_lock:
+            self._store.append(entity)
+            self._index_entity(entity)
+        self.store_changed()
+
+    def remove_from_store(self, entity):
+        """Remove an entity from the entity store and from the store
+        indexes. Called by :func:`unregister`.
+
+        :argument entity: Entity to remove (compared by identity)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :raises ValueError: If ``entity`` is not in the entity store
+
+        >>> class Store(EntityStore):
+        ...   def get_store_index_keys(self, entity):
+        ...     yield 'first_letter', entity[0]
+        >>>
+        >>> store = Store()
+        >>> store.add_to_store('foo')
+        >>> store.add_to_store('bar')
+        >>>
+        >>> store.remove_from_store('foo')
+        >>> store._store
+        ['bar']
+        >>> store.get_indexed('first_letter', 'f')
+        []
+        >>> store.remove_from_store('foo')
+        ... # doctest: +NORMALIZE_WHITESPACE, +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: 'foo' is not in the entity store of
+        <django_crucrudile.entities.store.Store object at ...>
+
+        """
+        with self._lock, _index_lock:
+            # don't alter the store list in place, as it may be
+            # iterated over (without lock) in other threads
+            store = list(self._store)
+            del store[self._get_store_position(entity)]
+            self._store = store
+            self._unindex_entity(entity)
+        self.store_changed()
+
+    def replace_in_store(self, entity, new_entity):
+        """Replace an entity by another one in the entity store (at the same
+        position), and update the store indexes. Called by
+        :func:`replace`.
+
+        :argument entity: Entity to replace (compared by identity)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+        :argument new_entity: Entity to use instead
+        :type new_entity: :class:`django_crucrudile.entities.Entity`
+
+        :raises ValueError: If ``entity`` is not in the entity store
+
+        >>> class Store(EntityStore):
+        ...   def get_store_index_keys(self, entity):
+        ...     yield 'first_letter', entity[0]
+        >>>
+        >>> store = Store()
+        >>> store.add_to_store('foo')
+        >>> store.add_to_store('bar')
+        >>>
+        >>> store.replace_in_store('foo', 'baz')
+        >>> store._store
+        ['baz', 'bar']
+        >>> store.get_indexed('first_letter', 'b')
+        ['bar', 'baz']
+
+        """
+        with self._lock, _index_lock:
+            self._store[self._get_store_position(entity)] = new_entity
+            self._unindex_entity(entity)
+            self._index_entity(new_entity)
+        self.store_changed()
+
+    def _get_store_position(self, entity):
+        """Return the position of ``entity`` in the entity store (comparing
+        by identity), raise ``ValueError`` if it is not in the store."""
+        for position, stored in enumerate(self._store):
+            if stored is entity:
+                return position
+        raise ValueError(
+            "{!r} is not in the entity store of {!r}".format(entity, self)
+        )
+
+    def _index_entity(self, entity):
+        """Add ``entity`` to the store indexes, and add this store to the
+        parents of ``entity`` (if it's an entity or an entity store).
+
+        The index entries of ``entity``, and the index entries of the
+        entities registered in ``entity`` (recursively, if it's an
+        entity store), are also added to the descendants indexes of
+        this store and of its ancestors (see :func:`get_indexed`)."""
+        entries = [(None, None, entity)]
+        for index, key in self.get_store_index_keys(entity):
+            try:
+                self._store_index.setdefault(
+                    index, {}
+                ).setdefault(key, []).append(entity)
+            except TypeError:
+                # unhashable key, can't be indexed
+                continue
+            entries.append((index, key, entity))
+        if isinstance(entity, (Entity, EntityStore)):
+            entity._parents.add(self)
+        self._update_ancestors(entity, entries, add=True)
+
+    def _unindex_entity(self, entity):
+        """Remove ``entity`` from the store indexes, and remove this store
+        from the parents of ``entity`` (if it's an entity or an entity
+        store, and it's not registered anymore).
+
+        The index entries of ``entity`` (and of the entities registered
+        in it, recursively) are also removed from the descendants
+        indexes of this store and of its ancestors."""
+        entries = [(None, None, entity)]
+        for index, keys in self._store_index.items():
+            for key, entities in list(keys.items()):
+                for position, stored in enumerate(entities):
+                    if stored is entity:
+                        del entities[position]
+                        entries.append((index, key, entity))
+                        break
+                if not entities:
+                    del keys[key]
+        if isinstance(entity, (Entity, EntityStore)) and not any(
+                stored is entity for stored in self._store):
+            entity._parents.discard(self)
+        self._update_ancestors(entity, entries, add=False)
+
+    @staticmethod
+    def _get_index_entries(index):
+        """Yield the entries (index name, key and entity) of an index
+        (store index or descendants index)"""
+        for index_name, keys in index.items():
+            for key, entities in keys.items():
+                for entity in entities:
+                    yield index_name, key, entity
+
+    def _update_ancestors(self, entity, entries, add):
+        """Add (or remove) the index ``entries`` of ``entity`` (registered
+        in this store) to (or from) the descendants indexes of the
+        ancestors of this store, and the index entries of the entities
+        registered in ``entity`` (recursively) to (or from) the
+        descendants indexes of this store and of its ancestors.
+
+        Must be called while holding :data:`_index_lock`, so that the
+        indexes of ``entity`` don't change while they're copied, and
+        the ancestors of this store don't change while they're
+        updated."""
+        subtree_entries = []
+        lazy_stores = []
+        if isinstance(entity, EntityStore):
+            subtree_entries.extend(
+                (None, None, stored) for stored in entity._store
+            )
+            subtree_entries.extend(
+                self._get_index_entries(entity._store_index)
+            )
+            subtree_entries.extend(
+                self._get_index_entries(entity._descendants_index)
+            )
+            lazy_stores.extend(entity._lazy_descendants)
+            if not entity._base_store_ready:
+                lazy_stores.append(entity)
+
+        stores = [self]
+        visited = set()
+        while stores:
+            store = stores.pop()
+            if id(store) in visited or not isinstance(store, EntityStore):
+                continue
+            visited.add(id(store))
+            if store is self:
+                store_entries = subtree_entries
+            else:
+                store_entries = entries + subtree_entries
+            for index, key, descendant in store_entries:
+                keys = store._descendants_index.setdefault(index, {})
+                if add:
+                    keys.setdefault(key, []).append(descendant)
+                else:
+                    descendants = keys.get(key, [])
+                    for position, stored in enumerate(descendants):
+                        if stored is descendant:
+                            del descendants[position]
+                            break
+                    if not descendants:
+                        keys.pop(key, None)
+            if add:
+                store._lazy_descendants.update(lazy_stores)
+            stores.extend(list(store._parents))
+
+    def _register_lazy_descendants(self):
+        """Register the base store of the entity stores registered in this
+        store (recursively) whose base store is not registered yet
+        (see :attr:`lazy_base_store`), so that their entities are in
+        the descendants indexes."""
+        while self._lazy_descendants:
+            with _index_lock:
+                lazy_stores = list(self._lazy_descendants)
+                self._lazy_descendants.difference_update(lazy_stores)
+            for store in lazy_stores:
+                store.register_lazy_base_store()
+
+    def store_changed(self):
+        """Called when the entity store changes (when an entity is added,
+        removed or replaced). The base implementation does
+        nothing. Subclasses that cache data computed from the entity
+        store should override it to invalidate these caches (and call
+        the super implementation).
+
+        .. seealso::
+
+           :func:`django_crucrudile.routers.Router.store_changed`
+
+        """
+        pass
+
+    def get_store_index_keys(self, entity):
+        """Return the indexes (and the keys in these indexes) in which a
+        registered entity should be stored, to be found with
+        :func:`get_indexed`. The base implementation does not index
+        entities.
+
+        The keys are computed when the entity gets registered, and
+        are not updated if the entity is altered afterwards.
+
+        :argument entity: Registered entity
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: Index name and key
+        :rtype: iterable of 2-tuple
+
+        >>> list(EntityStore().get_store_index_keys(None))
+        []
+
+        """
+        return ()
+
+    def get_indexed(self, index, key, descendants=False):
+        """Return the registered entities stored with ``key`` in the
+        ``index`` index (see :func:`get_store_index_keys`).
+
+        If ``descendants`` is ``True``, return the entities registered
+        in the entity stores registered in this store (recursively)
+        instead. The index entries of these entities are added to the
+        descendants indexes of all the ancestors of their entity store
+        when they get registered, so that this does not need to walk
+        the registered entity stores.
+
+        :argument index: Index name
+        :type index: str
+        :argument key: Key to look up in the index
+        :type key: object
+        :argument descendants: Look up the entities registered in the
+                               registered entity stores (recursively)
+        :type descendants: bool
+
+        :returns: Matching entities, in registration order
+        :rtype: list
+
+        >>> class Store(EntityStore):
+        ...   def get_store_index_keys(self, entity):
+        ...     yield 'first_letter', str(entity)[0]
+        ...   def __str__(self):
+        ...     return 'store'
+        >>>
+        >>> root, store, child = Store(), Store(), Store()
+        >>> root.add_to_store(store)
+        >>> store.add_to_store('foo')
+        >>> store.add_to_store(child)
+        >>> child.add_to_store('far')
+        >>>
+        >>> root.get_indexed('first_letter', 'f')
+        []
+        >>> root.get_indexed('first_letter', 'f', descendants=True)
+        ['foo', 'far']
+        >>> store.remove_from_store(child)
+        >>> root.get_indexed('first_letter', 'f', descendants=True)
+        ['foo']
+
+        .. seealso::
+
+           For doctests that use this member, see
+           :func:`django_crucrudile.entities.store.EntityStore.add_to_store`
+
+        """
+        self.register_lazy_base_store()
+        if descendants:
+            self._register_lazy_descendants()
+            index_dict = self._descendants_index
+        else:
+            index_dict = self._store_index
+        try:
+            return list(index_dict.get(index, {}).get(key, ()))
+        except TypeError:
+            # unhashable key, can't be indexed
+            return []
+
+    def get_descendants(self):
+        """Return the entities registered in the entity stores registered
+        in this store (recursively), using the descendants indexes
+        (see :func:`get_indexed`).
+
+        :returns: Entities, in registration order
+        :rtype: list
+        """
+        return self.get_indexed(None, None, descendants=True)
+
+    def register_many(self, entities, map_kwargs=None):
+        """Register several entities, using :func:`register` for each of
+        them, but computing the register mapping (from
+        :func:`get_register_map`) and the mapping arguments (from
+        :func:`get_register_map_kwargs`) only once for the whole batch.
+
+        Items in ``entities`` can be :
+
+        - entities (of any type, including tuples), registered without
+          keyword arguments
+        - :class:`Registration` instances, containing an entity and
+          the keyword arguments to pass to :func:`register` for this
+          entity (for example, ``index`` when registering in a
+          :class:`django_crucrudile.routers.Router`)
+
+        :argument entities: Entities (or registrations) to register
+        :type entities: iterable
+        :argument map_kwargs: Argument to pass to mapping value for
+                              each entity that gets transformed
+                              (updated with the ``map_kwargs`` given
+                              for each entity, if any).
+        :type map_kwargs: dict
+
+        :returns: The registered entities, transformed by register
+                  mappings if there was a matching mapping
+        :rtype: list
+
+        .. warning::
+
+           The register mapping is computed before the first entity
+           gets registered. Entities registered during the batch
+           should not alter the result of :func:`get_register_map` or
+           :func:`get_register_map_kwargs`.
+
+        >>> from mock import Mock
+        >>> mock_mapping_func = Mock()
+        >>> mock_mapping_func.side_effect = lambda entity, **kw: (entity, kw)
+        >>>
+        >>> class Class:
+        ...  pass
+        >>>
+        >>> class Store(EntityStore):
+        ...   get_register_map = Mock(return_value={Class: mock_mapping_func})
+        ...   get_register_map_kwargs = Mock(return_value={'x': 1})
+        >>>
+        >>> store = Store()
+        >>>
+        >>> instances = [Class(), Class()]
+        >>> registered = store.register_many(
+        ...   [instances[0],
+        ...    Registration(instances[1], map_kwargs={'y': 3})],
+        ...   map_kwargs={'y': 2}
+        ... )
+        >>>
+        >>> registered == [
+        ...   (instances[0], {'x': 1, 'y': 2}),
+        ...   (instances[1], {'x': 1, 'y': 3})
+        ... ]
+        True
+        >>> store._store == registered
+        True
+        >>> Store.get_register_map.call_count
+        1
+        >>> Store.get_register_map_kwargs.call_count
+        1
+
+        With a router, using the ``index`` argument :
+
+        >>> from django_crucrudile.routers import Router
+        >>>
+        >>> router = Router()
+        >>> entities = [Mock(index=False), Mock(index=False)]
+        >>>
+        >>> router.register_many(
+        ...   [entities[0], Registration(entities[1], index=True)]
+        ... ) == entities
+        True
+        >>> router.redirect is entities[1]
+        True
+
+        Tuples are registered as entities :
+
+        >>> store = EntityStore()
+        >>> store.register_many([('entity', {'index': True})])
+        [('entity', {'index': True})]
+
+        """
+        self.register_lazy_base_store()
+        # hold the lock during the whole batch, as the batch mapping
+        # is stored on the instance
+        with self._lock:
+            return self._register_many(entities, map_kwargs)
+
+    def _register_many(self, entities, map_kwargs):
+        """Implementation of :func:`register_many` (called while holding
+        the entity store lock)."""
+        previous_batch = self._register_batch
+        register_map = self.get_register_map()
+        self._register_batch = (
+            register_map,
+            self.get_register_map_kwargs() if register_map else None
+        )
+        try:
+            registered = []
+            for entity in entities:
+                if isinstance(entity, Registration):
+                    register_kwargs = dict(entity.kwargs)
+                    entity = entity.entity
+                else:
+                    register_kwargs = {}
+                if map_kwargs:
+                    register_kwargs['map_kwargs'] = dict(
+                        map_kwargs,
+                        **(register_kwargs.get('map_kwargs') or {})
+                    )
+                registered.append(
+                    self.register(entity, **register_kwargs)
+                )
+        finally:
+            self._register_batch = previous_batch
+        return registered
+
     def get_base_store_kwargs(self):
         """Arguments passed when instantiating entity classes in
         :attr:`_base_store`
@@ -705,7 +1736,8 @@ class EntityStore(metaclass=EntityStoreMetaclass):
 
     def register_base_store(self):
         """Instantiate entity classes in _base_store, using arguments from
-        :func:`get_base_store_kwargs`
+        :func:`get_base_store_kwargs`, and register them using
+        :func:`register_many`
 
         >>> class Store(EntityStore):
         ...   pass
@@ -718,8 +1750,51 @@ class EntityStore(metaclass=EntityStoreMetaclass):
         [None]
 
         """
-        kwargs = self.get_base_store_kwargs()
-        for item in self._base_store:
-            self.register(
-                item(**kwargs),
-            )
+        with self._lock:
+            self._base_store_registered = True
+            if self._base_store:
+                kwargs = self.get_base_store_kwargs()
+                self.register_many(
+                    item(**kwargs) for item in self._base_store
+                )
+            # the base store is registered, the lock is not needed
+            # anymore in register_lazy_base_store
+            self._base_store_ready = True
+
+    def register_lazy_base_store(self):
+        """Register the base store (using :func:`register_base_store`) if
+        it has not been registered yet. This happens when
+        :attr:`lazy_base_store` is ``True``, as the base store is then
+        not registered when the entity store gets instantiated.
+
+        The entities in the base store are registered before any other
+        entity, as when :attr:`lazy_base_store` is ``False``.
+
+        >>> class Store(EntityStore):
+        ...   pass
+        >>>
+        >>> Store.register_class(lambda: 'base entity') is not None
+        True
+        >>>
+        >>> store = Store(lazy_base_store=True)
+        >>> store._store
+        []
+        >>> store.register('entity')
+        'entity'
+        >>> store._store
+        ['base entity', 'entity']
+        >>>
+        >>> store.register_lazy_base_store()
+        >>> store._store
+        ['base entity', 'entity']
+
+        """
+        if getattr(self, '_base_store_ready', True):
+            return
+        with self._lock:
+            # the base store may have been registered by another thread
+            # while we were waiting for the lock (or it is being
+            # registered by this thread, in which case we're called
+            # by register_base_store itself)
+            if not self._base_store_registered:
+                self.register_base_store()
@@ -0,0 +1,1210 @@
+"""This module contains URL resolver classes, that subclass Django's
+:class:`django.core.urlresolvers.RegexURLResolver`, and that are used
+by :class:`django_crucrudile.routers.Router` to group the URL patterns
+of its entities.
+
+ - :class:`RouterResolver` : resolver whose URL patterns are only
+   generated when they are first needed (when resolving an URL that
+   matches the resolver regex, or when reversing an URL using the
+   resolver)
+ - :class:`DispatchResolver` : lazy resolver that only tries the URL
+   patterns that may match the resolved URL (abstract)
+ - :class:`TrieResolver` : dispatch resolver that finds these URL
+   patterns in a trie made from the literal segments at the start of
+   their regexs
+ - :class:`AlternationResolver` : dispatch resolver that finds the
+   first matching URL pattern using a single regex, made of the regexs
+   of the URL patterns (as alternation branches)
+ - :class:`LRUCacheResolver` : resolver that stores the resolved URLs
+   in a size-bounded LRU cache
+ - :class:`UncachedURLPattern` : URL pattern whose URLs are not stored
+   in the cache of :class:`LRUCacheResolver`
+ - :class:`ReverseOnlyURLPattern` : URL pattern that never resolves,
+   used to reverse URLs
+
+It also contains :func:`memoized_reverse_lazy`, a variant of
+:func:`django.core.urlresolvers.reverse_lazy` that only reverses the
+URL once (used for redirect patterns).
+
+"""
+import re
+from collections import OrderedDict
+from operator import itemgetter
+from threading import RLock, local
+from weakref import WeakKeyDictionary
+
+from django.core.urlresolvers import (
+    RegexURLPattern, RegexURLResolver, ResolverMatch, Resolver404,
+    reverse, get_resolver, get_urlconf, get_script_prefix
+)
+from django.utils.functional import lazy
+from django.utils.translation import get_language
+
+
+__all__ = [
+    'RouterResolver', 'DispatchResolver', 'TrieResolver',
+    'AlternationResolver', 'memoized_reverse_lazy', 'get_literal_prefix',
+    'get_static_path', 'is_static_pattern', 'LRUCacheResolver',
+    'UncachedURLPattern', 'ReverseOnlyURLPattern',
+]
+
+
+DEFAULT_REGEX_FLAGS = re.compile('').flags
+"""
+:data DEFAULT_REGEX_FLAGS: Flags of regexs compiled without flags
+"""
+REGEX_SPECIAL_CHARACTERS = '.^$*+?{}[]|()'
+"""
+:data REGEX_SPECIAL_CHARACTERS: Characters that have a special meaning
+                                in regexs (when not escaped)
+"""
+_resolve_state = local()
+"""
+:data _resolve_state: Thread-local state of the URL being resolved by
+                      :class:`LRUCacheResolver` (its ``cache_resolve``
+                      attribute is set to ``False`` by
+                      :class:`UncachedURLPattern` when it matches)
+"""
+
+
+def has_top_level_alternation(regex):
+    """Return ``True`` if the regex contains an alternation (``|``) that
+    is not in a group or in a character class
+
+    :argument regex: Regex
+    :type regex: str
+
+    :returns: Does the regex contain a top-level alternation ?
+    :rtype: bool
+
+    >>> has_top_level_alternation('^a|b$')
+    True
+    >>> has_top_level_alternation('^(a|b)[|]\\|$')
+    False
+
+    """
+    depth = 0
+    escaped = in_class = False
+    for char in regex:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and not depth:
+            return True
+    return False
+
+
+NAMED_GROUP_RE = re.compile(r'(?<!\\)\(\?P<\w+>')
+"""
+:data NAMED_GROUP_RE: Regex matching the start of named groups in
+                      regexs
+"""
+BACKREFERENCE_RE = re.compile(r'\(\?P=|\\[1-9]')
+"""
+:data BACKREFERENCE_RE: Regex matching back-references in regexs
+"""
+
+
+def get_branch_regex(regex):
+    """Return a version of an URL regex that can be used as a branch of a
+    combined regex (see :class:`AlternationResolver`) : without the
+    ``^`` anchor, and with its named groups made non-capturing (so
+    that the branches can use the same group names).
+
+    :argument regex: URL regex
+    :type regex: str
+
+    :returns: Branch regex, or ``None`` if the regex can't be used as a
+              branch (if it's not anchored, or if it contains a
+              top-level alternation or back-references)
+    :rtype: str
+
+    >>> get_branch_regex('^detail/(?P<pk>\\d+)$')
+    'detail/(?:\\\\d+)$'
+    >>> get_branch_regex('detail$') is None
+    True
+    >>> get_branch_regex('^(?P<a>\\w)/(?P=a)$') is None
+    True
+
+    """
+    if (not regex.startswith('^') or
+            has_top_level_alternation(regex) or
+            BACKREFERENCE_RE.search(regex)):
+        return None
+    return NAMED_GROUP_RE.sub('(?:', regex[1:])
+
+
+def get_static_path(regex, prefix=False):
+    """Return the path matched by a static URL regex (a regex that only
+    matches a literal path, without arguments)
+
+    :argument regex: URL regex
+    :type regex: str
+    :argument prefix: If ``True``, the regex is the regex of an URL
+                      resolver, that should match a literal prefix
+                      (without ``$``)
+    :type prefix: bool
+
+    :returns: Path, or ``None`` if the regex is not static
+    :rtype: str
+
+    >>> get_static_path('^list$')
+    'list'
+    >>> get_static_path('^detail/(?P<pk>\\d+)$') is None
+    True
+    >>> get_static_path('^documents/', prefix=True)
+    'documents/'
+    >>> get_static_path('^documents/$', prefix=True) is None
+    True
+
+    """
+    literal, exact = get_literal_prefix(regex + '$' if prefix else regex)
+    return literal if exact else None
+
+
+def is_static_pattern(pattern):
+    """Return ``True`` if the paths matched by ``pattern`` are all in the
+    static matches dictionary of a dispatch resolver it would be added
+    to (see :func:`DispatchResolver.get_static_matches`) : if it is an
+    URL pattern with a static regex, or a loaded dispatch resolver with
+    a static regex, whose URL patterns are static (recursively).
+
+    Lazy resolvers whose URL patterns are not loaded yet are not
+    considered static (as that would load them), nor are objects that
+    are not URL patterns, nor URL patterns whose URLs are not stored in
+    resolve caches (see :class:`UncachedURLPattern`).
+
+    :argument pattern: URL pattern or URL resolver
+    :type pattern: :class:`django.core.urlresolvers.RegexURLPattern`
+
+    :returns: ``True`` if the pattern is static
+    :rtype: bool
+
+    >>> from mock import Mock
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = Mock()
+    >>> is_static_pattern(url('^list$', view))
+    True
+    >>> is_static_pattern(url('^detail/(?P<pk>\\d+)$', view))
+    False
+    >>> is_static_pattern(url('^sub/', include([url('^list$', view)])))
+    False
+    >>>
+    >>> resolver = DispatchResolver('^sub/', lambda: [url('^list$', view)])
+    >>> is_static_pattern(resolver)
+    False
+    >>> resolver.url_patterns
+    [<RegexURLPattern None ^list$>]
+    >>> is_static_pattern(resolver)
+    True
+
+    """
+    regex = getattr(pattern, 'regex', None)
+    if regex is None or regex.flags != DEFAULT_REGEX_FLAGS:
+        return False
+    if isinstance(pattern, DispatchResolver):
+        return (
+            pattern.static_paths and
+            pattern.loaded and
+            get_static_path(regex.pattern, prefix=True) is not None and
+            all(is_static_pattern(sub_pattern)
+                for sub_pattern in pattern.url_patterns)
+        )
+    if isinstance(pattern, RegexURLResolver):
+        return False
+    return (
+        getattr(pattern, 'cache_resolve', True) and
+        get_static_path(regex.pattern) is not None
+    )
+
+
+def get_literal_prefix(regex):
+    """Return the literal prefix of an URL regex (the string that all the
+    matched URLs start with), and whether the regex only matches this
+    prefix.
+
+    The prefix is empty if the regex is not anchored (does not start
+    with ``^``), or if it contains a top-level alternation.
+
+    :argument regex: URL regex
+    :type regex: str
+
+    :returns: Literal prefix, and ``True`` if the regex only matches
+              the prefix
+    :rtype: 2-tuple
+
+    >>> get_literal_prefix('^documents/')
+    ('documents/', False)
+    >>> get_literal_prefix('^list$')
+    ('list', True)
+    >>> get_literal_prefix('^detail/(?P<pk>\\d+)$')
+    ('detail/', False)
+    >>> get_literal_prefix('^file\\.json$')
+    ('file.json', True)
+    >>> get_literal_prefix('^lists?$')
+    ('list', False)
+    >>> get_literal_prefix('^a$|^b$')
+    ('', False)
+    >>> get_literal_prefix('list$')
+    ('', False)
+
+    """
+    if not regex.startswith('^') or has_top_level_alternation(regex):
+        return '', False
+    prefix = []
+    index = 1
+    while index < len(regex):
+        char = regex[index]
+        if char == '\\':
+            literal = regex[index + 1:index + 2]
+            if not literal or literal.isalnum() or literal == '_':
+                # character class, anchor or back-reference
+                break
+            step = 2
+        elif char in REGEX_SPECIAL_CHARACTERS:
+            break
+        else:
+            literal, step = char, 1
+        if regex[index + step:index + step + 1] in ('*', '+', '?', '{'):
+            # quantified character
+            break
+        prefix.append(literal)
+        index += step
+    return ''.join(prefix), regex[index:] == '$'
+
+
+def memoized_reverse_lazy(viewname):
+    """Return a lazy object that evaluates to the URL of ``viewname``
+    (as :func:`django.core.urlresolvers.reverse_lazy`), but that only
+    reverses the URL once for each root URL resolver, script prefix
+    and active language (the result is memoized, the language is
+    needed for the URLs of
+    :func:`django.conf.urls.i18n.i18n_patterns`).
+
+    :argument viewname: View name to reverse
+    :type viewname: str
+
+    :returns: Lazy URL
+    :rtype: lazy str
+
+    >>> from types import ModuleType
+    >>> from mock import Mock, patch
+    >>> from django.conf.urls import url
+    >>> from django.core.urlresolvers import set_urlconf
+    >>>
+    >>> urlconf = ModuleType('urlconf')
+    >>> urlconf.urlpatterns = [url('^name$', Mock(), name='name')]
+    >>> set_urlconf(urlconf)
+    >>>
+    >>> lazy_url = memoized_reverse_lazy('name')
+    >>> str(lazy_url)
+    '/name'
+    >>>
+    >>> with patch('django_crucrudile.resolvers.reverse') as mock_reverse:
+    ...   str(lazy_url)
+    ...   mock_reverse.called
+    '/name'
+    False
+    >>> with patch('django_crucrudile.resolvers.get_language',
+    ...            return_value='other-language'):
+    ...   with patch('django_crucrudile.resolvers.reverse',
+    ...              return_value='/other-language/name') as mock_reverse:
+    ...     str(lazy_url)
+    ...     mock_reverse.called
+    '/other-language/name'
+    True
+    >>> set_urlconf(None)
+
+    """
+    results = WeakKeyDictionary()
+
+    def _reverse():
+        """Reverse ``viewname``, if it was not already reversed for the
+        current root URL resolver, script prefix and language."""
+        resolver = get_resolver(get_urlconf())
+        key = (get_script_prefix(), get_language())
+        try:
+            return results[resolver][key]
+        except KeyError:
+            url = reverse(viewname)
+            results.setdefault(resolver, {})[key] = url
+            return url
+
+    return lazy(_reverse, str)()
+
+
+class RouterResolver(RegexURLResolver):
+    """URL resolver whose URL patterns are obtained, on first access,
+    from a function passed to :func:`__init__` (instead of a list of
+    URL patterns, or a module name).
+
+    This allows to delay the generation of the URL patterns of a
+    router until an URL matching the router regex is resolved, or
+    until an URL is reversed using this resolver.
+
+    .. note::
+
+       When reversing an URL, Django populates the reverse mapping of
+       the root resolver, which needs the URL patterns of all the
+       resolvers that do not have a namespace (the resolvers that have
+       a namespace are only loaded when reversing an URL in their
+       namespace). Use namespaces in routers to keep their patterns
+       lazy when reversing URLs.
+
+    .. inheritance-diagram:: RouterResolver
+
+    >>> from mock import Mock
+    >>> from django.conf.urls import url
+    >>>
+    >>> get_url_patterns = Mock(
+    ...   return_value=[url('^name$', Mock(), name='name')]
+    ... )
+    >>>
+    >>> resolver = RouterResolver('^prefix/', get_url_patterns,
+    ...                           namespace='ns', app_name='ns')
+    >>> resolver
+    <RouterResolver <lazy> (ns:ns) ^prefix/>
+    >>> get_url_patterns.called
+    False
+
+    The URL patterns are generated when resolving an URL that matches
+    the resolver regex :
+
+    >>> resolver.resolve('other/name')
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.Resolver404: {'path': 'other/name'}
+    >>> get_url_patterns.called
+    False
+    >>>
+    >>> resolver.resolve('prefix/name').view_name
+    'ns:name'
+    >>> resolver
+    <RouterResolver <RegexURLPattern list> (ns:ns) ^prefix/>
+    >>> resolver.url_patterns
+    [<RegexURLPattern name ^name$>]
+
+    They are only generated once :
+
+    >>> resolver.resolve('prefix/name').namespaces
+    ['ns']
+    >>> get_url_patterns.call_count
+    1
+
+    """
+    def __init__(self, regex, get_url_patterns,
+                 default_kwargs=None, app_name=None, namespace=None):
+        """Initialize resolver
+
+        :argument regex: Resolver regex
+        :type regex: str
+        :argument get_url_patterns: Function returning the URL patterns
+                                    of this resolver (called on first
+                                    access)
+        :type get_url_patterns: callable
+        :argument default_kwargs: See
+                                  :class:`django.core.urlresolvers.RegexURLResolver`
+        :type default_kwargs: dict
+        :argument app_name: See
+                            :class:`django.core.urlresolvers.RegexURLResolver`
+        :type app_name: str
+        :argument namespace: See
+                             :class:`django.core.urlresolvers.RegexURLResolver`
+        :type namespace: str
+        """
+        super().__init__(
+            regex, None,
+            default_kwargs=default_kwargs,
+            app_name=app_name,
+            namespace=namespace
+        )
+        self.get_url_patterns = get_url_patterns
+        self._url_patterns = None
+        self._url_patterns_lock = RLock()
+
+    def __repr__(self):
+        """Represent the resolver, using ``<lazy>`` as URL conf
+        representation if the URL patterns are not generated yet"""
+        if self._url_patterns is None:
+            return '<{} <lazy> ({}:{}) {}>'.format(
+                self.__class__.__name__, self.app_name,
+                self.namespace, self.regex.pattern
+            )
+        return super().__repr__()
+
+    @property
+    def loaded(self):
+        """Return ``True`` if the URL patterns are generated
+
+        :returns: Are the URL patterns generated ?
+        :rtype: bool
+        """
+        return self._url_patterns is not None
+
+    @property
+    def urlconf_module(self):
+        """Return the URL patterns, generating them (using the function
+        given to :func:`__init__`) on first access
+
+        :returns: URL patterns
+        :rtype: list
+        """
+        if self._url_patterns is None:
+            with self._url_patterns_lock:
+                if self._url_patterns is None:
+                    url_patterns = list(self.get_url_patterns())
+                    # used by RegexURLResolver.__repr__
+                    self.urlconf_name = url_patterns
+                    self._url_patterns = url_patterns
+        return self._url_patterns
+
+
+class DispatchResolver(RouterResolver):
+    """Lazy URL resolver (see :class:`RouterResolver`) that, when
+    resolving an URL, only tries the URL patterns returned by
+    :func:`get_candidate_patterns` (instead of trying all its URL
+    patterns, in order).
+
+    Subclasses should implement :func:`get_candidate_patterns`, that
+    should return the URL patterns that may match the URL, in the same
+    order as in :attr:`url_patterns` (so that the first matching URL
+    pattern is used, as with
+    :class:`django.core.urlresolvers.RegexURLResolver`). The base
+    implementation returns all the URL patterns.
+
+    URLs matching a static URL pattern (an URL pattern without
+    arguments, see :func:`get_static_path`) are resolved using a
+    dictionary (see :func:`get_static_matches`), without matching
+    regexs.
+
+    .. note::
+
+       Routers yield dispatch resolvers when their
+       :attr:`django_crucrudile.routers.Router.resolver_class` is set
+       to a subclass of this class, or, by default, when all their
+       patterns are static (see :func:`is_static_pattern`). The static
+       matches dictionary is built by :func:`populate`, called when
+       the router patterns are built (unless they are lazy), and by
+       :func:`django_crucrudile.routers.Router.warmup`.
+
+    .. note::
+
+       The ``tried`` list of the :class:`django.core.urlresolvers.Resolver404`
+       exceptions (shown in the debug 404 page) only contains the URL
+       patterns that were tried.
+
+    .. inheritance-diagram:: DispatchResolver
+
+    >>> from mock import Mock
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = Mock()
+    >>> url_patterns = [
+    ...   url('^list$', view, {'extra': 1}, name='list'),
+    ...   url('^detail/(?P<slug>[\\w-]+)$', view, name='detail'),
+    ...   url('^detail/new$', view, name='new'),
+    ... ]
+    >>> child = DispatchResolver('^sub/', lambda: url_patterns,
+    ...                          namespace='sub', app_name='sub')
+    >>> resolver = DispatchResolver('^', lambda: [child])
+    >>>
+    >>> sorted(resolver.get_static_matches())
+    ['sub/list']
+    >>> match = resolver.resolve('sub/list')
+    >>> match.view_name, match.kwargs
+    ('sub:list', {'extra': 1})
+    >>> match.func is view
+    True
+    >>>
+    >>> resolver.resolve('sub/detail/new').url_name
+    'detail'
+
+    """
+    static_paths = True
+    """
+    :attribute static_paths: Resolve the URLs matching static URL
+                             patterns using a dictionary (see
+                             :func:`get_static_matches`)
+    :type static_paths: bool
+    """
+    def __init__(self, *args, **kwargs):
+        """Initialize resolver (see :func:`RouterResolver.__init__`), and
+        the static matches dictionary (by language)
+        """
+        super().__init__(*args, **kwargs)
+        self._static_matches = {}
+
+    def populate(self):
+        """Build the data structures used when resolving URLs for the
+        active language (if needed), so that it doesn't happen when
+        resolving the first URL (see
+        :func:`django_crucrudile.routers.Router.warmup`)
+
+        The base implementation builds the static matches dictionary
+        (see :func:`get_static_matches`).
+        """
+        if self.static_paths:
+            self.get_static_matches()
+
+    def get_static_matches(self):
+        """Return the static matches dictionary for the active language
+        (building it if needed).
+
+        This dictionary contains, for the path of each static URL
+        pattern (see :func:`get_static_path`), the data used to build
+        the resolver match (callback, arguments, keyword arguments, URL
+        name, application name and namespaces). It also contains the
+        static matches of the dispatch resolvers in the URL patterns
+        (if their regex is static), prefixed with their regex, so that
+        an URL matching a static URL pattern is resolved with one
+        dictionary lookup.
+
+        A path is not added if an URL pattern before the static URL
+        pattern may match it (so that the first matching URL pattern is
+        used, as with
+        :class:`django.core.urlresolvers.RegexURLResolver`).
+
+        :returns: Static matches dictionary
+        :rtype: dict
+        """
+        language_code = get_language()
+        static_matches = self._static_matches.get(language_code)
+        if static_matches is None:
+            static_matches = {}
+            previous_patterns = []
+            for pattern in self.url_patterns:
+                for path, static_match in self._get_static_matches(pattern):
+                    if not any(previous_pattern.regex.search(path)
+                               for previous_pattern in previous_patterns):
+                        static_matches[path] = static_match
+                previous_patterns.append(pattern)
+            self._static_matches[language_code] = static_matches
+        return static_matches
+
+    @staticmethod
+    def _get_static_matches(pattern):
+        """Yield the static paths of ``pattern``, with the data used to
+        build their resolver match."""
+        regex = pattern.regex
+        if regex.flags != DEFAULT_REGEX_FLAGS:
+            return
+        if isinstance(pattern, DispatchResolver):
+            prefix = get_static_path(regex.pattern, prefix=True)
+            if prefix is None or not pattern.static_paths:
+                return
+            for path, static_match in pattern.get_static_matches().items():
+                callback, args, kwargs, url_name, app_name, namespaces = (
+                    static_match
+                )
+                yield prefix + path, (
+                    callback,
+                    args,
+                    dict(pattern.default_kwargs, **kwargs),
+                    url_name,
+                    pattern.app_name or app_name,
+                    [pattern.namespace] + namespaces
+                )
+        elif not isinstance(pattern, (RegexURLResolver,
+                                      UncachedURLPattern)):
+            path = get_static_path(regex.pattern)
+            if path is not None:
+                yield path, (
+                    pattern.callback, (), pattern.default_args,
+                    pattern.name, None, []
+                )
+
+    def get_candidate_patterns(self, path):
+        """Return the URL patterns that may match ``path``
+
+        :argument path: URL path (without the part matched by the
+                        resolver regex)
+        :type path: str
+
+        :returns: URL patterns
+        :rtype: iterable
+        """
+        return self.url_patterns
+
+    def resolve(self, path):
+        """Resolve ``path`` (as
+        :func:`django.core.urlresolvers.RegexURLResolver.resolve`), only
+        trying the URL patterns returned by
+        :func:`get_candidate_patterns`
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: Resolver match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        :raise Resolver404: If no URL pattern matches ``path``
+        """
+        match = self.regex.search(path)
+        if not match:
+            raise Resolver404({'path': path})
+        new_path = path[match.end():]
+        if self.static_paths:
+            static_match = self.get_static_matches().get(new_path)
+            if static_match is not None:
+                callback, args, sub_kwargs, url_name, app_name, namespaces = (
+                    static_match
+                )
+                kwargs = dict(match.groupdict(), **self.default_kwargs)
+                kwargs.update(sub_kwargs)
+                return ResolverMatch(
+                    callback, args, kwargs, url_name,
+                    self.app_name or app_name,
+                    [self.namespace] + namespaces
+                )
+        tried = []
+        for pattern in self.get_candidate_patterns(new_path):
+            try:
+                sub_match = pattern.resolve(new_path)
+            except Resolver404 as exc:
+                sub_tried = exc.args[0].get('tried')
+                if sub_tried is not None:
+                    tried.extend([pattern] + t for t in sub_tried)
+                else:
+                    tried.append([pattern])
+            else:
+                if sub_match:
+                    kwargs = dict(match.groupdict(), **self.default_kwargs)
+                    kwargs.update(sub_match.kwargs)
+                    return ResolverMatch(
+                        sub_match.func,
+                        sub_match.args,
+                        kwargs,
+                        sub_match.url_name,
+                        self.app_name or sub_match.app_name,
+                        [self.namespace] + sub_match.namespaces
+                    )
+                tried.append([pattern])
+        raise Resolver404({'tried': tried, 'path': new_path})
+
+
+class SegmentTrie:
+    """Trie of URL patterns, indexed by the complete segments (ending
+    with ``/``) of the literal prefix of their regexs (see
+    :func:`get_literal_prefix`).
+
+    Each URL pattern is stored in the node of its last complete
+    segment, with its position (in the URL patterns list) and the rest
+    of its literal prefix.
+
+    .. inheritance-diagram:: SegmentTrie
+
+    >>> trie = SegmentTrie()
+    >>> trie.add('documents/list', 0, 'list')
+    >>> trie.add('documents/detail/', 1, 'detail')
+    >>> trie.add('', 2, 'catch-all')
+    >>> trie.add('entities/', 3, 'entities')
+    >>>
+    >>> trie.get('documents/list')
+    ['list', 'catch-all']
+    >>> trie.get('documents/detail/42')
+    ['detail', 'catch-all']
+    >>> trie.get('entities/list')
+    ['catch-all', 'entities']
+
+    """
+    __slots__ = ('children', 'items')
+
+    def __init__(self):
+        """Initialize trie node"""
+        self.children = {}
+        self.items = []
+
+    def add(self, prefix, position, item):
+        """Add an item to the trie
+
+        :argument prefix: Literal prefix
+        :type prefix: str
+        :argument position: Item position (the items returned by
+                            :func:`get` are sorted by position)
+        :type position: int
+        :argument item: Item
+        """
+        node = self
+        *segments, rest = prefix.split('/')
+        for segment in segments:
+            node = node.children.setdefault(segment, SegmentTrie())
+        node.items.append((position, rest, item))
+
+    def get(self, path):
+        """Return the items whose literal prefix is a prefix of ``path``,
+        sorted by position
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: Items
+        :rtype: list
+        """
+        found = []
+        node, start = self, 0
+        while True:
+            found.extend(
+                (position, item)
+                for position, rest, item in node.items
+                if path.startswith(rest, start)
+            )
+            end = path.find('/', start)
+            if end == -1:
+                break
+            node = node.children.get(path[start:end])
+            if node is None:
+                break
+            start = end + 1
+        found.sort(key=itemgetter(0))
+        return [item for _, item in found]
+
+
+class TrieResolver(DispatchResolver):
+    """Dispatch resolver (see :class:`DispatchResolver`) that finds the URL
+    patterns that may match an URL using a trie
+    (:class:`SegmentTrie`) made from the literal prefixes of their
+    regexs (for crucrudile URL patterns, the router URL parts, model
+    URL parts and action names). Only the regexs of these URL patterns
+    (that contain the URL arguments) are then tried, so that the
+    resolve time doesn't depend much on the number of URL patterns.
+
+    The trie is built on first access, for each language (as the URL
+    regexs may be translated).
+
+    URL patterns whose regex is case-insensitive or verbose are always
+    tried.
+
+    .. inheritance-diagram:: TrieResolver
+
+    >>> from mock import Mock
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = Mock()
+    >>> url_patterns = [
+    ...   url('^list$', view, name='list'),
+    ...   url('^detail/(?P<pk>\\d+)$', view, name='detail'),
+    ...   url('^(?P<slug>[\\w-]+)$', view, name='slug'),
+    ...   url('^sub/', include([url('^list$', view, name='list')],
+    ...                        namespace='sub', app_name='sub')),
+    ... ]
+    >>>
+    >>> resolver = TrieResolver('^', lambda: url_patterns)
+    >>> resolver.get_candidate_patterns('detail/42')
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [<RegexURLPattern detail ^detail/(?P<pk>\d+)$>,
+     <RegexURLPattern slug ^(?P<slug>[\w-]+)$>]
+    >>> resolver.get_candidate_patterns('sub/list')
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [<RegexURLPattern slug ^(?P<slug>[\w-]+)$>,
+     <RegexURLResolver <RegexURLPattern list> (sub:sub) ^sub/>]
+    >>>
+    >>> resolver.resolve('detail/42').kwargs
+    {'pk': '42'}
+    >>> resolver.resolve('list').url_name
+    'list'
+    >>> resolver.resolve('sub/list').view_name
+    'sub:list'
+
+    """
+    def __init__(self, *args, **kwargs):
+        """Initialize resolver (see :func:`RouterResolver.__init__`), and
+        the tries dictionary (by language)
+        """
+        super().__init__(*args, **kwargs)
+        self._tries = {}
+
+    def get_trie(self):
+        """Return the trie of the URL patterns, for the active language
+        (building it if needed)
+
+        :returns: URL patterns trie
+        :rtype: :class:`SegmentTrie`
+        """
+        language_code = get_language()
+        trie = self._tries.get(language_code)
+        if trie is None:
+            trie = SegmentTrie()
+            for position, pattern in enumerate(self.url_patterns):
+                regex = pattern.regex
+                if regex.flags & (re.IGNORECASE | re.VERBOSE):
+                    prefix = ''
+                else:
+                    prefix, _ = get_literal_prefix(regex.pattern)
+                trie.add(prefix, position, pattern)
+            self._tries[language_code] = trie
+        return trie
+
+    def populate(self):
+        """Build the trie for the active language (see
+        :func:`DispatchResolver.populate`)"""
+        super().populate()
+        self.get_trie()
+
+    def get_candidate_patterns(self, path):
+        """Return the URL patterns whose literal prefix is a prefix of
+        ``path`` (see :func:`DispatchResolver.get_candidate_patterns`)
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: URL patterns
+        :rtype: list
+        """
+        return self.get_trie().get(path)
+
+
+class AlternationResolver(DispatchResolver):
+    """Dispatch resolver (see :class:`DispatchResolver`) that finds the
+    first URL pattern matching an URL using a single regex, made of
+    the regexs of consecutive URL patterns as named alternation
+    branches (see :func:`get_branch_regex`). The name of the matching
+    branch gives the URL pattern to use. This replaces one regex match
+    for each URL pattern by a single match in the regex engine.
+
+    The combined regexs are compiled on first access, for each
+    language (as the URL regexs may be translated).
+
+    URL patterns whose regex can't be used as a branch (see
+    :func:`get_branch_regex`), or uses flags, are tried separately. If
+    the matching URL pattern is a resolver that fails to resolve the
+    rest of the URL, the next URL patterns are tried in order.
+
+    .. inheritance-diagram:: AlternationResolver
+
+    >>> from mock import Mock
+    >>> from django.conf.urls import url, include
+    >>>
+    >>> view = Mock()
+    >>> url_patterns = [
+    ...   url('^list$', view, name='list'),
+    ...   url('^detail/(?P<pk>\\d+)$', view, name='detail'),
+    ...   url('^sub/', include([url('^list$', view, name='list')],
+    ...                        namespace='sub', app_name='sub')),
+    ...   url('(?i)^upper$', view, name='upper'),
+    ...   url('^(?P<pk>\\d+)/(?P<slug>[\\w-]+)$', view, name='slug'),
+    ... ]
+    >>>
+    >>> resolver = AlternationResolver('^', lambda: url_patterns)
+    >>> [(regex.pattern if regex else None, len(patterns))
+    ...  for regex, patterns in resolver.get_branches()]
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('(?P<_0>list$)|(?P<_1>detail/(?:\\\\d+)$)|(?P<_2>sub/)', 3),
+     (None, 1),
+     ('(?P<_0>(?:\\\\d+)/(?:[\\\\w-]+)$)', 1)]
+    >>>
+    >>> next(resolver.get_candidate_patterns('detail/42'))
+    <RegexURLPattern detail ^detail/(?P<pk>\d+)$>
+    >>> resolver.resolve('detail/42').kwargs
+    {'pk': '42'}
+    >>> resolver.resolve('UPPER').url_name
+    'upper'
+    >>> resolver.resolve('42/slug').kwargs == {'pk': '42', 'slug': 'slug'}
+    True
+    >>> resolver.resolve('sub/list').view_name
+    'sub:list'
+    >>> resolver.resolve('sub/other')
+    ... # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    django.core.urlresolvers.Resolver404: {'tried': [[<RegexURLResolver
+    <RegexURLPattern list> (sub:sub) ^sub/>, <RegexURLPattern list
+    ^list$>], [<RegexURLPattern upper (?i)^upper$>]], 'path': 'sub/other'}
+
+    """
+    def __init__(self, *args, **kwargs):
+        """Initialize resolver (see :func:`RouterResolver.__init__`), and
+        the branches dictionary (by language)
+        """
+        super().__init__(*args, **kwargs)
+        self._branches = {}
+
+    def get_branches(self):
+        """Return the combined regexs of the URL patterns, for the active
+        language (compiling them if needed)
+
+        :returns: Combined regexs (or ``None`` for URL patterns that are
+                  tried separately), with the URL patterns of their
+                  branches
+        :rtype: list of 2-tuples
+        """
+        language_code = get_language()
+        branches = self._branches.get(language_code)
+        if branches is None:
+            branches = []
+            branch_regexs, branch_patterns = [], []
+
+            def add_combined_regex():
+                branches.append((
+                    re.compile('|'.join(branch_regexs)),
+                    branch_patterns
+                ))
+
+            for pattern in self.url_patterns:
+                regex = pattern.regex
+                branch_regex = (
+                    get_branch_regex(regex.pattern)
+                    if regex.flags == DEFAULT_REGEX_FLAGS else None
+                )
+                if branch_regex is None:
+                    if branch_patterns:
+                        add_combined_regex()
+                        branch_regexs, branch_patterns = [], []
+                    branches.append((None, [pattern]))
+                else:
+                    branch_regexs.append('(?P<_{}>{})'.format(
+                        len(branch_patterns), branch_regex
+                    ))
+                    branch_patterns.append(pattern)
+            if branch_patterns:
+                add_combined_regex()
+            self._branches[language_code] = branches
+        return branches
+
+    def populate(self):
+        """Compile the combined regexs for the active language (see
+        :func:`DispatchResolver.populate`)"""
+        super().populate()
+        self.get_branches()
+
+    def get_candidate_patterns(self, path):
+        """Yield the URL pattern of the first matching branch of each
+        combined regex (and the URL patterns that are tried separately).
+        If more URL patterns are needed (the matching URL pattern
+        failed to resolve ``path``), the URL patterns following it are
+        yielded (see :func:`DispatchResolver.get_candidate_patterns`).
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: URL patterns
+        :rtype: iterable
+        """
+        for combined_regex, patterns in self.get_branches():
+            if combined_regex is None:
+                yield from patterns
+                continue
+            match = combined_regex.match(path)
+            if match:
+                position = int(match.lastgroup[1:])
+                yield patterns[position]
+                # the matching URL pattern failed to resolve the path
+                yield from patterns[position + 1:]
+
+
+class LRUCacheResolver(RegexURLResolver):
+    """URL resolver that stores the resolved URLs (callback, arguments,
+    URL name and namespaces) in a least recently used cache, bounded to
+    :attr:`maxsize` entries. Use it to wrap the root URL patterns (the
+    patterns of the root router), when most requests use a small set
+    of URLs : ::
+
+      urlpatterns = [
+          LRUCacheResolver(router.patterns(), maxsize=512)
+      ]
+
+    The URLs resolved by an :class:`UncachedURLPattern` are not stored
+    (see :attr:`django_crucrudile.routes.base.BaseRoute.cache_resolve`),
+    nor are the URLs that could not be resolved. This is checked when
+    resolving, so the URL patterns of lazy resolvers (see
+    :class:`RouterResolver`) are still only loaded when needed.
+
+    Use :func:`cache_info` to get the cache statistics.
+
+    .. warning::
+
+       The cache is not invalidated when the wrapped URL patterns
+       change (use :func:`cache_clear`).
+
+    .. inheritance-diagram:: LRUCacheResolver
+
+    >>> from mock import Mock
+    >>> from django.conf.urls import url
+    >>>
+    >>> view = Mock()
+    >>> resolver = LRUCacheResolver([
+    ...   url('^(?P<pk>\\d+)$', view, name='detail'),
+    ...   UncachedURLPattern('^uncached$', view),
+    ... ], maxsize=2)
+    >>>
+    >>> resolver.resolve('1').kwargs
+    {'pk': '1'}
+    >>> resolver.resolve('1').kwargs
+    {'pk': '1'}
+    >>> resolver.resolve('uncached').func is view
+    True
+    >>> _ = resolver.resolve('2'), resolver.resolve('3')
+    >>>
+    >>> sorted(resolver.cache_info().items())
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [('currsize', 2), ('evictions', 1), ('hits', 1),
+     ('maxsize', 2), ('misses', 4)]
+
+    """
+    maxsize = 1024
+    """
+    :attribute maxsize: Maximum number of cached URLs
+    :type maxsize: int
+    """
+    def __init__(self, url_patterns, maxsize=None):
+        """Initialize resolver
+
+        :argument url_patterns: URL patterns to wrap
+        :type url_patterns: iterable
+        :argument maxsize: Optional. See :attr:`maxsize`
+        :type maxsize: int
+        """
+        super().__init__('^', list(url_patterns))
+        if maxsize is not None:
+            self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._cache_lock = RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    def resolve(self, path):
+        """Resolve ``path``, using the cache if possible (see
+        :func:`django.core.urlresolvers.RegexURLResolver.resolve`)
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: Resolver match
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+
+        :raise Resolver404: If no URL pattern matches ``path``
+        """
+        key = (get_language(), path)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if cached is not None:
+            callback, args, kwargs, url_name, app_name, namespaces = cached
+            return ResolverMatch(
+                callback, args, dict(kwargs),
+                url_name, app_name, list(namespaces)
+            )
+
+        _resolve_state.cache_resolve = True
+        match = super().resolve(path)
+        if _resolve_state.cache_resolve:
+            with self._cache_lock:
+                self._cache[key] = (
+                    match.func, match.args, dict(match.kwargs),
+                    match.url_name, match.app_name, tuple(match.namespaces)
+                )
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+        return match
+
+    def cache_info(self):
+        """Return the cache statistics
+
+        :returns: Number of hits, misses and evictions, maximum and
+                  current size
+        :rtype: dict
+        """
+        with self._cache_lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'maxsize': self.maxsize,
+                'currsize': len(self._cache),
+            }
+
+    def cache_clear(self):
+        """Clear the cache, and its statistics"""
+        with self._cache_lock:
+            self._cache.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class UncachedURLPattern(RegexURLPattern):
+    """URL pattern whose URLs are not stored in the cache of
+    :class:`LRUCacheResolver` (used for the routes whose
+    :attr:`django_crucrudile.routes.base.BaseRoute.cache_resolve`
+    attribute is ``False``, see
+    :func:`django_crucrudile.table.RouteRecord.to_pattern`).
+
+    The pattern is not added to the static matches dictionaries of
+    dispatch resolvers (see :func:`DispatchResolver.get_static_matches`),
+    so that its :func:`resolve` method is called.
+
+    .. inheritance-diagram:: UncachedURLPattern
+
+    >>> from mock import Mock
+    >>>
+    >>> pattern = UncachedURLPattern('^list$', Mock(), name='list')
+    >>> pattern.cache_resolve
+    False
+    >>> pattern.resolve('list').url_name
+    'list'
+
+    """
+    cache_resolve = False
+    """
+    :attribute cache_resolve: Store the URLs resolved by this pattern
+                              in resolve caches
+    :type cache_resolve: bool
+    """
+    def resolve(self, path):
+        """Resolve ``path`` (see
+        :func:`django.core.urlresolvers.RegexURLPattern.resolve`), marking
+        the resolved URL as not to be cached
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: Resolver match, or ``None``
+        :rtype: :class:`django.core.urlresolvers.ResolverMatch`
+        """
+        match = super().resolve(path)
+        if match is not None:
+            _resolve_state.cache_resolve = False
+        return match
+
+
+class ReverseOnlyURLPattern(RegexURLPattern):
+    """URL pattern that is only used to reverse URLs (with Django's
+    :func:`django.core.urlresolvers.reverse`) : it never resolves an
+    URL. Used to reverse the URLs of URL patterns that Django can't
+    reverse (see
+    :func:`django_crucrudile.routes.mixins.model.generic.GenericViewArgsMixin.make_patterns`).
+
+    .. inheritance-diagram:: ReverseOnlyURLPattern
+
+    >>> from mock import Mock
+    >>> from django.core.urlresolvers import RegexURLResolver
+    >>>
+    >>> pattern = ReverseOnlyURLPattern('^(?P<pk>\\d+)$', Mock(),
+    ...                                 name='detail')
+    >>> pattern.resolve('1') is None
+    True
+    >>> RegexURLResolver('^', [pattern]).reverse('detail', pk=1)
+    '1'
+
+    """
+    def resolve(self, path):
+        """Don't resolve ``path``
+
+        :argument path: URL path
+        :type path: str
+
+        :returns: ``None``
+        :rtype: NoneType
+        """
+        return None
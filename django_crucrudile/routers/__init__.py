@@ -24,8 +24,16 @@ and two implementations adapted to Django models :
    default Django generic views.
 
 """
+from functools import partial
+
 from django.conf.urls import url, include
-from django.core.urlresolvers import reverse_lazy
+from django.core.urlresolvers import (
+    RegexURLResolver, NoReverseMatch, get_resolver, get_urlconf, set_urlconf,
+    get_script_prefix, reverse
+)
+from django.utils.encoding import iri_to_uri
+from django.utils.http import urlquote
+from django.utils.translation import get_language
 
 from django.db.models import Model
 from django.views.generic.detail import SingleObjectMixin
@@ -38,6 +46,11 @@ from django.views.generic import (
 from django_crucrudile.routes import ViewRoute, ModelViewRoute
 from django_crucrudile.entities import Entity
 from django_crucrudile.entities.store import EntityStore
+from django_crucrudile.resolvers import (
+    RouterResolver, DispatchResolver, TrieResolver, memoized_reverse_lazy,
+    get_static_path, is_static_pattern
+)
+from django_crucrudile.table import RouteRecord, RouteTable, ReverseTable
 
 
 __all__ = [
@@ -124,9 +137,32 @@ class Router(EntityStore, Entity):
     redirect_max_depth = 100
     """
     :attribute redirect_max_depth: Max depth when following redirect
-                                   attributes
+                                   attributes (cycles are detected
+                                   before, this only stops infinite
+                                   chains of distinct objects)
     :type redirect_max_depth: int
     """
+    patterns_attributes = (
+        'namespace',
+        'url_part',
+        'add_redirect',
+        'add_redirect_silent',
+        'get_redirect_silent',
+        'redirect_max_depth',
+        'lazy_patterns',
+        'resolver_class',
+    )
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
+    """
+    redirect_attributes = ('redirect', 'namespace')
+    """
+    :attribute redirect_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.redirect_attributes`
+    :type redirect_attributes: tuple of str
+    """
     generic = False
     """
     :attribute generic: If True, :func:`get_register_map` will return
@@ -135,6 +171,63 @@ class Router(EntityStore, Entity):
                         ``Model`` type.
     :type generic: bool
     """
+    lazy_patterns = False
+    """
+    :attribute lazy_patterns: If True, :func:`patterns` yields a
+                              :class:`django_crucrudile.resolvers.RouterResolver`,
+                              whose URL patterns (the patterns of the
+                              routed entities) are only generated
+                              when first needed (when resolving an
+                              URL matching the router URL part, or
+                              when reversing an URL in the router
+                              namespace). The routers created by the
+                              register mappings also use this
+                              attribute (see :func:`get_router_kwargs`).
+    :type lazy_patterns: bool
+    """
+    resolver_class = None
+    """
+    :attribute resolver_class: If defined, :func:`patterns` yields a
+                               resolver of this class (a subclass of
+                               :class:`django_crucrudile.resolvers.RouterResolver`,
+                               for example
+                               :class:`django_crucrudile.resolvers.TrieResolver`).
+                               The routers created by the register
+                               mappings also use this attribute (see
+                               :func:`get_router_kwargs`). If not
+                               defined, the patterns are yielded in
+                               a
+                               :class:`django_crucrudile.resolvers.DispatchResolver`
+                               if they are all static (resolved with
+                               its static matches dictionary, see
+                               :func:`django_crucrudile.resolvers.is_static_pattern`),
+                               or else in a
+                               :class:`django.core.urlresolvers.RegexURLResolver`,
+                               that tries them in order.
+    :type resolver_class: subclass of
+                          :class:`django_crucrudile.resolvers.RouterResolver`
+    """
+    max_argument_combinations = None
+    """
+    :attribute max_argument_combinations: If defined, maximum number of
+                                          argument combinations of
+                                          each route registered in
+                                          this router, or in the
+                                          nested routers that don't
+                                          define their own budget
+                                          (for routes that don't
+                                          define their own budget, see
+                                          :attr:`django_crucrudile.routes.mixins.arguments.ArgumentsMixin.max_argument_combinations`).
+                                          Checked when the route (or
+                                          a router containing it)
+                                          gets registered (see
+                                          :func:`add_to_store`). The
+                                          routers created by the
+                                          register mappings also use
+                                          this attribute (see
+                                          :func:`get_router_kwargs`).
+    :type max_argument_combinations: int
+    """
     def __init__(self,
                  namespace=None,
                  url_part=None,
@@ -143,6 +236,9 @@ class Router(EntityStore, Entity):
                  add_redirect_silent=None,
                  get_redirect_silent=None,
                  generic=None,
+                 lazy_patterns=None,
+                 resolver_class=None,
+                 max_argument_combinations=None,
                  **kwargs):  # pragma: no cover
         """Initialize Router base attributes from given arguments
 
@@ -155,6 +251,14 @@ class Router(EntityStore, Entity):
         :argument get_redirect_silent: Optional. See
                                        :attr:`get_redirect_silent`
         :argument generic: Optional. See :attr:`generic`
+        :argument lazy_patterns: Optional. See :attr:`lazy_patterns`
+        :argument resolver_class: Optional. See :attr:`resolver_class`
+        :argument max_argument_combinations: Optional. See
+                                             :attr:`max_argument_combinations`
+
+        Other keyword arguments are passed to the superclass
+        implementation (for example ``lazy_base_store``, see
+        :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`).
 
         """
         # initialize base attributes
@@ -172,6 +276,12 @@ class Router(EntityStore, Entity):
             self.get_redirect_silent = get_redirect_silent
         if generic is not None:
             self.generic = generic
+        if lazy_patterns is not None:
+            self.lazy_patterns = lazy_patterns
+        if resolver_class is not None:
+            self.resolver_class = resolver_class
+        if max_argument_combinations is not None:
+            self.max_argument_combinations = max_argument_combinations
 
         # call superclass implementation of __init__
         super().__init__(**kwargs)
@@ -205,13 +315,58 @@ super implementation)
 
         """
         mapping = super().get_register_map()
-        mapping[Model] = (
+        router_class = (
             ModelRouter if not self.generic else GenericModelRouter
         )
+        router_kwargs = self.get_router_kwargs()
+        mapping[Model] = (
+            partial(router_class, **router_kwargs)
+            if router_kwargs else router_class
+        )
         mapping[SingleObjectMixin, MultipleObjectMixin] = ModelViewRoute
         mapping[View] = ViewRoute
         return mapping
 
+    def get_router_kwargs(self):
+        """Arguments passed when instantiating the routers created by the
+        register mapping (see :func:`get_register_map`), used to
+        propagate the router options that should also apply to these
+        routers.
+
+        The base implementation passes ``lazy_base_store`` (see
+        :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`)
+        and :attr:`lazy_patterns` if they are set to ``True``, and
+        :attr:`resolver_class` and :attr:`max_argument_combinations` if
+        they are defined.
+
+        :returns: Keyword arguments
+        :rtype: dict
+
+        >>> Router().get_router_kwargs()
+        {}
+        >>> Router(lazy_base_store=True).get_router_kwargs()
+        {'lazy_base_store': True}
+        >>> Router(lazy_patterns=True).get_router_kwargs()
+        {'lazy_patterns': True}
+        >>> Router(resolver_class=TrieResolver).get_router_kwargs()
+        {'resolver_class': <class 'django_crucrudile.resolvers.TrieResolver'>}
+        >>> Router(max_argument_combinations=100).get_router_kwargs()
+        {'max_argument_combinations': 100}
+
+        """
+        kwargs = {}
+        if self.lazy_base_store:
+            kwargs['lazy_base_store'] = True
+        if self.lazy_patterns:
+            kwargs['lazy_patterns'] = True
+        if self.resolver_class is not None:
+            kwargs['resolver_class'] = self.resolver_class
+        if self.max_argument_combinations is not None:
+            kwargs['max_argument_combinations'] = (
+                self.max_argument_combinations
+            )
+        return kwargs
+
     def register(self, entity, index=False, map_kwargs=None):
         """Register routed entity, using
         :func:`django_crucrudile.entities.store.EntityStore.register`
@@ -255,15 +410,558 @@ super implementation)
         True
 
         """
-        entity = super().register(
-            entity,
-            map_kwargs=map_kwargs
-        )
-        if index or entity.index:
-            self.redirect = entity
+        self.register_lazy_base_store()
+        with self._lock:
+            entity = super().register(
+                entity,
+                map_kwargs=map_kwargs
+            )
+            if index or entity.index:
+                self.redirect = entity
 
         return entity
 
+    def unregister(self, entity):
+        """Unregister routed entity, using
+        :func:`django_crucrudile.entities.store.EntityStore.unregister`
+
+        Unset :attr:`redirect` if it was ``entity``.
+
+        :argument entity: Entity to unregister (as returned by
+                          :func:`register`)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: The unregistered entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        >>> from mock import Mock
+        >>> router = Router()
+        >>>
+        >>> entity = Mock()
+        >>> entity.index = True
+        >>>
+        >>> router.register(entity) is entity
+        True
+        >>> router.unregister(entity) is entity
+        True
+        >>> router.redirect is None
+        True
+        >>> list(router)
+        []
+
+        """
+        self.register_lazy_base_store()
+        with self._lock:
+            entity = super().unregister(entity)
+            if self.redirect is entity:
+                self.redirect = None
+
+        return entity
+
+    def replace(self, entity, new_entity, index=False, map_kwargs=None):
+        """Replace routed entity, using
+        :func:`django_crucrudile.entities.store.EntityStore.replace`
+
+        Set the new entity as index when ``index`` or
+        ``new_entity.index`` is True, or when the replaced entity was
+        the index.
+
+        :argument entity: Entity to replace (as returned by
+                          :func:`register`)
+        :type entity: :class:`django_crucrudile.entities.Entity`
+        :argument new_entity: Entity to register instead
+        :type new_entity: :class:`django_crucrudile.entities.Entity`
+        :argument index: Register as index (set :attr:`redirect` to
+                         ``new_entity``)
+        :type index: bool
+        :argument map_kwargs: Optional. Keyword arguments to pass to
+                              mapping value if entity gets
+                              transformed.
+        :type map_kwargs: dict
+
+        :returns: The registered entity
+        :rtype: :class:`django_crucrudile.entities.Entity`
+
+        >>> from mock import Mock
+        >>> router = Router()
+        >>>
+        >>> entity = Mock()
+        >>> entity.index = True
+        >>> new_entity = Mock()
+        >>> new_entity.index = False
+        >>>
+        >>> router.register(entity) is entity
+        True
+        >>> router.replace(entity, new_entity) is new_entity
+        True
+        >>> router.redirect is new_entity
+        True
+        >>> list(router) == [new_entity]
+        True
+
+        """
+        self.register_lazy_base_store()
+        with self._lock:
+            was_redirect = self.redirect is entity
+            new_entity = super().replace(
+                entity, new_entity,
+                map_kwargs=map_kwargs
+            )
+            if was_redirect or index or new_entity.index:
+                self.redirect = new_entity
+
+        return new_entity
+
+    def get_argument_combinations_budget(self):
+        """Return the default budget of argument combinations of the routes
+        registered in this router : :attr:`max_argument_combinations`
+        if defined, or else the budget of the routers in which this
+        router is registered (recursively, the lowest budget is used if
+        it is registered in several routers).
+
+        :returns: Budget, or ``None`` if there is no budget
+        :rtype: int
+
+        >>> parent = Router(max_argument_combinations=2)
+        >>> child = Router()
+        >>> child.get_argument_combinations_budget() is None
+        True
+        >>> parent.register(child) is child
+        True
+        >>> child.get_argument_combinations_budget()
+        2
+
+        """
+        budgets = []
+        visited = set()
+        routers = [self]
+        while routers:
+            router = routers.pop()
+            if id(router) in visited:
+                continue
+            visited.add(id(router))
+            budget = getattr(router, 'max_argument_combinations', None)
+            if budget is not None:
+                budgets.append(budget)
+            else:
+                routers.extend(router.__dict__.get('_parents', ()))
+        return min(budgets) if budgets else None
+
+    def check_entity_argument_combinations(self, entity,
+                                           max_combinations=None):
+        """Check the number of argument combinations of an entity that gets
+        registered, if it is a route that builds argument
+        combinations (see
+        :func:`django_crucrudile.routes.mixins.arguments.ArgumentsMixin.check_argument_combinations`),
+        using :attr:`max_argument_combinations` (or ``max_combinations``,
+        if :attr:`max_argument_combinations` is not defined) as default
+        budget.
+
+        If the entity is a router, the routes registered in it (and in
+        the routers registered in it, recursively) are checked, using
+        this budget as default budget of the routers that don't define
+        their own. The routers whose base store is not registered yet
+        (see
+        :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`)
+        check their routes when they get registered (see
+        :func:`get_argument_combinations_budget`).
+
+        :argument entity: Entity to check
+        :type entity: :class:`django_crucrudile.entities.Entity`
+        :argument max_combinations: Default budget (if
+                                    :attr:`max_argument_combinations`
+                                    is not defined)
+        :type max_combinations: int
+
+        :raise ValueError: If the number of argument combinations of
+                           ``entity`` (or of a route registered in it)
+                           exceeds its budget
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router(max_argument_combinations=2)
+        >>> route = CallbackRoute(
+        ...   'name', callback=lambda: None,
+        ...   arguments_spec=[['<arg1.1>', '<arg1.2>', '<arg1.3>']]
+        ... )
+        >>> router.register(route)
+        ... # doctest: +NORMALIZE_WHITESPACE
+        Traceback (most recent call last):
+          ...
+        ValueError: Argument specifications of route 'name'
+        (CallbackRoute) would build 3 argument combinations, more
+        than the budget (2). Reduce the argument choices, use a
+        folding arguments parser (FoldingArgumentsParser) or increase
+        max_argument_combinations.
+        >>> list(router)
+        []
+
+        The budget also applies to the routes of nested routers :
+
+        >>> child = Router()
+        >>> child.register(route) is route
+        True
+        >>> router.register(child)
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: Argument specifications of route 'name' ...
+        >>> list(router)
+        []
+
+        """
+        if self.max_argument_combinations is not None:
+            max_combinations = self.max_argument_combinations
+        if isinstance(entity, Router):
+            for registered in list(entity._store):
+                entity.check_entity_argument_combinations(
+                    registered, max_combinations
+                )
+        else:
+            check = getattr(entity, 'check_argument_combinations', None)
+            if check is not None:
+                check(max_combinations)
+
+    def add_to_store(self, entity):
+        """Check the number of argument combinations of ``entity`` (see
+        :func:`check_entity_argument_combinations`, using the budget
+        returned by :func:`get_argument_combinations_budget`), and add
+        it to the store
+        using
+        :func:`django_crucrudile.entities.store.EntityStore.add_to_store`
+
+        :argument entity: Entity to add
+        :type entity: :class:`django_crucrudile.entities.Entity`
+        """
+        self.check_entity_argument_combinations(
+            entity, self.get_argument_combinations_budget()
+        )
+        super().add_to_store(entity)
+
+    def replace_in_store(self, entity, new_entity):
+        """Check the number of argument combinations of ``new_entity`` (see
+        :func:`check_entity_argument_combinations`, using the budget
+        returned by :func:`get_argument_combinations_budget`), and
+        replace ``entity`` by
+        ``new_entity`` using
+        :func:`django_crucrudile.entities.store.EntityStore.replace_in_store`
+
+        :argument entity: Entity to replace
+        :type entity: :class:`django_crucrudile.entities.Entity`
+        :argument new_entity: Entity to use instead
+        :type new_entity: :class:`django_crucrudile.entities.Entity`
+        """
+        self.check_entity_argument_combinations(
+            new_entity, self.get_argument_combinations_budget()
+        )
+        super().replace_in_store(entity, new_entity)
+
+    def store_changed(self):
+        """Invalidate the patterns cache (see :func:`patterns`) of this
+        router, and of the routers in which it is registered
+        (recursively), using
+        :func:`django_crucrudile.entities.Entity.patterns_changed`.
+
+        Called when the entity store changes (see
+        :func:`django_crucrudile.entities.store.EntityStore.store_changed`).
+
+        >>> parent, child, sibling = Router(), Router(), Router()
+        >>> parent.register(child) is child
+        True
+        >>> parent.register(sibling) is sibling
+        True
+        >>>
+        >>> _ = list(parent.patterns())
+        >>> [bool(router._patterns_cache)
+        ...  for router in (parent, child, sibling)]
+        [True, True, True]
+        >>>
+        >>> child.store_changed()
+        >>> [bool(router._patterns_cache)
+        ...  for router in (parent, child, sibling)]
+        [False, False, True]
+
+        """
+        super().store_changed()
+        self.patterns_changed()
+
+    def get_store_index_keys(self, entity):
+        """Index registered entities (see
+        :func:`django_crucrudile.entities.store.EntityStore.get_store_index_keys`)
+        by :
+
+        - ``name`` : URL name of routes (from ``get_url_name()``)
+        - ``model`` : model of routes and routers (from ``model``)
+        - ``url_part`` : URL part of routes and routers (from ``url_part``)
+        - ``namespace`` : namespace of routers (from ``namespace``)
+        - ``router`` : index containing all the registered routers (using
+          ``None`` as key), used to look up entities recursively
+
+        These indexes are used by :func:`lookup`.
+
+        :argument entity: Registered entity
+        :type entity: :class:`django_crucrudile.entities.Entity`
+
+        :returns: Index name and key
+        :rtype: iterable of 2-tuple
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> list(Router().get_store_index_keys(route))
+        [('name', 'name'), ('url_part', 'name')]
+        >>>
+        >>> list(Router().get_store_index_keys(Router(namespace='ns')))
+        [('namespace', 'ns'), ('router', None)]
+
+        """
+        get_url_name = getattr(entity, 'get_url_name', None)
+        if get_url_name is not None:
+            yield 'name', get_url_name()
+        for attribute in ('model', 'url_part', 'namespace'):
+            value = getattr(entity, attribute, None)
+            if value is not None:
+                yield attribute, value
+        if isinstance(entity, Router):
+            yield 'router', None
+
+    def _lookup_criteria(self, criteria, descendants=False):
+        """Return the entities matching all the given ``(index, key)``
+        criteria, using the store indexes (or the descendants indexes,
+        if ``descendants`` is ``True``, see
+        :func:`django_crucrudile.entities.store.EntityStore.get_indexed`).
+        """
+        if not criteria:
+            if descendants:
+                return self.get_descendants()
+            return list(self)
+        (index, key), other_criteria = criteria[0], criteria[1:]
+        entities = self.get_indexed(index, key, descendants)
+        for index, key in other_criteria:
+            if not entities:
+                break
+            matching = set(map(id, self.get_indexed(index, key, descendants)))
+            entities = [
+                entity for entity in entities
+                if id(entity) in matching
+            ]
+        return entities
+
+    def lookup(self, name=None, model=None, url_part=None,
+               namespace=None, recursive=True):
+        """Return the registered entities matching all the given criteria,
+        using the store indexes (see :func:`get_store_index_keys`)
+        instead of scanning the entity store.
+
+        :argument name: URL name of the entity (see
+                        :func:`django_crucrudile.routes.base.BaseRoute.get_url_name`)
+        :type name: str
+        :argument model: Model of the entity
+        :type model: :class:`django.db.models.Model`
+        :argument url_part: URL part of the entity
+        :type url_part: str
+        :argument namespace: Namespace of the entity
+        :type namespace: str
+        :argument recursive: Also look up entities in the registered
+                             routers (recursively)
+        :type recursive: bool
+
+        :returns: Matching entities (in registration order, entities
+                  of the registered routers following the entities of
+                  this router)
+        :rtype: list
+
+        >>> import tests.unit
+        >>> from django.db.models import Model
+        >>>
+        >>> # needed to subclass Django Model
+        >>> __name__ = "tests.doctests"
+        >>>
+        >>> class TestModel(Model):
+        ...   pass
+        >>>
+        >>> router = Router(generic=True)
+        >>> model_router = router.register(TestModel)
+        >>>
+        >>> router.lookup(model=TestModel, recursive=False) == [model_router]
+        True
+        >>> [route.get_url_name() for route in router.lookup(model=TestModel)
+        ...  if route is not model_router]
+        ... # doctest: +NORMALIZE_WHITESPACE
+        ['testmodel-delete', 'testmodel-update', 'testmodel-create',
+         'testmodel-detail', 'testmodel-list']
+        >>> router.lookup(name='testmodel-detail')[0].get_url_name()
+        'testmodel-detail'
+        >>> router.lookup(name='testmodel-detail', recursive=False)
+        []
+        >>> router.lookup(url_part='detail', name='testmodel-list')
+        []
+
+        Entities of nested routers are found with a single index read,
+        as their index entries are also stored in the indexes of the
+        ancestor routers (see
+        :func:`django_crucrudile.entities.store.EntityStore.get_indexed`) :
+
+        >>> parent = Router()
+        >>> parent.register(router) is router
+        True
+        >>> parent.lookup(name='testmodel-detail')[0].get_url_name()
+        'testmodel-detail'
+        >>> _ = parent.unregister(router)
+        >>> parent.lookup(name='testmodel-detail')
+        []
+
+        """
+        criteria = [
+            (index, key) for index, key in (
+                ('name', name),
+                ('model', model),
+                ('url_part', url_part),
+                ('namespace', namespace),
+            ) if key is not None
+        ]
+
+        entities = self._lookup_criteria(criteria)
+        if recursive:
+            entities.extend(
+                self._lookup_criteria(criteria, descendants=True)
+            )
+
+        return entities
+
+    def get_redirect_target(self, redirect_max_depth=None):
+        """Follow the ``redirect`` attributes, starting from this router,
+        to find the redirect target : the URL name found at the end,
+        and the namespaces of the routers followed to get there.
+
+        The target is memoized on each router of the path (so that
+        parent routers redirecting to this router don't follow its
+        path again), and invalidated when the ``redirect`` or
+        ``namespace`` attribute of an entity of the path changes (see
+        :func:`django_crucrudile.entities.Entity.redirect_changed`).
+        The path is not memoized if it contains objects that are not
+        entities (that can't notify changes).
+
+        :argument redirect_max_depth: Optional. See
+                                      :attr:`Router.redirect_max_depth`
+        :type redirect_max_depth: int
+
+        :returns: Namespaces of the routers followed, URL name (or
+                  ``None`` if no URL name was found), and last object
+                  whose ``redirect`` attribute was followed
+        :rtype: 3-tuple
+
+        :raise OverflowError: If the ``redirect`` attributes make a
+                              cycle, or if :attr:`redirect_max_depth`
+                              objects were followed without finding
+                              an URL name
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> parent = Router()
+        >>> child = Router(namespace='child')
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>>
+        >>> child.register(route, index=True) is route
+        True
+        >>> parent.register(child, index=True) is child
+        True
+        >>>
+        >>> namespaces, url_name, last_redirect = parent.get_redirect_target()
+        >>> namespaces, url_name, last_redirect is route
+        (('child',), 'name', True)
+        >>> child.get_redirect_target()[:2]
+        ((), 'name')
+        >>>
+        >>> child.namespace = 'other'
+        >>> parent.get_redirect_target()[:2]
+        (('other',), 'name')
+
+        >>> child.redirect = parent
+        >>> parent.get_redirect_target()
+        ... # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        OverflowError: Redirect cycle found when following redirect
+        attributes : <...Router object at ...> -> <...Router object at
+        ...> -> <...Router object at ...>
+
+        """
+        target = self.__dict__.get('_redirect_target')
+        if target is not None:
+            return target
+
+        if redirect_max_depth is None:
+            redirect_max_depth = self.redirect_max_depth
+
+        # objects whose redirect attribute was followed, with their
+        # redirect generation (to know if they changed meanwhile)
+        path = []
+        positions = {}
+        entity = self
+        for _ in range(redirect_max_depth):
+            if (path and isinstance(entity, Entity) and
+                    isinstance(path[-1][0], Entity)):
+                # notify the previous entity when this one changes
+                entity._redirect_dependents.add(path[-1][0])
+            if id(entity) in positions:
+                raise OverflowError(
+                    "Redirect cycle found when following redirect "
+                    "attributes : {}".format(' -> '.join(
+                        repr(item) for item, _ in
+                        path[positions[id(entity)]:] + [(entity, None)]
+                    ))
+                )
+            if entity is not self and isinstance(entity, Router):
+                tail = entity.__dict__.get('_redirect_target')
+                if tail is not None:
+                    break
+            if isinstance(entity, EntityStore):
+                # the redirect attribute may be set when
+                # registering the base store (if it's lazy)
+                entity.register_lazy_base_store()
+            positions[id(entity)] = len(path)
+            path.append(
+                (entity, getattr(entity, '_redirect_generation', None))
+            )
+            redirect = entity.redirect
+            if redirect is None or isinstance(redirect, str):
+                break
+            entity = redirect
+        else:
+            raise OverflowError(
+                "Depth-first search reached its maximum ({}) depth"
+                ", without returning a leaf item (string)."
+                "Maybe the redirect graph has a cycle ?"
+                "".format(redirect_max_depth)
+            )
+
+        # compute (and memoize) the targets of the path objects, from
+        # the last one
+        if path[-1][0] is entity:
+            # the redirect attribute of the last object is the URL name
+            target, next_item = ((), redirect, None), None
+        else:
+            # the last router has a memoized target
+            target, next_item = tail, entity
+        memoize = True
+        for item, generation in reversed(path):
+            if next_item is not None:
+                namespaces, url_name, last_redirect = target
+                if isinstance(next_item, Router) and next_item.namespace:
+                    namespaces = (next_item.namespace,) + namespaces
+                if last_redirect is None:
+                    last_redirect = next_item
+                target = (namespaces, url_name, last_redirect)
+            if not isinstance(item, Entity):
+                # can't be notified when this object changes
+                memoize = False
+            elif (memoize and isinstance(item, Router) and
+                  generation == item._redirect_generation):
+                item._redirect_target = target
+            next_item = item
+        return target
+
     def get_redirect_pattern(self, namespaces=None, silent=None,
                              redirect_max_depth=None):
         """Compile the URL name to this router's redirect path (found by
@@ -271,6 +969,15 @@ super implementation)
         :class:`django.views.generic.RedirectView` that redirects to
         this URL name
 
+        The returned URL pattern has two additional attributes, used
+        by :func:`warmup` (and useful when debugging) :
+
+        - ``_target_url_name`` : the URL name (with namespaces) the
+          pattern redirects to
+        - ``_redirect_url`` : the lazy URL (see
+          :func:`django_crucrudile.resolvers.memoized_reverse_lazy`)
+          the pattern redirects to
+
         :argument namespaces: Optional. The list of namespaces will be
                               used to get the current namespaces when
                               building the redirect URL name. If not
@@ -283,10 +990,7 @@ super implementation)
                                          :attr:`Router.redirect_max_depth`
         :type redirect_max_depth: int
 
-        :raise OverflowError: If the depth-first search in the graph
-                              made from redirect attributes reaches
-                              the depth in :attr:`redirect_max_depth`
-                              (to intercept graph cycles)
+        :raise OverflowError: See :func:`get_redirect_target`
         :raise ValueError: If no redirect found when following
                            ``redirect`` attributes, and silent
                            mode is not enabled.
@@ -334,12 +1038,12 @@ super implementation)
         True
         >>>
         >>> router.get_redirect_pattern()
-        ... # doctest: +NORMALIZE_WHITESPACE
+        ... # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
         Traceback (most recent call last):
           ...
-        OverflowError: Depth-first search reached its maximum (100)
-        depth, without returning a leaf item (string).Maybe the
-        redirect graph has a cycle ?
+        OverflowError: Redirect cycle found when following redirect
+        attributes : <Mock id=...> -> <Mock name='mock.redirect' id=...>
+        -> <Mock id=...>
 
         >>> entity = Mock()
         >>> entity.__str__ = lambda x: 'mock redirect'
@@ -361,55 +1065,14 @@ super implementation)
         # initialize default arguments
         if silent is None:
             silent = self.get_redirect_silent
-        if redirect_max_depth is None:
-            redirect_max_depth = self.redirect_max_depth
         if namespaces is None:
             namespaces = []
-        else:
-            # need to copy because _follow_redirect appends namespaces
-            # found when following redirect attributes
-            namespaces = list(namespaces)
-
-        # used if following redirect attributes failed, to provide
-        # information in the exception.
-        _last_redirect_found = None
-
-        redirect = self.redirect
-        for i in range(redirect_max_depth):
-            # loop through redirect attributes
-            if isinstance(redirect, str):
-                break
-            elif redirect is None:
-                break
-            elif redirect is not None:
-                # not a string and not None, check if it's a Router so
-                # we can append its namespace to the namespaces list
-
-                # maybe it's better to just getattr(redirect,
-                # 'namespace') and to handle the exception (or
-                # getattr(redirect, 'namespace', None))
-
-                # can't decide either
-                if isinstance(redirect, Router) and redirect.namespace:
-                    namespaces.append(redirect.namespace)
-                # save last redirect in case of exception
-                _last_redirect_found = redirect
-                # NOTE: risk of infinite loop here, if the redirect
-                # attributes keeps being not None and never string
-                # this could happen if case of "redirect loop" :
-                # >>> A, B = [Router() for _ in range(3)]
-                # >>> A.redirect = B
-                # >>> B.redirect = A
-                # >>> _follow_redirect(A)
-                # --- /!\ infinite loop /!\ ---
-                redirect = redirect.redirect
-        else:
-            raise OverflowError(
-                "Depth-first search reached its maximum ({}) depth"
-                ", without returning a leaf item (string)."
-                "Maybe the redirect graph has a cycle ?"
-                "".format(redirect_max_depth)
-            )
+
+        target_namespaces, redirect, _last_redirect_found = (
+            self.get_redirect_target(redirect_max_depth)
+        )
+        namespaces = list(namespaces) + list(target_namespaces)
+
         if redirect:
             # get the target URL name (by prefixing the redirect URL
             # name with the namespaces)
@@ -429,8 +1092,9 @@ super implementation)
             # Create a redirect view, that will get the URL to
             # redirect to lazily (when it's accessed), as the target
             # URL is not known yet
+            redirect_url = memoized_reverse_lazy(target_url_name)
             redirect_view = RedirectView.as_view(
-                url=reverse_lazy(target_url_name)
+                url=redirect_url
             )
 
             # Now that we have a redirect view pointing to the target
@@ -441,13 +1105,14 @@ super implementation)
                 name=redirect_url_name
             )
 
-            # FIXME: Used for debugging, should be removed.
+            # used by warmup(), and when debugging
             url_pattern._target_url_name = target_url_name
+            url_pattern._redirect_url = redirect_url
 
             return url_pattern
         elif not silent:
             # No URL found and set to fail (not silent) if we got
-            # here, it's because _follow_redirect() returned
+            # here, it's because get_redirect_target() returned
             # None.
             #
             # This will happen if self.redirect is None or if
@@ -519,7 +1184,246 @@ super implementation)
           ...
         ValueError: No redirect attribute set (and
         ``add_redirect_silent`` is ``False``).
+
+        The generated patterns are cached (for each set of arguments,
+        see :func:`django_crucrudile.entities.Entity.get_cached_patterns`),
+        until the router, or one of the entities registered in it
+        (recursively), changes (see
+        :func:`django_crucrudile.entities.Entity.patterns_changed`). Thus,
+        when
+        an entity is registered in (or unregistered from) a router,
+        only the patterns of this router and of its parents are
+        rebuilt :
+
+        >>> parent, child, sibling = Router(), Router(), Router()
+        >>> child.url_part, sibling.url_part = 'child', 'sibling'
+        >>> parent.register(child) is child
+        True
+        >>> parent.register(sibling) is sibling
+        True
+        >>>
+        >>> pattern = next(parent.patterns())
+        >>> child_pattern, sibling_pattern = pattern.url_patterns
+        >>> next(parent.patterns()) is pattern
+        True
+        >>>
+        >>> child.register(entity_1) is entity_1
+        True
+        >>> child_pattern, new_sibling_pattern = (
+        ...   next(parent.patterns()).url_patterns
+        ... )
+        >>> child_pattern.url_patterns
+        ['MockPattern1']
+        >>> new_sibling_pattern is sibling_pattern
+        True
+
+        When :attr:`lazy_patterns` is set to ``True``, the patterns of
+        the routed entities are only generated when resolving an URL
+        that matches the router URL part (or when reversing an URL in
+        the router namespace) :
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router(lazy_patterns=True)
+        >>> child = Router(lazy_patterns=True,
+        ...                namespace='child', url_part='child')
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> router.register(child) is child
+        True
+        >>> child.register(route) is route
+        True
+        >>>
+        >>> pattern = next(router.patterns())
+        >>> pattern
+        <RouterResolver <lazy> (None:None) ^>
+        >>> pattern.url_patterns
+        [<RouterResolver <lazy> (child:child) ^child/>]
+        >>> pattern.resolve('child/name').view_name
+        'child:name'
+        >>> pattern.url_patterns
+        [<RouterResolver <RegexURLPattern list> (child:child) ^child/>]
+
+        """
+        # register base store if needed (as it may set self.redirect)
+        self.register_lazy_base_store()
+
+        yield from self.get_cached_patterns(
+            (
+                tuple(namespaces) if namespaces is not None else None,
+                add_redirect,
+                add_redirect_silent
+            ),
+            partial(
+                self.make_patterns,
+                namespaces, add_redirect, add_redirect_silent
+            )
+        )
+
+    def make_patterns(self, namespaces=None,
+                      add_redirect=None, add_redirect_silent=None):
+        """Build the patterns yielded by :func:`patterns` (bypassing the
+        patterns cache of this router).
+
+        See :func:`patterns` for the arguments.
+
+        If :func:`get_resolver_class` returns ``None`` and all the
+        patterns are static, they are yielded in a
+        :class:`django_crucrudile.resolvers.DispatchResolver`. If the
+        patterns are not lazy, the dispatch resolver is populated (see
+        :func:`django_crucrudile.resolvers.DispatchResolver.populate`).
+
+        :returns: URL patterns
+        :rtype: iterable of ``RegexURLResolver``
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router()
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> router.register(route) is route
+        True
+        >>>
+        >>> pattern = next(router.make_patterns())
+        >>> pattern
+        <DispatchResolver <RegexURLPattern list> (None:None) ^>
+        >>> [sorted(matches) for matches in pattern._static_matches.values()]
+        [['name']]
+        >>>
+        >>> route = CallbackRoute(name='detail', url_part='(?P<pk>[0-9]+)',
+        ...                       callback=lambda: None)
+        >>> router.register(route) is route
+        True
+        >>> next(router.make_patterns())
+        <RegexURLResolver <RegexURLPattern list> (None:None) ^>
+
         """
+        # get regex and namespace
+        # (needed when building RegexURLResolver)
+        regex = self.get_url_regex()
+        namespace = self.namespace
+
+        # pattern reader generator, yielding patterns from the store
+        # entities (also get the redirect pattern if required)
+        pattern_reader = partial(
+            self.read_store,
+            namespaces, add_redirect, add_redirect_silent
+        )
+        pattern_list = None
+
+        resolver_class = self.get_resolver_class()
+        if resolver_class is None:
+            # consume the generator
+            pattern_list = list(pattern_reader())
+            if (get_static_path(regex, prefix=True) is not None and
+                    all(map(is_static_pattern, pattern_list))):
+                # only static patterns, resolve them with the static
+                # matches dictionary
+                resolver_class = DispatchResolver
+                pattern_reader = partial(iter, pattern_list)
+
+        if resolver_class is not None:
+            if not self.lazy_patterns and pattern_list is None:
+                # consume the generator now
+                pattern_list = list(pattern_reader())
+                pattern_reader = partial(iter, pattern_list)
+            # make a RouterResolver, that will consume the generator
+            # when needed
+            pattern = resolver_class(
+                regex,
+                pattern_reader,
+                namespace=namespace,
+                app_name=namespace
+            )
+            if pattern_list is not None and isinstance(
+                    pattern, DispatchResolver):
+                # the patterns are loaded, build the static matches
+                # dictionary now rather than when resolving the first
+                # URL
+                pattern.populate()
+        else:
+            # make a RegexURLResolver
+            pattern = url(
+                regex,
+                include(
+                    pattern_list,
+                    namespace=namespace,
+                    app_name=namespace
+                )
+            )
+        pattern.router = self
+
+        yield pattern
+
+    def get_resolver_class(self):
+        """Return the class of the resolver yielded by :func:`patterns`
+        (:attr:`resolver_class` if defined, or
+        :class:`django_crucrudile.resolvers.RouterResolver` if
+        :attr:`lazy_patterns` is ``True``)
+
+        :returns: Resolver class, or ``None`` to use Django's
+                  :class:`django.core.urlresolvers.RegexURLResolver`
+                  (or a
+                  :class:`django_crucrudile.resolvers.DispatchResolver`
+                  if the patterns are all static, see
+                  :attr:`resolver_class`)
+        :rtype: subclass of
+                :class:`django_crucrudile.resolvers.RouterResolver`
+
+        >>> Router().get_resolver_class() is None
+        True
+        >>> Router(lazy_patterns=True).get_resolver_class()
+        <class 'django_crucrudile.resolvers.RouterResolver'>
+        >>> Router(resolver_class=TrieResolver).get_resolver_class()
+        <class 'django_crucrudile.resolvers.TrieResolver'>
+
+        """
+        if self.resolver_class is not None:
+            return self.resolver_class
+        if self.lazy_patterns:
+            return RouterResolver
+        return None
+
+    def get_url_regex(self):
+        """Return the regex of the URL group of this router (made using
+        :attr:`url_part`)
+
+        :returns: URL regex
+        :rtype: str
+
+        >>> Router().get_url_regex()
+        '^'
+        >>> Router(url_part='part').get_url_regex()
+        '^part/'
+
+        """
+        url_part = self.url_part
+        return '^{}/'.format(url_part) if url_part else '^'
+
+    def read_store(self, namespaces=None,
+                   add_redirect=None, add_redirect_silent=None,
+                   read_entity=None):
+        """Yield the redirect pattern of this router (if required), and the
+        items returned by ``read_entity`` for each of the entities in
+        the entity store.
+
+        See :func:`patterns` for the ``namespaces``, ``add_redirect``
+        and ``add_redirect_silent`` arguments.
+
+        :argument read_entity: Function called with each entity, and
+                               the ``namespaces``, ``add_redirect`` and
+                               ``add_redirect_silent`` arguments to pass
+                               to the entity. Defaults to calling the
+                               entity ``patterns()`` method.
+        :type read_entity: callable
+
+        :returns: Redirect pattern, and items returned by
+                  ``read_entity``
+        :rtype: iterable
+
+        """
+        if read_entity is None:
+            def read_entity(entity, *args):
+                return entity.patterns(*args)
+
         # initialize default arguments
 
         # append self.namespace (if any) to given namespaces (copying
@@ -547,56 +1451,373 @@ super implementation)
         if add_redirect_silent is None:
             add_redirect_silent = self.add_redirect_silent
 
-        # get url_part and namespace from attributes
-        # (needed when building RegexURLResolver)
-        url_part = self.url_part
-        namespace = self.namespace
+        # yield redirect pattern if there is one defined (and
+        # add_redirect is True)
+        if add_redirect:
+            if self.redirect is not None:
+                redirect_pattern = self.get_redirect_pattern(namespaces)
+                if redirect_pattern:
+                    yield redirect_pattern
+            else:
+                if add_redirect_silent is False:
+                    raise ValueError(
+                        "No redirect attribute set "
+                        "(and ``add_redirect_silent`` is ``False``)."
+                        "".format(self)
+                    )
+
+        for entity in self:
+            # yield items from each entity
+            for item in read_entity(
+                    entity,
+                    namespaces,
+                    orig_add_redirect,
+                    orig_add_redirect_silent
+            ):
+                yield item
+
+    def get_route_records(self, namespaces=None,
+                          add_redirect=None, add_redirect_silent=None):
+        """Yield the route records (see
+        :class:`django_crucrudile.table.RouteRecord`) of the entities in
+        the entity store (and of the redirect pattern), contained in the
+        URL group of this router.
+
+        See :func:`patterns` for the arguments.
+
+        :returns: Route records
+        :rtype: iterable of :class:`django_crucrudile.table.RouteRecord`
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router(namespace='ns', url_part='part')
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> router.register(route, index=True) is route
+        True
+        >>>
+        >>> list(router.get_route_records())
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [<RouteRecord ns:name-redirect ^part/$>,
+         <RouteRecord ns:name ^part/name$>]
+
+        """
+        def read_entity(entity, *args):
+            if isinstance(entity, Entity):
+                return entity.get_route_records(*args)
+            return RouteTable.records_from_patterns(entity.patterns(*args))
+
+        parent = self.get_url_regex(), self.namespace
+        for item in self.read_store(
+                namespaces, add_redirect, add_redirect_silent,
+                read_entity=read_entity
+        ):
+            if not isinstance(item, RouteRecord):
+                # redirect pattern
+                item = RouteRecord.from_pattern(item)
+            yield item.with_parent(*parent)
+
+    def get_reverse_table(self):
+        """Return the reverse table (see
+        :class:`django_crucrudile.table.ReverseTable`) of this router, made
+        from its route table (see
+        :func:`django_crucrudile.entities.Entity.get_route_table`), for
+        the active language. The reverse table is stored in the patterns
+        cache (see
+        :func:`django_crucrudile.entities.Entity.get_cached_patterns`).
+
+        :returns: Reverse table
+        :rtype: :class:`django_crucrudile.table.ReverseTable`
+        """
+        return self.get_cached_patterns(
+            ('reverse_table', get_language()),
+            lambda: [ReverseTable(self.get_route_table())]
+        )[0]
+
+    def get_mount_prefix(self):
+        """Return the path prefix of the URL patterns of this router in the
+        current URLconf (the static part of the regexs of the URL
+        resolvers in which they are included), used by :func:`reverse`.
+
+        The prefix is found by comparing the regexs of the reverse table
+        (see :func:`get_reverse_table`) with the regexs in the reverse
+        mappings of the root URL resolver. It is stored in the patterns
+        cache, for the active language and URLconf (see
+        :func:`django_crucrudile.entities.Entity.get_cached_patterns`).
+
+        :returns: Path prefix
+        :rtype: str
+
+        :raise ValueError: If the URL patterns of this router are not
+                           found in the root namespace of the URLconf
+                           (for example, if they are included in a
+                           namespace), or if they are included in an
+                           URL resolver whose regex is not static.
+
+        >>> from types import ModuleType
+        >>> from django.conf.urls import url, include
+        >>> from django.core.urlresolvers import set_urlconf
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router(namespace='ns', url_part='part')
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> router.register(route) is route
+        True
+        >>>
+        >>> urlconf = ModuleType('urlconf')
+        >>> urlconf.urlpatterns = [
+        ...   url('^api/', include(list(router.patterns())))
+        ... ]
+        >>> set_urlconf(urlconf)
+        >>> router.get_mount_prefix()
+        'api/'
+        >>>
+        >>> other_urlconf = ModuleType('other_urlconf')
+        >>> other_urlconf.urlpatterns = [
+        ...   url('^(?P<version>\\d+)/', include(list(router.patterns())))
+        ... ]
+        >>> set_urlconf(other_urlconf)
+        >>> router.get_mount_prefix()
+        ... # doctest: +NORMALIZE_WHITESPACE
+        Traceback (most recent call last):
+          ...
+        ValueError: The URL patterns of this router are included in an
+        URL resolver whose regex is not static (^(?P<version>\d+)/)
+        >>> set_urlconf(None)
 
-        # get redirect (needed if add_redirect is True)
-        redirect = self.redirect
-
-        # define a pattern reader generator, yielding patterns from the
-        # store entities (also get the redirect pattern if required)
-        def pattern_reader():
-            # yield redirect pattern if there is one defined (and
-            # add_redirect is True)
-            if add_redirect:
-                if redirect is not None:
-                    redirect_pattern = self.get_redirect_pattern(namespaces)
-                    if redirect_pattern:
-                        yield redirect_pattern
-                else:
-                    if add_redirect_silent is False:
+        """
+        return self.get_cached_patterns(
+            ('mount_prefix', get_language(), get_urlconf()),
+            lambda: [self._find_mount_prefix()]
+        )[0]
+
+    def _find_mount_prefix(self):
+        """Find the path prefix of the URL patterns of this router in the
+        current URLconf (see :func:`get_mount_prefix`)."""
+        root = get_resolver(get_urlconf())
+        found_entries = False
+        for view_name, candidates in self.get_reverse_table().entries.items():
+            if not candidates:
+                continue
+            found_entries = True
+            *namespaces, name = view_name.split(':')
+            resolver, namespace_regex = root, ''
+            try:
+                for namespace in namespaces:
+                    extra, resolver = resolver.namespace_dict[namespace]
+                    namespace_regex += extra
+            except KeyError:
+                continue
+            for _, _, regex, _ in candidates:
+                own_regex = regex.pattern[1:]
+                for _, pattern_regex, _ in resolver.reverse_dict.getlist(
+                        name):
+                    full_regex = namespace_regex + pattern_regex
+                    if not full_regex.endswith(own_regex):
+                        continue
+                    prefix_regex = '^' + full_regex[:-len(own_regex)]
+                    prefix = get_static_path(prefix_regex, prefix=True)
+                    if prefix is None:
                         raise ValueError(
-                            "No redirect attribute set "
-                            "(and ``add_redirect_silent`` is ``False``)."
-                            "".format(self)
+                            "The URL patterns of this router are included "
+                            "in an URL resolver whose regex is not static "
+                            "({})".format(prefix_regex)
                         )
-
-            for entity in self._store:
-                # yield patterns from each entity's patterns function
-                for pattern in entity.patterns(
-                        namespaces,
-                        orig_add_redirect,
-                        orig_add_redirect_silent
-                ):
-                    yield pattern
-
-        # consume the generator
-        pattern_list = list(pattern_reader())
-
-        # make a RegexURLResolver
-        pattern = url(
-            '^{}/'.format(url_part) if url_part else '^',
-            include(
-                pattern_list,
-                namespace=namespace,
-                app_name=namespace
-            )
+                    return prefix
+        if not found_entries:
+            # nothing to reverse using the reverse table
+            return ''
+        raise ValueError(
+            "The URL patterns of this router were not found in the root "
+            "namespace of the URLconf ({})".format(get_urlconf())
         )
-        pattern.router = self
 
-        yield pattern
+    def reverse(self, viewname, *args, **kwargs):
+        """Return the URL for a view name and arguments, using the reverse
+        table of this router (see :func:`get_reverse_table`), by
+        formatting an URL template. If the view name is not in the
+        reverse table (or if no URL template matches the arguments),
+        Django's :func:`django.core.urlresolvers.reverse` is used.
+
+        The URL patterns of this router should be included in the root
+        namespace of the URLconf, in URL resolvers whose regexs are
+        static (their path prefix is found using
+        :func:`get_mount_prefix`).
+
+        :raise ValueError: See :func:`get_mount_prefix`
+
+        :argument viewname: View name (URL name, prefixed with the
+                            namespaces, including the namespace of
+                            this router)
+        :type viewname: str
+
+        Other arguments are used as URL arguments.
+
+        :returns: URL
+        :rtype: str
+
+        >>> from types import ModuleType
+        >>> from django.core.urlresolvers import set_urlconf
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router(namespace='ns', url_part='part')
+        >>> route = CallbackRoute(name='name', callback=lambda: None,
+        ...                       url_part='(?P<pk>\\d+)')
+        >>> router.register(route) is route
+        True
+        >>>
+        >>> urlconf = ModuleType('urlconf')
+        >>> urlconf.urlpatterns = list(router.patterns())
+        >>> set_urlconf(urlconf)
+        >>>
+        >>> router.reverse('ns:name', pk=42)
+        '/part/42'
+        >>> router.reverse('ns:name', 42)
+        '/part/42'
+        >>> router.reverse('ns:name', pk='a')
+        ... # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        django.core.urlresolvers.NoReverseMatch: Reverse for 'name' ...
+        >>> set_urlconf(None)
+
+        """
+        if isinstance(viewname, str):
+            path = self.get_reverse_table().reverse(viewname, args, kwargs)
+            if path is not None:
+                return iri_to_uri(
+                    urlquote(get_script_prefix() + self.get_mount_prefix())
+                    + path
+                )
+        return reverse(viewname, args=args or None, kwargs=kwargs or None)
+
+    def warmup(self, urlconf=None):
+        """Generate the URL patterns of this router, and prepare them to be
+        used (compile their regexs, populate the reverse mappings of the
+        URL resolvers, reverse the redirect targets, and build the reverse
+        table and find the mount prefix used by :func:`reverse`), so
+        that it doesn't happen when handling the first requests. Also
+        save the URL caches used by the routes (see
+        :attr:`django_crucrudile.routes.base.BaseRoute.url_cache`).
+
+        When running under a pre-forking server (for example gunicorn
+        with ``--preload``), call this method in the master process
+        (after the URLconf is loaded, for example in the WSGI module),
+        so that the work is shared by the workers.
+
+        :argument urlconf: URLconf (module or module name) containing
+                           the URL patterns of this router. If
+                           ``None``, the current URLconf (usually
+                           ``settings.ROOT_URLCONF``) is used.
+        :type urlconf: str or module
+
+        :returns: Number of URL patterns, of URL resolvers and of
+                  redirect patterns prepared, and view names of the
+                  redirect targets that could not be reversed
+        :rtype: dict
+
+        .. note::
+
+           The regexs, reverse mappings and static matches dictionaries
+           (of the dispatch resolvers, see
+           :func:`django_crucrudile.resolvers.DispatchResolver.populate`)
+           are prepared for the active language.
+
+        >>> from types import ModuleType
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> router = Router(namespace='ns')
+        >>> route = CallbackRoute(name='name', callback=lambda: None)
+        >>> router.register(route, index=True) is route
+        True
+        >>>
+        >>> urlconf = ModuleType('urlconf')
+        >>> urlconf.urlpatterns = list(router.patterns())
+        >>>
+        >>> sorted(router.warmup(urlconf).items())
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [('patterns', 2), ('redirects', 1), ('resolvers', 2),
+         ('unresolved_redirects', [])]
+        >>> '_regex_dict' in urlconf.urlpatterns[0].__dict__
+        True
+
+        The static matches dictionaries of the dispatch resolvers are
+        built :
+
+        >>> from django_crucrudile.resolvers import DispatchResolver
+        >>>
+        >>> router.resolver_class = DispatchResolver
+        >>> urlconf.urlpatterns = list(router.patterns())
+        >>> _ = router.warmup(urlconf)
+        >>> sorted(urlconf.urlpatterns[0]._static_matches.popitem()[1])
+        ['', 'name']
+
+        """
+        stats = {
+            'patterns': 0,
+            'resolvers': 0,
+            'redirects': 0,
+            'unresolved_redirects': [],
+        }
+        redirect_patterns = []
+
+        root = get_resolver(urlconf if urlconf is not None else get_urlconf())
+        pattern_stack = [root] + list(self.patterns())
+        visited = set()
+        while pattern_stack:
+            pattern = pattern_stack.pop()
+            if id(pattern) in visited:
+                continue
+            visited.add(id(pattern))
+            # compile regex
+            pattern.regex
+            if isinstance(pattern, RegexURLResolver):
+                stats['resolvers'] += 1
+                # populate reverse mappings (loads lazy resolvers)
+                pattern.reverse_dict
+                if isinstance(pattern, DispatchResolver):
+                    pattern.populate()
+                pattern_stack.extend(pattern.url_patterns)
+            else:
+                stats['patterns'] += 1
+                if hasattr(pattern, '_redirect_url'):
+                    redirect_patterns.append(pattern)
+
+        # reverse redirect targets (using the given URLconf)
+        previous_urlconf = get_urlconf()
+        if urlconf is not None:
+            set_urlconf(urlconf)
+        try:
+            for pattern in redirect_patterns:
+                stats['redirects'] += 1
+                try:
+                    str(pattern._redirect_url)
+                except NoReverseMatch:
+                    stats['unresolved_redirects'].append(
+                        pattern._target_url_name
+                    )
+            # build the reverse table, and find the mount prefix (in
+            # the given URLconf)
+            self.get_reverse_table()
+            try:
+                self.get_mount_prefix()
+            except ValueError:
+                # reverse() will raise it, if it is used
+                pass
+        finally:
+            set_urlconf(previous_urlconf)
+
+        # save URL caches
+        url_caches = {
+            id(url_cache): url_cache
+            for url_cache in (
+                getattr(entity, 'url_cache', None)
+                for entity in self.lookup()
+            ) if url_cache is not None
+        }
+        for url_cache in url_caches.values():
+            url_cache.save()
+
+        return stats
 
 from .model import ModelRouter
 from .model.generic import GenericModelRouter
@@ -13,6 +13,12 @@ class ModelMixin:
 
     .. inheritance-diagram:: ModelMixin
 
+    """
+    patterns_attributes = ('model',)
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
     """
     model = None
     """
@@ -71,6 +71,21 @@ class GenericModelRouter(ModelRouter):
          - testmodel-detail @ ^detail/(?P<slug>[\w-]+)$ DetailView
          - testmodel-list @ ^list$ ListView
 
+    With ``lazy_base_store`` (see
+    :attr:`django_crucrudile.entities.store.EntityStore.lazy_base_store`),
+    the routes provided by the model routers are only instantiated when
+    the router is first used :
+
+    >>> router = Router(generic=True, lazy_base_store=True)
+    >>>
+    >>> model_router = router.register(TestModel)
+    >>> model_router._store
+    []
+    >>> len(list(model_router))
+    5
+    >>> model_router.redirect.get_url_name()
+    'testmodel-list'
+
     """
     @classmethod
     def get_register_class_map(cls):
@@ -12,9 +12,9 @@ abstract function :func:`BaseRoute.get_callback`.
 """
 from itertools import product
 from abc import abstractmethod
-from django.conf.urls import url
-
 from django_crucrudile.entities import Entity
+from django_crucrudile.table import RouteRecord
+from django_crucrudile.cache import get_fingerprint, get_class_path
 from django_crucrudile.urlutils import URLBuilder
 
 
@@ -54,6 +54,37 @@ class BaseRoute(Entity):
                               :attr:`name` if none defined.
     :type auto_url_part: bool
 
+    """
+    url_cache = None
+    """
+    :attribute url_cache: If defined, persistent cache used to store the
+                          URL regexs and names (see
+                          :func:`get_url_regexs_names`)
+    :type url_cache: :class:`django_crucrudile.cache.URLCache`
+    """
+    patterns_attributes = (
+        'name',
+        'url_part',
+        'auto_url_part',
+        'url_cache',
+        'cache_resolve',
+    )
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
+    """
+    cache_resolve = True
+    """
+    :attribute cache_resolve: If ``False``, the URLs of this route are
+                              not stored in resolve caches (see
+                              :class:`django_crucrudile.resolvers.LRUCacheResolver`).
+                              The route records are marked with a
+                              ``cache_resolve`` attribute, and make
+                              :class:`django_crucrudile.resolvers.UncachedURLPattern`
+                              URL patterns (see
+                              :class:`django_crucrudile.table.RouteRecord`).
+    :type cache_resolve: bool
     """
     def __init__(self,
                  name=None, url_part=None,
@@ -146,20 +177,156 @@ class BaseRoute(Entity):
         >>> list(route.patterns())
         [<RegexURLPattern name ^url_part$>]
 
+        The patterns are cached (see
+        :func:`django_crucrudile.entities.Entity.get_cached_patterns`),
+        so that :func:`get_callback` (that may call ``as_view()``) is
+        only called again when the route changes :
+
+        >>> next(route.patterns()) is next(route.patterns())
+        True
+        >>> route.url_part = 'new_url_part'
+        >>> list(route.patterns())
+        [<RegexURLPattern name ^new_url_part$>]
+
+        """
+        # the patterns don't depend on the arguments
+        yield from self.get_cached_patterns(None, self.make_patterns)
+
+    def make_patterns(self):
+        """Build the patterns yielded by :func:`patterns` (bypassing the
+        patterns cache of this route).
+
+        :returns: Django URL patterns
+        :rtype: iterable of ``RegexURLPattern``
+
+        """
+        for record in self.get_route_records():
+            yield record.to_pattern()
+
+    def get_route_records(self, *args, **kwargs):
+        """Yield route records (see
+        :class:`django_crucrudile.table.RouteRecord`) for URL regexs in
+        :func:`get_url_regexs`, using callback in :func:`get_callback`
+        and URL name from :func:`get_url_name`. Used by
+        :func:`make_patterns` to build the URL patterns.
+
+        Arguments are not used in :class:`BaseRoute`'s implementation
+        (see :func:`patterns`).
+
+        :returns: Route records
+        :rtype: iterable of :class:`django_crucrudile.table.RouteRecord`
+
+        >>> class Route(BaseRoute):
+        ...   def get_callback(self):
+        ...    pass
+        >>>
+        >>> route = Route('name', 'url_part')
+        >>> list(route.get_route_records())
+        [<RouteRecord name ^url_part$>]
+
         """
         callback = self.get_callback()
 
-        regexs_names = product(
+        for regex, name in self.get_url_regexs_names():
+            yield RouteRecord(
+                regex,
+                name,
+                callback,
+                cache_resolve=self.cache_resolve
+            )
+
+    def get_url_regexs_names(self):
+        """Return the URL regexs (from :func:`get_url_regexs`) and URL names
+        (from :func:`get_url_names`) to generate patterns for (one
+        pattern for each combination).
+
+        If :attr:`url_cache` is defined, the result is stored in this
+        cache (using the fingerprint returned by
+        :func:`get_url_cache_fingerprint`), and read from it when
+        available, instead of being computed again.
+
+        :returns: URL regexs and names
+        :rtype: list of 2-tuple
+
+        >>> import os
+        >>> from tempfile import TemporaryDirectory
+        >>> from django_crucrudile.cache import URLCache
+        >>>
+        >>> directory = TemporaryDirectory()
+        >>>
+        >>> class Route(BaseRoute):
+        ...   def get_callback(self):
+        ...    pass
+        ...   url_cache = URLCache(os.path.join(directory.name, 'urls.json'))
+        >>>
+        >>> route = Route('name', 'url_part')
+        >>> route.get_url_regexs_names()
+        [('^url_part$', 'name')]
+        >>> route.url_cache.save()
+        >>>
+        >>> Route.url_cache = URLCache(Route.url_cache.path)
+        >>> Route.get_url_regexs = None  # not called anymore
+        >>> route.get_url_regexs_names()
+        [('^url_part$', 'name')]
+        >>> Route.url_cache.hits
+        1
+        >>>
+        >>> directory.cleanup()
+
+        """
+        url_cache = self.url_cache
+        if url_cache is not None:
+            key = get_fingerprint(self.get_url_cache_fingerprint())
+            cached = url_cache.get(key)
+            if cached is not None:
+                return [tuple(regex_name) for regex_name in cached]
+
+        regexs_names = list(product(
             self.get_url_regexs(),
             self.get_url_names()
-        )
+        ))
 
-        for regex, name in regexs_names:
-                yield url(
-                    regex,
-                    callback,
-                    name=name
-                )
+        if url_cache is not None:
+            url_cache.set(key, [list(regex_name)
+                                for regex_name in regexs_names])
+        return regexs_names
+
+    def get_url_cache_fingerprint(self):
+        """Yield the parts of the route configuration used to generate the
+        URL regexs and names, used to make the fingerprint of the route
+        in the URL cache (see :func:`get_url_regexs_names`).
+
+        Subclasses or mixins that use other attributes to generate
+        URL regexs or names should override this method (calling the
+        super implementation) to add these attributes.
+
+        :returns: Fingerprint parts
+        :rtype: iterable of 2-tuple
+
+        >>> class Route(BaseRoute):
+        ...   def get_callback(self):
+        ...    pass
+        >>>
+        >>> route = Route('name', 'url_part')
+        >>> list(route.get_url_cache_fingerprint())
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [('class', 'django_crucrudile.routes.base.Route'),
+         ('name', 'name'),
+         ('url_part', 'url_part'),
+         ('url_builders', (('/', '/?', True),
+                           ('-', '/?', True),
+                           ('/', '/?', True)))]
+
+        """
+        yield 'class', get_class_path(type(self))
+        yield 'name', self.name
+        yield 'url_part', self.url_part
+        yield 'url_builders', tuple(
+            (builder.separator,
+             builder.opt_separator,
+             builder.required_default)
+            for builder in self.get_url_builders()
+        )
 
     @abstractmethod
     def get_callback(self):  # pragma: no cover
@@ -255,6 +422,30 @@ class BaseRoute(Entity):
         """
         yield self.get_url_part()
 
+    def get_url_builders(self):
+        """Return the empty URL builders used to make the URL
+        specifications (see :func:`get_url_specs`), whose separators
+        are also used in the URL cache fingerprint (see
+        :func:`get_url_cache_fingerprint`).
+
+        :returns: ``prefix``, ``name`` and ``suffix`` URL builders
+        :rtype: 3-tuple of :class:`django_crucrudile.urlutils.URLBuilder`
+
+        >>> class Route(BaseRoute):
+        ...   def get_callback(self):
+        ...    pass
+        >>>
+        >>> [builder.separator
+        ...  for builder in Route('name').get_url_builders()]
+        ['/', '-', '/']
+
+        """
+        return (
+            URLBuilder(None, '/'),
+            URLBuilder(None, '-'),
+            URLBuilder(None, '/', '/?'),
+        )
+
     def get_url_specs(self):
         """Yield URL specifications. An URL specification is a 3-tuple,
         containing 3 :class:`django_crucrudile.urlutils.URLBuilder` instances :
@@ -290,9 +481,7 @@ class BaseRoute(Entity):
         [([], ['url_part'], [])]
 
         """
-        prefix = URLBuilder(None, '/')
-        name = URLBuilder(None, '-')
-        suffix = URLBuilder(None, '/', '/?')
+        prefix, name, suffix = self.get_url_builders()
 
         for part in self.get_url_parts():
             if part is not None:
@@ -339,11 +528,20 @@ class BaseRoute(Entity):
         ['^url_part$']
 
         """
-        for prefix, name, suffix in self.get_url_specs():
-            _prefix, _name, _suffix = (
-                part_list()
-                for part_list in (prefix, name, suffix)
+        # get the compiled URL builders once, rather than for each URL
+        # specification (the URL specifications are made from the URL
+        # builders returned by get_url_builders)
+        builds = [
+            builder.get_compiled_builder()
+            for builder in self.get_url_builders()
+        ]
+        join = URLBuilder().get_compiled_builder()
+        for spec in self.get_url_specs():
+            parts = [
+                part_list() if build is None else build(part_list)
+                for build, part_list in zip(builds, spec)
+            ]
+            required, built = (
+                URLBuilder(parts)() if join is None else join(parts)
             )
-            builder = URLBuilder([_prefix, _name, _suffix])
-            required, built = builder()
             yield '^{}$'.format(built)
@@ -3,9 +3,41 @@ uses :class:`parser.ArgumentsParser` to create a list of argument
 combinations from the given argument list."""
 
 
-from .parser import ArgumentsParser
+from functools import wraps
 
-__all__ = ["ArgumentsMixin", "ArgumentsParser"]
+from django_crucrudile.cache import get_class_path
+
+from .parser import (
+    ArgumentsParser, FoldingArgumentsParser, combination_cache
+)
+
+__all__ = ["ArgumentsMixin", "ArgumentsParser", "FoldingArgumentsParser"]
+
+
+def drop_none_kwargs(callback):
+    """Wrap a view callback, so that the keyword arguments whose value is
+    ``None`` (the named groups that did not participate in the URL
+    match, for example in an alternation) are not passed to the
+    callback
+
+    :argument callback: View callback
+    :type callback: callable
+
+    :returns: Wrapped callback
+    :rtype: callable
+
+    >>> callback = drop_none_kwargs(lambda request, **kwargs: kwargs)
+    >>> callback(None, pk=None, slug='slug')
+    {'slug': 'slug'}
+
+    """
+    @wraps(callback)
+    def view(request, *args, **kwargs):
+        return callback(request, *args, **{
+            key: value for key, value in kwargs.items()
+            if value is not None
+        })
+    return view
 
 
 class ArgumentsMixin:
@@ -46,13 +78,51 @@ class ArgumentsMixin:
     :type arguments_parser: subclass of
                             :class:`django_crucrudile.urlutils.Parsable`
     """
+    patterns_attributes = (
+        'arguments_spec',
+        'arguments_parser',
+        'max_argument_combinations',
+    )
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
+    """
+    arguments_cache = combination_cache
+    """
+    :attribute arguments_cache: Argument combination cache, used to
+                                share the argument combinations
+                                between the routes with identical
+                                argument specifications (see
+                                :class:`parser.CombinationCache`). If
+                                ``None``, the arguments parser is
+                                always run.
+    :type arguments_cache: :class:`parser.CombinationCache`
+    """
+    max_argument_combinations = None
+    """
+    :attribute max_argument_combinations: If defined, maximum number of
+                                          argument combinations that
+                                          the argument specifications
+                                          can build (see
+                                          :func:`check_argument_combinations`).
+                                          If not defined, the budget
+                                          of the router the route is
+                                          registered in is used (see
+                                          :attr:`django_crucrudile.routers.Router.max_argument_combinations`).
+    :type max_argument_combinations: int
+    """
     def __init__(self, *args,
                  arguments_spec=None,
+                 max_argument_combinations=None,
                  **kwargs):
-        """Initialize route, set arguments specification if given, and run
-        arguments parser.
+        """Initialize route, set arguments specification if given. The
+        arguments parser is run when the argument combination list is
+        first needed (see :attr:`arguments`).
 
         :argument arguments_spec: See :attr:`arguments_spec`
+        :argument max_argument_combinations: See
+                                             :attr:`max_argument_combinations`
 
         Example with the default test parser
         (:class:`parser.ArgumentsParser`) used with
@@ -82,12 +152,79 @@ class ArgumentsMixin:
             self.arguments_spec = arguments_spec
         if self.arguments_spec is None:
             self.arguments_spec = []
-
-        parser = self.arguments_parser(self.get_arguments_spec())
-        self.arguments = parser()
+        if max_argument_combinations is not None:
+            self.max_argument_combinations = max_argument_combinations
 
         super().__init__(*args, **kwargs)
 
+    @property
+    def arguments(self):
+        """Argument combination list, built (on first access) by running
+        the arguments parser (:attr:`arguments_parser`) with the
+        argument specifications (from :func:`get_arguments_spec`), or
+        read from the argument combination cache
+        (:attr:`arguments_cache`), in which case it is a tuple shared
+        with the other routes that have the same argument
+        specifications.
+
+        Setting the argument combination list invalidates the patterns
+        cache (see
+        :func:`django_crucrudile.entities.Entity.patterns_changed`).
+
+        The argument combination list is not built if the URL regexs
+        are read from the URL cache (see
+        :func:`django_crucrudile.routes.base.BaseRoute.get_url_regexs_names`),
+        or if the number of combinations exceeds
+        :attr:`max_argument_combinations` (see
+        :func:`check_argument_combinations`).
+
+        :returns: Argument combinations
+        :rtype: list
+
+        >>> from django_crucrudile.routes.base import BaseRoute
+        >>>
+        >>> class ArgumentsRoute(ArgumentsMixin, BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> route = ArgumentsRoute('name', arguments_spec=['<arg>'])
+        >>> '_arguments' in route.__dict__
+        False
+        >>> route.arguments
+        ((True, '<arg>'),)
+        >>> route.arguments is ArgumentsRoute(
+        ...   'other', arguments_spec=['<arg>']
+        ... ).arguments
+        True
+        >>>
+        >>> route.arguments = [(True, '<other>')]
+        >>> route.arguments
+        [(True, '<other>')]
+        >>>
+        >>> [pattern.regex.pattern for pattern in route.patterns()]
+        ['^name/<other>$']
+        >>> route.arguments = [(True, '<new>')]
+        >>> [pattern.regex.pattern for pattern in route.patterns()]
+        ['^name/<new>$']
+
+        """
+        try:
+            return self.__dict__['_arguments']
+        except KeyError:
+            self.check_argument_combinations()
+            parser = self.arguments_parser(self.get_arguments_spec())
+            if self.arguments_cache is not None:
+                arguments = self.arguments_cache.parse(parser)
+            else:
+                arguments = parser()
+            self._arguments = arguments
+            return arguments
+
+    @arguments.setter
+    def arguments(self, value):
+        self._arguments = value
+        self.patterns_changed()
+
     def get_arguments_spec(self):
         """Yield argument specifications. By default, return specifications
         from :attr:`arguments_spec`. Subclasses or mixins may override this
@@ -103,6 +240,168 @@ class ArgumentsMixin:
         for spec in self.arguments_spec:
             yield spec
 
+    def count_argument_combinations(self):
+        """Return the number of argument combinations the arguments parser
+        (:attr:`arguments_parser`) would build from the argument
+        specifications, without building them (see
+        :func:`parser.ArgumentsParser.count_combinations`).
+
+        :returns: Combination count, or ``None`` if the arguments
+                  parser can't count its combinations
+        :rtype: int
+
+        >>> from django_crucrudile.routes.base import BaseRoute
+        >>>
+        >>> class ArgumentsRoute(ArgumentsMixin, BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> route = ArgumentsRoute('name', arguments_spec=[
+        ...   ['<arg1.1>', '<arg1.2>'], ['<arg2.1>', '<arg2.2>']
+        ... ])
+        >>> route.count_argument_combinations()
+        4
+        >>> '_arguments' in route.__dict__
+        False
+
+        """
+        if '_arguments' in self.__dict__:
+            return len(self.__dict__['_arguments'])
+        parser = self.arguments_parser(self.get_arguments_spec())
+        count_combinations = getattr(parser, 'count_combinations', None)
+        if count_combinations is None:
+            return None
+        return count_combinations()
+
+    def check_argument_combinations(self, max_combinations=None):
+        """Check that the number of argument combinations (see
+        :func:`count_argument_combinations`) does not exceed
+        :attr:`max_argument_combinations` (or ``max_combinations``, if
+        :attr:`max_argument_combinations` is not defined).
+
+        Called before building the argument combinations (see
+        :attr:`arguments`), and by
+        :func:`django_crucrudile.routers.Router.add_to_store` when the
+        route gets registered.
+
+        :argument max_combinations: Budget to use if
+                                    :attr:`max_argument_combinations`
+                                    is not defined
+        :type max_combinations: int
+
+        :returns: Combination count, or ``None`` if there is no
+                  budget (or if it can't be computed)
+        :rtype: int
+
+        :raise ValueError: If the number of argument combinations
+                           exceeds the budget
+
+        >>> from django_crucrudile.routes.base import BaseRoute
+        >>>
+        >>> class ArgumentsRoute(ArgumentsMixin, BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> route = ArgumentsRoute(
+        ...   'name', arguments_spec=[['<arg1.1>', '<arg1.2>']] * 20,
+        ...   max_argument_combinations=1000
+        ... )
+        >>> route.check_argument_combinations()
+        ... # doctest: +NORMALIZE_WHITESPACE
+        Traceback (most recent call last):
+          ...
+        ValueError: Argument specifications of route 'name'
+        (ArgumentsRoute) would build 1048576 argument combinations,
+        more than the budget (1000). Reduce the argument choices, use
+        a folding arguments parser (FoldingArgumentsParser) or
+        increase max_argument_combinations.
+        >>> route.arguments  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+          ...
+        ValueError: Argument specifications of route 'name' ...
+        >>>
+        >>> route.max_argument_combinations = None
+        >>> route.check_argument_combinations() is None
+        True
+        >>> route.check_argument_combinations(2000000)
+        1048576
+
+        """
+        if self.max_argument_combinations is not None:
+            max_combinations = self.max_argument_combinations
+        if max_combinations is None:
+            return None
+        count = self.count_argument_combinations()
+        if count is not None and count > max_combinations:
+            raise ValueError(
+                "Argument specifications of route '{}' ({}) would build "
+                "{} argument combinations, more than the budget ({}). "
+                "Reduce the argument choices, use a folding arguments "
+                "parser (FoldingArgumentsParser) or increase "
+                "max_argument_combinations.".format(
+                    getattr(self, 'name', None),
+                    self.__class__.__name__,
+                    count,
+                    max_combinations
+                )
+            )
+        return count
+
+    def get_drop_none_kwargs(self):
+        """Return ``True`` if the callback should be wrapped using
+        :func:`drop_none_kwargs` (see :func:`get_callback`) : when the
+        arguments parser is a :class:`parser.FoldingArgumentsParser`
+        subclass, as the named groups of the alternation branches and
+        of the optional groups that did not participate in the URL
+        match are passed as ``None``.
+
+        :returns: ``True`` if the callback should be wrapped
+        :rtype: bool
+
+        >>> from django_crucrudile.routes.base import BaseRoute
+        >>>
+        >>> class ArgumentsRoute(ArgumentsMixin, BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> route = ArgumentsRoute('name')
+        >>> route.get_drop_none_kwargs()
+        False
+        >>> route.arguments_parser = FoldingArgumentsParser
+        >>> route.get_drop_none_kwargs()
+        True
+
+        """
+        parser = self.arguments_parser
+        return (
+            isinstance(parser, type) and
+            issubclass(parser, FoldingArgumentsParser)
+        )
+
+    def get_callback(self):
+        """Wrap the callback returned by the super implementation using
+        :func:`drop_none_kwargs`, if needed (see
+        :func:`get_drop_none_kwargs`).
+
+        :returns: View callback
+        :rtype: callable
+
+        >>> from django_crucrudile.routes import CallbackRoute
+        >>>
+        >>> route = CallbackRoute(
+        ...   name='name', callback=lambda request, **kwargs: kwargs,
+        ...   arguments_spec=[['(?P<pk>[0-9]+)', '(?P<slug>[a-z-]+)']]
+        ... )
+        >>> route.arguments_parser = FoldingArgumentsParser
+        >>> route.get_callback()(None, pk=None, slug='slug')
+        {'slug': 'slug'}
+
+        """
+        callback = super().get_callback()
+        if self.get_drop_none_kwargs():
+            return drop_none_kwargs(callback)
+        return callback
+
     def get_url_specs(self):
         """Yield another URL specification for each argument in the argument
         combination list (arguments parser output).
@@ -143,3 +442,40 @@ class ArgumentsMixin:
                     yield prefix, name, suffix + [arg]
             else:
                 yield prefix, name, suffix
+
+    def get_url_cache_fingerprint(self):
+        """Add the arguments parser, its separators and the argument
+        specifications to the URL cache fingerprint parts returned by
+        the super implementation (see
+        :func:`django_crucrudile.routes.base.BaseRoute.get_url_cache_fingerprint`)
+
+        :returns: Fingerprint parts
+        :rtype: iterable of 2-tuple
+
+        >>> from django_crucrudile.routes.base import BaseRoute
+        >>>
+        >>> class ArgumentsRoute(ArgumentsMixin, BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> route = ArgumentsRoute('name', arguments_spec=['<arg>'])
+        >>> list(route.get_url_cache_fingerprint())[-3:]
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [('arguments_parser',
+          'django_crucrudile.routes.mixins.arguments.parser.ArgumentsParser'),
+         ('separators', ('/', '/?', True)),
+         ('arguments_spec', ['<arg>'])]
+
+        """
+        yield from super().get_url_cache_fingerprint()
+        parser = self.arguments_parser
+        yield 'arguments_parser', (
+            get_class_path(parser) if isinstance(parser, type)
+            else repr(parser)
+        )
+        yield 'separators', (
+            getattr(parser, 'separator', None),
+            getattr(parser, 'opt_separator', None),
+            getattr(parser, 'required_default', None),
+        )
+        yield 'arguments_spec', list(self.get_arguments_spec())
@@ -7,13 +7,26 @@ The :func:`combine` function is used by the cartesian product in
 (filtering out its items that evaluate to ``None``) using a given
 separator.
 
+This module also contains :class:`FoldingArgumentsParser`, that folds
+the argument combinations in a single regex (instead of one
+combination for each item of the cartesian product), and the
+process-wide argument combination cache (:data:`combination_cache`,
+see :class:`CombinationCache`), used so that routes with identical
+argument specifications share their argument combinations.
+
 """
+import re
 from functools import partial, reduce
 from itertools import product
+from operator import mul
+from threading import RLock
 
 from django_crucrudile.urlutils import OptionalPartList
 
 
+GROUP_NAME_RE = re.compile(r'\(\?P<(\w+)>')
+
+
 def combine(iterable, separator):
     """Join ``iterable`` (filtering out its items that evaluate to
     ``Ǹone``) using ``separator``
@@ -231,3 +244,416 @@ class ArgumentsParser(OptionalPartList):
 
         """
         return list(items)
+
+    @staticmethod
+    def get_choice_count(args):
+        """Return the number of combinations built for an argument choice
+        list (used by :func:`count_combinations`)
+
+        :argument args: Argument choice list
+        :type args: list of str
+
+        :returns: Combination count
+        :rtype: int
+
+        >>> ArgumentsParser.get_choice_count(['<arg1>', '<arg2>'])
+        2
+
+        """
+        return len(args)
+
+    def normalize_spec(self):
+        """Return the argument specifications, normalized as 2-tuples
+        containing the required flag and the argument choice list (as
+        done by the parsers, before building the combinations).
+
+        :returns: Normalized argument specifications
+        :rtype: list of 2-tuple : [(bool, list(str))]
+
+        >>> ArgumentsParser(
+        ...   ['<arg1>', (False, '<arg2>'), ['<arg3.1>', '<arg3.2>']]
+        ... ).normalize_spec()
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [(True, ['<arg1>']),
+         (False, ['<arg2>']),
+         (True, ['<arg3.1>', '<arg3.2>'])]
+
+        """
+        return list(self.transform_args_to_list(
+            self.apply_required_default(
+                self.transform_to_tuple(self),
+                default=self.required_default
+            )
+        ))
+
+    def get_cache_key(self):
+        """Return the key of the argument combinations in the argument
+        combination cache (see :class:`CombinationCache`), made of
+        the parser class, the separators and the normalized argument
+        specifications (see :func:`normalize_spec`).
+
+        :returns: Cache key
+        :rtype: tuple
+
+        >>> ArgumentsParser(['<arg>']).get_cache_key() == (
+        ...   ArgumentsParser([(True, ['<arg>'])]).get_cache_key()
+        ... )
+        True
+        >>> ArgumentsParser(['<arg>']).get_cache_key() == (
+        ...   ArgumentsParser(['<arg>'], separator='-').get_cache_key()
+        ... )
+        False
+
+        """
+        return (
+            self.__class__,
+            self.separator,
+            self.opt_separator,
+            self.required_default,
+            tuple(
+                (required, tuple(args))
+                for required, args in self.normalize_spec()
+            )
+        )
+
+    def count_combinations(self):
+        """Return the number of argument combinations that the parser
+        would build, without building them (the argument
+        specifications are read, but the cartesian product is not
+        computed).
+
+        :returns: Combination count
+        :rtype: int
+
+        >>> parser = ArgumentsParser([
+        ...     ["<arg1.1>", "<arg1.2>"],
+        ...     "<arg2>",
+        ...     (False, ["<arg3.1>", "<arg3.2>", "<arg3.3>"]),
+        ... ])
+        >>> parser.count_combinations()
+        6
+        >>> parser.count_combinations() == len(parser())
+        True
+        >>> ArgumentsParser([]).count_combinations()
+        0
+        >>> ArgumentsParser([[]]).count_combinations()
+        0
+
+        """
+        items = self.normalize_spec()
+        if not items:
+            return 0
+        return reduce(
+            mul,
+            (self.get_choice_count(args) for _, args in items),
+            1
+        )
+
+
+class FoldingArgumentsParser(ArgumentsParser):
+    """This parser reads the same argument specifications as
+    :class:`ArgumentsParser`, but folds the argument combinations in a
+    single regex, instead of building one combination for each item
+    of the cartesian product (see :func:`fold`) :
+
+    - argument choice lists are folded using an alternation
+      (``(?:<arg1>|<arg2>)``)
+    - optional argument specifications (and their separator) are
+      wrapped in an optional non-capturing group, so that they can
+      also be omitted (except the first one, whose separator is added
+      by :class:`django_crucrudile.urlutils.URLBuilder`)
+
+    Routes using this parser thus yield a single URL pattern, instead
+    of one URL pattern for each combination (see
+    :func:`get_pattern_count_reduction`).
+
+    .. inheritance-diagram:: FoldingArgumentsParser
+
+    .. warning::
+
+       Django (1.6) can't reverse URL patterns that contain
+       alternations : use
+       :func:`django_crucrudile.routers.Router.reverse` to reverse the
+       URLs of routes using this parser.
+
+    >>> parser = FoldingArgumentsParser([
+    ...     ["<arg1.1>", "<arg2.2>"],
+    ...     "<arg3>",
+    ...     (False, ["<arg4.1>", "<arg4.2>"]),
+    ...     (True, ["<args5>"])
+    ... ])
+    >>>
+    >>> (required, pattern), = parser()
+    >>> required
+    True
+    >>> pattern
+    '(?:<arg1.1>|<arg2.2>)/<arg3>(?:/?(?:<arg4.1>|<arg4.2>))?/<args5>'
+    >>> FoldingArgumentsParser([])()
+    []
+
+    """
+    def get_parsers(self):
+        """Replace :func:`ArgumentsParser.cartesian_product` by :func:`fold`
+        in the parsers from :func:`ArgumentsParser.get_parsers`.
+
+        :returns: Argument parsers list
+        :rtype: list of callable
+
+        """
+        return [
+            partial(self.fold, get_separator=self.get_separator)
+            if getattr(parser, 'func', None) is self.cartesian_product
+            else parser
+            for parser in super().get_parsers()
+        ]
+
+    @staticmethod
+    def fold_choices(args):
+        """Fold an argument choice list in a single choice, using an
+        alternation. If several choices use the same group name
+        (Python regexs don't allow that), the choice list is returned
+        unchanged (and the choices will be combined using a cartesian
+        product).
+
+        :argument args: Argument choice list
+        :type args: list of str
+
+        :returns: Folded choice list
+        :rtype: list of str
+
+        >>> FoldingArgumentsParser.fold_choices(['<arg>'])
+        ['<arg>']
+        >>> FoldingArgumentsParser.fold_choices(['<arg1>', '<arg2>'])
+        ['(?:<arg1>|<arg2>)']
+        >>> FoldingArgumentsParser.fold_choices(
+        ...   ['(?P<pk>[0-9]+)', '(?P<pk>[a-z]+)']
+        ... )
+        ['(?P<pk>[0-9]+)', '(?P<pk>[a-z]+)']
+
+        """
+        if len(args) < 2:
+            return list(args)
+        names = [
+            name for arg in args
+            for name in GROUP_NAME_RE.findall(arg)
+        ]
+        if len(set(names)) != len(names):
+            return list(args)
+        return ['(?:{})'.format('|'.join(args))]
+
+    @classmethod
+    def fold(cls, items, get_separator):
+        """Fold the argument lists in ``items`` in a single combination
+        (see :func:`fold_choices`), wrapping the optional argument
+        lists (except the first one) in an optional non-capturing
+        group.
+
+        :argument items: List of tuple to transform (2-tuple with a
+                         flag indicating if the argument specification
+                         is required, and the argument choice list)
+        :type items: iterable of 2-tuple
+
+        :returns: List of 2-tuple, with a flag indicating if the first
+                  item is required, and the folded combination.
+        :rtype: iterable of 2-tuple : [(bool, str)]
+
+        >>> get_separator = lambda x: '/' if x else '/?'
+        >>>
+        >>> list(FoldingArgumentsParser.fold(
+        ...   [
+        ...     (False, ['<arg1>']),
+        ...     (True, ['<arg2>', '<arg3>']),
+        ...     (False, ['<arg4>'])
+        ...   ],
+        ...   get_separator=get_separator
+        ... ))
+        [(False, '<arg1>/(?:<arg2>|<arg3>)(?:/?<arg4>)?')]
+
+        """
+        combs = ['']
+        first_item_required = None
+
+        for required, args in items:
+            choices = cls.fold_choices(args)
+            if first_item_required is None:
+                # the separator in front of the first item is added
+                # by the URL builder, using the returned flag
+                first_item_required = required
+            else:
+                separator = get_separator(required)
+                choices = [separator + choice for choice in choices]
+                if not required:
+                    choices = [
+                        '(?:{})?'.format(choice) for choice in choices
+                    ]
+
+            combs = [comb + choice for comb in combs for choice in choices]
+
+        if first_item_required is not None:
+            for comb in combs:
+                yield first_item_required, comb
+
+    @classmethod
+    def get_choice_count(cls, args):
+        """Return the number of combinations built for an argument choice
+        list, once folded (see :func:`fold_choices`)
+
+        :argument args: Argument choice list
+        :type args: list of str
+
+        :returns: Combination count
+        :rtype: int
+
+        >>> FoldingArgumentsParser.get_choice_count(['<arg1>', '<arg2>'])
+        1
+
+        """
+        return len(cls.fold_choices(args))
+
+    def get_pattern_count_reduction(self):
+        """Return the number of argument combinations built by
+        :class:`ArgumentsParser` (with the same argument specifications
+        and separators), and by this parser (computed using
+        :func:`ArgumentsParser.count_combinations`, without building
+        the combinations).
+
+        :returns: Combination counts (``expanded`` and ``folded``), and
+                  their difference (``reduction``)
+        :rtype: dict
+
+        >>> parser = FoldingArgumentsParser([
+        ...     ["<arg1.1>", "<arg1.2>"],
+        ...     (False, ["<arg2.1>", "<arg2.2>", "<arg2.3>"]),
+        ... ])
+        >>> sorted(parser.get_pattern_count_reduction().items())
+        [('expanded', 6), ('folded', 1), ('reduction', 5)]
+
+        """
+        expanded = ArgumentsParser(
+            self,
+            separator=self.separator,
+            opt_separator=self.opt_separator,
+            required_default=self.required_default
+        ).count_combinations()
+        folded = self.count_combinations()
+        return {
+            'expanded': expanded,
+            'folded': folded,
+            'reduction': expanded - folded,
+        }
+
+
+class CombinationCache:
+    """Process-wide cache of argument combinations, indexed by the cache
+    key of the arguments parser (see
+    :func:`ArgumentsParser.get_cache_key`), so that the argument
+    specifications shared by several routes are only parsed once.
+
+    The argument combinations are stored (and returned) as tuples,
+    shared by the routes that use them.
+
+    .. inheritance-diagram:: CombinationCache
+
+    >>> cache = CombinationCache()
+    >>> first = cache.parse(ArgumentsParser([['<arg1>', '<arg2>']]))
+    >>> first
+    ((True, '<arg1>'), (True, '<arg2>'))
+    >>> cache.parse(ArgumentsParser([(True, ['<arg1>', '<arg2>'])])) is first
+    True
+    >>> sorted(cache.cache_info().items())
+    [('currsize', 1), ('hits', 1), ('misses', 1)]
+
+    Parsers without cache key (or whose cache key is not hashable)
+    are called directly :
+
+    >>> cache.parse(lambda: ['<arg>'])
+    ['<arg>']
+    >>> class Parser:
+    ...   def get_cache_key(self):
+    ...     return ['<arg>']
+    ...   def __call__(self):
+    ...     return ['<arg>']
+    >>> cache.parse(Parser())
+    ['<arg>']
+    >>> cache.misses
+    1
+
+    """
+    def __init__(self):
+        """Initialize argument combination cache"""
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = RLock()
+
+    @staticmethod
+    def get_key(parser):
+        """Return the cache key of ``parser``
+
+        :argument parser: Arguments parser
+        :type parser: callable
+
+        :returns: Cache key, or ``None`` if the parser has no
+                  (hashable) cache key
+        :rtype: tuple
+        """
+        get_cache_key = getattr(parser, 'get_cache_key', None)
+        if get_cache_key is None:
+            return None
+        key = get_cache_key()
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def parse(self, parser):
+        """Return the argument combinations built by ``parser``, from the
+        cache if they were already built by an identical parser.
+
+        :argument parser: Arguments parser
+        :type parser: callable
+
+        :returns: Argument combinations (a tuple, if they are cached)
+        :rtype: tuple
+        """
+        key = self.get_key(parser)
+        if key is None:
+            return parser()
+        with self._lock:
+            combinations = self._entries.get(key)
+            if combinations is not None:
+                self.hits += 1
+                return combinations
+        combinations = tuple(parser())
+        with self._lock:
+            self.misses += 1
+            return self._entries.setdefault(key, combinations)
+
+    def cache_info(self):
+        """Return the cache statistics (hits are the parses that were
+        saved)
+
+        :returns: Number of hits and misses, and current size
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'currsize': len(self._entries),
+            }
+
+    def cache_clear(self):
+        """Clear the cache, and its statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+combination_cache = CombinationCache()
+"""
+:data combination_cache: Process-wide argument combination cache, used
+                         by default in
+                         :class:`django_crucrudile.routes.mixins.arguments.ArgumentsMixin`
+"""
@@ -16,6 +16,12 @@ class CallbackMixin:
 
     .. inheritance-diagram:: CallbackMixin
 
+    """
+    patterns_attributes = ('callback',)
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
     """
     callback = None
     """
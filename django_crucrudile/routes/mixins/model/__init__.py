@@ -27,6 +27,12 @@ class ModelMixin:
     :attribute model: Model to use on the Route
     :type model: :class:`django.db.models.Model`
     """
+    patterns_attributes = ('model', 'prefix_url_part')
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
+    """
     prefix_url_part = False
     """
     :attribute prefix_url_part: Prefix the URL part with the model
@@ -179,3 +185,43 @@ class ModelMixin:
 
         """
         return "{}-{}".format(self.model_url_name, self.name)
+
+    def get_url_cache_fingerprint(self):
+        """Add the model (application label and model name), the model URL
+        name and part (see :func:`model_url_name` and
+        :func:`model_url_part`, that may be overridden) and
+        :attr:`prefix_url_part` to the URL cache fingerprint parts
+        returned by the super implementation (see
+        :func:`django_crucrudile.routes.base.BaseRoute.get_url_cache_fingerprint`)
+
+        :returns: Fingerprint parts
+        :rtype: iterable of 2-tuple
+
+        >>> from django_crucrudile.routes.base import BaseRoute
+        >>> from mock import Mock
+        >>>
+        >>> class ModelRoute(ModelMixin, BaseRoute):
+        ...   def get_callback(self):
+        ...     pass
+        >>>
+        >>> model = Mock()
+        >>> model._meta.app_label = 'testapp'
+        >>> model._meta.model_name = 'testmodel'
+        >>> route = ModelRoute(model=model, name='routename')
+        >>>
+        >>> list(route.get_url_cache_fingerprint())[-4:]
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [('model', 'testapp.testmodel'),
+         ('model_url_name', 'testmodel'),
+         ('model_url_part', 'testmodel'),
+         ('prefix_url_part', False)]
+
+        """
+        yield from super().get_url_cache_fingerprint()
+        yield 'model', '{}.{}'.format(
+            self.model._meta.app_label,
+            self.model._meta.model_name
+        )
+        yield 'model_url_name', self.model_url_name
+        yield 'model_url_part', self.model_url_part
+        yield 'prefix_url_part', self.prefix_url_part
@@ -8,6 +8,8 @@ from django.views.generic import (
     DetailView, UpdateView, DeleteView
 )
 
+from django_crucrudile.resolvers import ReverseOnlyURLPattern
+
 
 class GenericViewArgsMixin:
     """This route mixin, that should be used with
@@ -15,6 +17,41 @@ class GenericViewArgsMixin:
     :class:`django_crucrudile.routes.mixins.view.ViewMixin`,
     enables automatic URL arguments for Django generic views.
 
+    """
+    patterns_attributes = ('collapse_view_arguments', 'object_arguments')
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
+    """
+    collapse_view_arguments = False
+    """
+    :attribute collapse_view_arguments: If ``True``, the object URL
+                                        arguments (``pk`` or
+                                        ``slug``) are matched by a
+                                        single URL pattern (using an
+                                        alternation), instead of one
+                                        URL pattern for each argument
+                                        (see
+                                        :func:`get_view_arguments`).
+                                        The callback is wrapped using
+                                        :func:`django_crucrudile.routes.mixins.arguments.drop_none_kwargs`.
+    :type collapse_view_arguments: bool
+
+    .. note::
+
+       Django (1.6) can't reverse URL patterns that contain
+       alternations : reverse-only URL patterns, one for each object
+       URL argument, are added after the collapsed URL patterns (see
+       :func:`make_patterns`).
+
+    """
+    object_arguments = [r"(?P<pk>\d+)", r"(?P<slug>[\w-]+)"]
+    """
+    :attribute object_arguments: URL arguments of the object, for the
+                                 generic views that require one (one of
+                                 them is used)
+    :type object_arguments: list of str
     """
     def get_view_arguments(self):
         """Return URL arguments if the view class is a Django generic view
@@ -23,12 +60,97 @@ class GenericViewArgsMixin:
         :returns: View argument specification
         :rtype: iterable
 
+        >>> class Route(GenericViewArgsMixin):
+        ...   view_class = DetailView
+        >>>
+        >>> route = Route()
+        >>> list(route.get_view_arguments())
+        [['(?P<pk>\\\\d+)', '(?P<slug>[\\\\w-]+)']]
+        >>>
+        >>> route.collapse_view_arguments = True
+        >>> list(route.get_view_arguments())
+        ['(?:(?P<pk>\\\\d+)|(?P<slug>[\\\\w-]+))']
+
         """
         if issubclass(
                 self.view_class,
                 (DetailView, UpdateView, DeleteView)
         ):
-            yield [r"(?P<pk>\d+)", r"(?P<slug>[\w-]+)"]
+            arguments = list(self.object_arguments)
+            if self.collapse_view_arguments:
+                yield self.get_collapsed_view_argument()
+            else:
+                yield arguments
+
+    def get_collapsed_view_argument(self):
+        """Return the URL argument matching any of the object URL arguments
+        (see :attr:`object_arguments`), used if
+        :attr:`collapse_view_arguments` is ``True``.
+
+        :returns: URL argument
+        :rtype: str
+
+        >>> GenericViewArgsMixin().get_collapsed_view_argument()
+        '(?:(?P<pk>\\\\d+)|(?P<slug>[\\\\w-]+))'
+
+        """
+        return "(?:{})".format("|".join(self.object_arguments))
+
+    def make_patterns(self):
+        """Yield the URL patterns built by the super implementation. If
+        :attr:`collapse_view_arguments` is ``True``, also yield, after
+        them, a reverse-only URL pattern (see
+        :class:`django_crucrudile.resolvers.ReverseOnlyURLPattern`) for
+        each object URL argument (see :attr:`object_arguments`) in each
+        collapsed URL pattern, so that Django's
+        :func:`django.core.urlresolvers.reverse` can reverse their URLs.
+
+        :returns: Django URL patterns
+        :rtype: iterable of ``RegexURLPattern``
+
+        >>> # these two lines are required to subclass Django model in doctests
+        >>> import tests.unit
+        >>> __name__ = "tests.doctests"
+        >>> from django.db.models import Model
+        >>> from django.core.urlresolvers import RegexURLResolver
+        >>> from django_crucrudile.routes import GenericModelViewRoute
+        >>>
+        >>> class TestModel(Model):
+        ...   pass
+        >>>
+        >>> route = GenericModelViewRoute(model=TestModel,
+        ...                               view_class=DetailView)
+        >>> route.collapse_view_arguments = True
+        >>> patterns = list(route.make_patterns())
+        >>> patterns  # doctest: +NORMALIZE_WHITESPACE
+        [<RegexURLPattern testmodel-detail
+          ^detail/(?:(?P<pk>\\d+)|(?P<slug>[\\w-]+))$>,
+         <ReverseOnlyURLPattern testmodel-detail ^detail/(?P<pk>\\d+)$>,
+         <ReverseOnlyURLPattern testmodel-detail ^detail/(?P<slug>[\\w-]+)$>]
+        >>>
+        >>> resolver = RegexURLResolver('^', patterns)
+        >>> resolver.reverse('testmodel-detail', slug='slug')
+        'detail/slug'
+        >>> resolver.resolve('detail/slug').kwargs
+        {'pk': None, 'slug': 'slug'}
+
+        """
+        patterns = list(super().make_patterns())
+        yield from patterns
+        if not self.collapse_view_arguments:
+            return
+        collapsed = self.get_collapsed_view_argument()
+        for pattern in patterns:
+            regex = pattern.regex.pattern
+            if collapsed not in regex:
+                continue
+            for argument in self.object_arguments:
+                yield ReverseOnlyURLPattern(
+                    regex.replace(collapsed, argument),
+                    pattern.callback,
+                    pattern.default_args,
+                    pattern.name
+                )
 
     def get_arguments_spec(self):
         """Add view arguments (returned by :func:`get_view_arguments`) to the
@@ -42,3 +164,18 @@ class GenericViewArgsMixin:
             super().get_arguments_spec(),
             self.get_view_arguments()
         )
+
+    def get_drop_none_kwargs(self):
+        """Also drop the ``None`` keyword arguments if
+        :attr:`collapse_view_arguments` is ``True`` (as the named group
+        of the argument that was not used is then passed as ``None``,
+        see
+        :func:`django_crucrudile.routes.mixins.arguments.ArgumentsMixin.get_drop_none_kwargs`).
+
+        :returns: ``True`` if the callback should be wrapped
+        :rtype: bool
+        """
+        return (
+            self.collapse_view_arguments or
+            super().get_drop_none_kwargs()
+        )
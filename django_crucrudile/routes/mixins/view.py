@@ -2,6 +2,7 @@
 implements :class:`django_crucrudile.routes.base.BaseRoute`.
 
 """
+from weakref import WeakValueDictionary
 
 
 class ViewMixin:
@@ -65,6 +66,23 @@ class ViewMixin:
                                         stripping it of ``View``)
     :type auto_url_name_from_view: bool
     """
+    patterns_attributes = ('view_class', 'auto_url_name_from_view')
+    """
+    :attribute patterns_attributes: See
+                                    :attr:`django_crucrudile.entities.Entity.patterns_attributes`
+    :type patterns_attributes: tuple of str
+    """
+    _route_classes = WeakValueDictionary()
+    """
+    :attribute _route_classes: Classes created by :func:`make_for_view`,
+                               indexed by base class, view class and
+                               keyword arguments (shared by all
+                               subclasses). The classes are weakly
+                               referenced, so that the classes that
+                               are not used anymore (and their view
+                               classes) can be garbage collected.
+    :type _route_classes: :class:`weakref.WeakValueDictionary`
+    """
     def __init__(self,
                  view_class=None,
                  name=None,
@@ -160,6 +178,19 @@ class ViewMixin:
         :returns: New class, with :attr:`view_class` attribute set to
                   ``view_class`` argument.
 
+        .. note::
+
+           The created classes are interned : calling this function
+           again with the same class, view class and keyword arguments
+           returns the same class object (if the keyword argument
+           values are hashable), as long as it is used.
+
+        .. warning::
+
+           As the returned class is shared with the other callers that
+           use the same arguments, it must not be modified (subclass
+           it, or pass the attributes as keyword arguments, instead).
+
         >>> class TestView:
         ...   pass
         >>>
@@ -170,7 +201,50 @@ class ViewMixin:
         >>> route_class.view_class.__name__
         'TestView'
 
+        >>> ViewMixin.make_for_view(TestView) is route_class
+        True
+        >>> ViewMixin.make_for_view(TestView, name='test') is route_class
+        False
+        >>> (ViewMixin.make_for_view(TestView, name='test') is
+        ...  ViewMixin.make_for_view(TestView, name='test'))
+        True
+        >>> (ViewMixin.make_for_view(TestView, index=1).index is
+        ...  ViewMixin.make_for_view(TestView, index=True).index)
+        False
+
+        The classes that are not used anymore are not kept :
+
+        >>> import gc
+        >>> _ = gc.collect()
+        >>> count = len(ViewMixin._route_classes)
+        >>> ViewMixin.make_for_view(TestView, name='unused') is not None
+        True
+        >>> _ = gc.collect()
+        >>> len(ViewMixin._route_classes) == count
+        True
+
+        With unhashable keyword arguments, a new class is created :
+
+        >>> (ViewMixin.make_for_view(TestView, spec=[]) is
+        ...  ViewMixin.make_for_view(TestView, spec=[]))
+        False
+
         """
+        try:
+            # include the value types, as equal values of different
+            # types (1 and True) hash the same
+            key = (cls, view_class, frozenset(
+                (name, type(value), value)
+                for name, value in kwargs.items()
+            ))
+        except TypeError:
+            # unhashable keyword arguments, can't intern
+            key = None
+        else:
+            route_class = cls._route_classes.get(key)
+            if route_class is not None:
+                return route_class
+
         view_name = view_class.__name__
         if view_name.endswith('View'):
             view_name = view_name[:-4]
@@ -178,8 +252,15 @@ class ViewMixin:
 
         kwargs['view_class'] = view_class
 
-        return type(
+        route_class = type(
             route_name,
             (cls,),
             kwargs
         )
+
+        if key is not None:
+            # use setdefault, so that concurrent calls return the same
+            # class
+            route_class = cls._route_classes.setdefault(key, route_class)
+
+        return route_class
@@ -0,0 +1,785 @@
+"""This module contains the route table classes. A route table is a
+flat, pure-data, representation of an URL pattern tree, made of route
+records (one for each URL pattern). A route record contains the
+pattern regex, URL name, callback and argument names, along with the
+regexs and namespaces of the URL groups (routers) containing the
+pattern.
+
+Route tables are compiled from entities (see
+:func:`django_crucrudile.entities.Entity.get_route_table`), without
+building Django URL objects, and can be inspected, compared (see
+:func:`RouteTable.diff`), serialized (see :func:`RouteTable.serialize`)
+or converted to Django URL patterns (see :func:`RouteTable.patterns`).
+
+ - :class:`RouteRecord` : route record
+ - :class:`RouteTable` : sequence of route records
+ - :class:`ReverseTable` : URL templates of the route records, by view
+   name, used to reverse URLs without Django's resolvers (see
+   :func:`django_crucrudile.routers.Router.reverse`)
+
+"""
+import re
+
+from django.conf.urls import url, include
+from django.utils.encoding import force_text
+from django.utils.http import urlquote
+
+from django_crucrudile.resolvers import UncachedURLPattern
+
+
+__all__ = ['RouteRecord', 'RouteTable', 'ReverseTable']
+
+
+ARGUMENT_NAME_RE = re.compile(r'\(\?P<(\w+)>')
+"""
+:data ARGUMENT_NAME_RE: Regex matching the named groups of URL regexs
+                        (used to get the argument names of a route
+                        record)
+"""
+
+
+NAMED_GROUP_START_RE = re.compile(r'\(\?P<(\w+)>')
+"""
+:data NAMED_GROUP_START_RE: Regex matching the start of a named group
+                            (used to build URL templates)
+"""
+
+
+def get_group_end(regex, start):
+    """Return the position following the end of the group whose content
+    starts at ``start`` in ``regex``
+
+    :argument regex: Regex
+    :type regex: str
+    :argument start: Position of the group content
+    :type start: int
+
+    :returns: Position after the closing parenthesis, or ``None`` if the
+              group is not closed
+    :rtype: int
+
+    >>> regex = '(?P<a>(b|c)[)])d'
+    >>> regex[get_group_end(regex, 6):]
+    'd'
+
+    """
+    depth = 1
+    escaped = in_class = False
+    for position in range(start, len(regex)):
+        char = regex[position]
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if not depth:
+                return position + 1
+    return None
+
+
+def split_alternation(regex, start, end):
+    """Return the bounds of the top-level alternation branches of
+    ``regex[start:end]``
+
+    :argument regex: Regex
+    :type regex: str
+    :argument start: Start position
+    :type start: int
+    :argument end: End position
+    :type end: int
+
+    :returns: Start and end positions of the branches
+    :rtype: list of 2-tuple
+
+    >>> regex = '^a|(b|c)|d$'
+    >>> [regex[start:end] for start, end in
+    ...  split_alternation(regex, 0, len(regex))]
+    ['^a', '(b|c)', 'd$']
+
+    """
+    branches = []
+    depth = 0
+    escaped = in_class = False
+    branch_start = start
+    for position in range(start, end):
+        char = regex[position]
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and not depth:
+            branches.append((branch_start, position))
+            branch_start = position + 1
+    branches.append((branch_start, end))
+    return branches
+
+
+def get_url_templates(regex):
+    """Return format strings that build the URLs matched by ``regex`` from
+    their arguments (as Django does when reversing URLs : named groups
+    are replaced by their argument, and characters quantified by ``?``
+    or ``*`` are omitted). Alternations in non-capturing groups give
+    one format string for each branch, and optional non-capturing
+    groups give format strings with and without the group.
+
+    :argument regex: URL regex
+    :type regex: str
+
+    :returns: Format strings and argument names, or ``None`` if the
+              regex is too complex (uses other constructs than literal
+              characters, named groups and non-capturing groups)
+    :rtype: list of 2-tuple
+
+    >>> get_url_templates('^documents/detail/?(?P<pk>\\\\d+)$')
+    [('documents/detail{pk}', ('pk',))]
+    >>> get_url_templates('^list\\\\{\\\\}$')
+    [('list{{}}', ())]
+    >>> get_url_templates('^detail/(?:(?P<pk>\\\\d+)|(?P<slug>[\\\\w-]+))$')
+    [('detail/{pk}', ('pk',)), ('detail/{slug}', ('slug',))]
+    >>> get_url_templates('^list(?:/(?P<page>\\\\d+))?$')
+    [('list', ()), ('list/{page}', ('page',))]
+    >>> get_url_templates('^(?P<pk>\\\\d+)?$') is None
+    True
+    >>> get_url_templates('^(\\\\d+)$') is None
+    True
+
+    """
+    if not regex.startswith('^'):
+        return None
+    templates = _get_url_templates(regex, 1, len(regex))
+    if templates is None or any(
+            len(set(arg_names)) != len(arg_names)
+            for _, arg_names in templates
+    ):
+        return None
+    return templates
+
+
+def _get_url_templates(regex, start, end):
+    """Return the URL templates of ``regex[start:end]`` (see
+    :func:`get_url_templates`)."""
+    branches = split_alternation(regex, start, end)
+    if len(branches) > 1:
+        templates = []
+        for branch_start, branch_end in branches:
+            branch_templates = _get_url_templates(
+                regex, branch_start, branch_end
+            )
+            if branch_templates is None:
+                return None
+            templates.extend(branch_templates)
+        return templates
+
+    templates = [('', ())]
+    position = start
+    while position < end:
+        char = regex[position]
+        if char == '(':
+            group_end = get_group_end(regex, position + 1)
+            if group_end is None or group_end > end:
+                return None
+            quantifier = regex[group_end:group_end + 1]
+            optional = quantifier == '?'
+            if quantifier in ('*', '+', '{') or (
+                    optional and not regex.startswith('(?:', position)):
+                return None
+            match = NAMED_GROUP_START_RE.match(regex, position)
+            if match is not None:
+                name = match.group(1)
+                templates = [
+                    (template + '{{{}}}'.format(name), arg_names + (name,))
+                    for template, arg_names in templates
+                ]
+            elif regex.startswith('(?:', position):
+                group_templates = _get_url_templates(
+                    regex, position + 3, group_end - 1
+                )
+                if group_templates is None:
+                    return None
+                # optional groups give the templates without the group
+                # first (Django omits them)
+                templates = (templates if optional else []) + [
+                    (template + group_template,
+                     arg_names + group_arg_names)
+                    for template, arg_names in templates
+                    for group_template, group_arg_names in group_templates
+                ]
+            else:
+                return None
+            position = group_end + optional
+            continue
+        elif char == '$' and position == len(regex) - 1:
+            break
+        elif char == '\\':
+            literal = regex[position + 1:position + 2]
+            if not literal or literal.isalnum() or literal == '_':
+                return None
+            step = 2
+        elif char in '.^$*+?{}[]|)':
+            return None
+        else:
+            literal, step = char, 1
+        position += step
+        quantifier = regex[position:position + 1]
+        if quantifier in ('?', '*'):
+            # zero occurrences
+            position += 1
+            continue
+        elif quantifier == '+':
+            position += 1
+        elif quantifier == '{':
+            return None
+        literal = literal.replace('{', '{{').replace('}', '}}')
+        templates = [
+            (template + literal, arg_names)
+            for template, arg_names in templates
+        ]
+    return templates
+
+
+def get_callback_reference(callback):
+    """Return a string referencing a callback (its module and qualified
+    name), used to serialize route records.
+
+    :argument callback: Callback
+    :type callback: callable
+
+    :returns: Callback reference
+    :rtype: str
+
+    >>> get_callback_reference(get_callback_reference)
+    'django_crucrudile.table.get_callback_reference'
+    >>>
+    >>> from django.views.generic import ListView
+    >>> get_callback_reference(ListView.as_view())
+    'django.views.generic.list.ListView'
+
+    """
+    if callback is None:
+        return None
+    return '{}.{}'.format(
+        getattr(callback, '__module__', None),
+        getattr(
+            callback, '__qualname__',
+            getattr(callback, '__name__', repr(callback))
+        )
+    )
+
+
+class RouteRecord:
+    """Route record, containing the metadata needed to build a Django URL
+    pattern.
+
+    .. inheritance-diagram:: RouteRecord
+
+    >>> callback = lambda: None
+    >>> record = RouteRecord('^detail/(?P<pk>\d+)$', 'detail', callback)
+    >>> record
+    <RouteRecord detail ^detail/(?P<pk>\d+)$>
+    >>> record.arg_names
+    ('pk',)
+    >>>
+    >>> record = record.with_parent('^documents/', 'documents')
+    >>> record = record.with_parent('^')
+    >>> record
+    <RouteRecord documents:detail ^documents/detail/(?P<pk>\d+)$>
+    >>> record.namespaces
+    ('documents',)
+    >>> record.to_pattern()
+    <RegexURLPattern detail ^detail/(?P<pk>\d+)$>
+
+    Records whose URLs should not be stored in resolve caches keep
+    this flag on the URL pattern they make (see
+    :class:`django_crucrudile.resolvers.LRUCacheResolver`) :
+
+    >>> record = RouteRecord('^list$', 'list', callback,
+    ...                      cache_resolve=False)
+    >>> record.to_pattern().cache_resolve
+    False
+    >>> RouteRecord.from_pattern(record.to_pattern()).cache_resolve
+    False
+
+    """
+    __slots__ = (
+        'regex', 'name', 'callback', 'arg_names', 'parents', 'kwargs',
+        'cache_resolve'
+    )
+
+    def __init__(self, regex, name, callback,
+                 arg_names=None, parents=(), kwargs=None,
+                 cache_resolve=True):
+        """Initialize route record
+
+        :argument regex: URL regex
+        :type regex: str
+        :argument name: URL name
+        :type name: str
+        :argument callback: URL callback
+        :type callback: callable
+        :argument arg_names: Argument names (named groups in ``regex``,
+                             found using :data:`ARGUMENT_NAME_RE` if
+                             not given)
+        :type arg_names: tuple of str
+        :argument parents: Regexs and namespaces of the URL groups
+                           containing the pattern (from the outermost
+                           URL group)
+        :type parents: tuple of 2-tuples
+        :argument kwargs: Extra keyword arguments passed to the callback
+        :type kwargs: dict
+        :argument cache_resolve: If ``False``, the URLs of the pattern
+                                 are not stored in resolve caches (see
+                                 :func:`to_pattern`)
+        :type cache_resolve: bool
+        """
+        self.regex = regex
+        self.name = name
+        self.callback = callback
+        self.arg_names = (
+            tuple(arg_names) if arg_names is not None
+            else tuple(ARGUMENT_NAME_RE.findall(regex))
+        )
+        self.parents = tuple(parents)
+        self.kwargs = kwargs or None
+        self.cache_resolve = cache_resolve
+
+    @classmethod
+    def from_pattern(cls, pattern, parents=()):
+        """Make a route record from a Django URL pattern
+
+        :argument pattern: URL pattern
+        :type pattern: :class:`django.core.urlresolvers.RegexURLPattern`
+        :argument parents: See :func:`__init__`
+        :type parents: tuple of 2-tuples
+
+        :returns: Route record
+        :rtype: :class:`RouteRecord`
+
+        >>> pattern = url('^list$', lambda: None, name='list')
+        >>> RouteRecord.from_pattern(pattern)
+        <RouteRecord list ^list$>
+
+        """
+        return cls(
+            pattern.regex.pattern,
+            pattern.name,
+            pattern.callback,
+            parents=parents,
+            kwargs=pattern.default_args,
+            cache_resolve=getattr(pattern, 'cache_resolve', True)
+        )
+
+    def with_parent(self, regex, namespace=None):
+        """Return a copy of this record, contained in another URL group
+
+        :argument regex: Regex of the URL group
+        :type regex: str
+        :argument namespace: Namespace of the URL group
+        :type namespace: str
+
+        :returns: Route record
+        :rtype: :class:`RouteRecord`
+        """
+        return type(self)(
+            self.regex, self.name, self.callback, self.arg_names,
+            ((regex, namespace),) + self.parents, self.kwargs,
+            self.cache_resolve
+        )
+
+    @property
+    def namespaces(self):
+        """Return the namespaces of the URL groups containing the pattern
+
+        :returns: Namespaces
+        :rtype: tuple of str
+        """
+        return tuple(
+            namespace for _, namespace in self.parents if namespace
+        )
+
+    @property
+    def view_name(self):
+        """Return the view name (URL name, prefixed with namespaces) of the
+        pattern, as used when reversing URLs
+
+        :returns: View name
+        :rtype: str
+        """
+        if self.name is None:
+            return None
+        return ':'.join(self.namespaces + (self.name,))
+
+    @property
+    def full_regex(self):
+        """Return the full regex of the pattern (joining the regexs of the
+        URL groups containing the pattern)
+
+        :returns: Full URL regex
+        :rtype: str
+        """
+        regexs = [regex for regex, _ in self.parents] + [self.regex]
+        return '^' + ''.join(
+            regex[1:] if regex.startswith('^') else regex
+            for regex in regexs
+        )
+
+    def get_url_templates(self):
+        """Return the URL templates of the record full regex (see
+        :func:`get_url_templates`)
+
+        :returns: Format strings and argument names, or ``None``
+        :rtype: list of 2-tuple
+
+        >>> RouteRecord(
+        ...   '^(?P<pk>\\d+)$', 'detail', None
+        ... ).with_parent('^docs/').get_url_templates()
+        [('docs/{pk}', ('pk',))]
+
+        """
+        return get_url_templates(self.full_regex)
+
+    def to_pattern(self):
+        """Make a Django URL pattern from this record (without the URL
+        groups containing it)
+
+        If :attr:`cache_resolve` is ``False``, the URL pattern is a
+        :class:`django_crucrudile.resolvers.UncachedURLPattern` (whose
+        URLs are not stored by
+        :class:`django_crucrudile.resolvers.LRUCacheResolver`).
+
+        :returns: URL pattern
+        :rtype: :class:`django.core.urlresolvers.RegexURLPattern`
+        """
+        if not self.cache_resolve:
+            return UncachedURLPattern(
+                self.regex, self.callback, self.kwargs, self.name
+            )
+        return url(self.regex, self.callback, self.kwargs, self.name)
+
+    def as_tuple(self):
+        """Return the record data as a tuple of hashable, serializable
+        values (using :func:`get_callback_reference` for the callback)
+
+        :returns: Record data
+        :rtype: tuple
+        """
+        return (
+            self.parents,
+            self.regex,
+            self.name,
+            get_callback_reference(self.callback),
+            self.arg_names,
+            tuple(sorted(self.kwargs.items())) if self.kwargs else None,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, RouteRecord):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __hash__(self):
+        return hash(self.as_tuple())
+
+    def __repr__(self):
+        return '<{} {} {}>'.format(
+            self.__class__.__name__, self.view_name, self.full_regex
+        )
+
+
+class RouteTable:
+    """Sequence of route records, compiled from an entity (see
+    :func:`django_crucrudile.entities.Entity.get_route_table`).
+
+    .. inheritance-diagram:: RouteTable
+
+    >>> callback = lambda: None
+    >>> table = RouteTable([
+    ...   RouteRecord('^list$', 'list', callback).with_parent(
+    ...     '^docs/', 'docs'
+    ...   ),
+    ...   RouteRecord('^home$', 'home', callback),
+    ... ])
+    >>> len(table)
+    2
+    >>> list(table)
+    [<RouteRecord docs:list ^docs/list$>, <RouteRecord home ^home$>]
+    >>> table.patterns()
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [<RegexURLResolver <RegexURLPattern list> (docs:docs) ^docs/>,
+     <RegexURLPattern home ^home$>]
+
+    """
+    __slots__ = ('records',)
+
+    def __init__(self, records=()):
+        """Initialize route table
+
+        :argument records: Route records
+        :type records: iterable of :class:`RouteRecord`
+        """
+        self.records = tuple(records)
+
+    @classmethod
+    def records_from_patterns(cls, patterns, parents=()):
+        """Yield route records made from Django URL patterns (following
+        URL resolvers recursively)
+
+        :argument patterns: URL patterns
+        :type patterns: iterable
+        :argument parents: Regexs and namespaces of the URL groups
+                           containing the patterns
+        :type parents: tuple of 2-tuples
+
+        :returns: Route records
+        :rtype: iterable of :class:`RouteRecord`
+        """
+        for pattern in patterns:
+            if hasattr(pattern, 'url_patterns'):
+                for record in cls.records_from_patterns(
+                        pattern.url_patterns,
+                        parents + (
+                            (pattern.regex.pattern, pattern.namespace),
+                        )
+                ):
+                    yield record
+            else:
+                yield RouteRecord.from_pattern(pattern, parents)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __eq__(self, other):
+        if not isinstance(other, RouteTable):
+            return NotImplemented
+        return self.records == other.records
+
+    def __repr__(self):
+        return '<{} ({} records)>'.format(
+            self.__class__.__name__, len(self.records)
+        )
+
+    def serialize(self):
+        """Return the table data, as a list of dictionaries (that can be
+        dumped as JSON)
+
+        :returns: Table data
+        :rtype: list of dict
+
+        >>> from django.views.generic import ListView
+        >>>
+        >>> table = RouteTable([
+        ...   RouteRecord('^(?P<pk>\d+)$', 'list', ListView.as_view())
+        ... ])
+        >>> table.serialize()
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [{'parents': [], 'regex': '^(?P<pk>\\\\d+)$', 'name': 'list',
+          'callback': 'django.views.generic.list.ListView',
+          'arg_names': ['pk'], 'kwargs': None}]
+
+        """
+        return [
+            {
+                'parents': [list(parent) for parent in parents],
+                'regex': regex,
+                'name': name,
+                'callback': callback,
+                'arg_names': list(arg_names),
+                'kwargs': dict(kwargs) if kwargs else None,
+            }
+            for parents, regex, name, callback, arg_names, kwargs in (
+                record.as_tuple() for record in self.records
+            )
+        ]
+
+    def diff(self, other):
+        """Compare this table with another table
+
+        :argument other: Other route table
+        :type other: :class:`RouteTable`
+
+        :returns: Records only in ``other`` (added), and records only in
+                  this table (removed)
+        :rtype: 2-tuple of lists
+
+        >>> callback = lambda: None
+        >>> table = RouteTable([RouteRecord('^a$', 'a', callback),
+        ...                     RouteRecord('^b$', 'b', callback)])
+        >>> other = RouteTable([RouteRecord('^b$', 'b', callback),
+        ...                     RouteRecord('^c$', 'c', callback)])
+        >>> table.diff(other)
+        ([<RouteRecord c ^c$>], [<RouteRecord a ^a$>])
+
+        """
+        records = set(self.records)
+        other_records = set(other.records)
+        return (
+            [record for record in other.records
+             if record not in records],
+            [record for record in self.records
+             if record not in other_records],
+        )
+
+    def patterns(self):
+        """Make Django URL patterns from the route records. Consecutive
+        records contained in the same URL group are grouped in a single
+        URL resolver.
+
+        :returns: URL patterns
+        :rtype: list
+        """
+        return list(self._make_patterns(self.records, 0))
+
+    @classmethod
+    def _make_patterns(cls, records, depth):
+        """Yield the URL patterns for ``records`` (that are all contained in
+        the same ``depth`` first URL groups)."""
+        group, group_parent = [], None
+
+        def make_group():
+            regex, namespace = group_parent
+            return url(
+                regex,
+                include(
+                    list(cls._make_patterns(group, depth + 1)),
+                    namespace=namespace,
+                    app_name=namespace
+                )
+            )
+
+        for record in records:
+            parent = (
+                record.parents[depth]
+                if len(record.parents) > depth else None
+            )
+            if group and parent != group_parent:
+                yield make_group()
+                group = []
+            if parent is None:
+                yield record.to_pattern()
+            else:
+                group_parent = parent
+                group.append(record)
+        if group:
+            yield make_group()
+
+
+class ReverseTable:
+    """URL templates (see :func:`get_url_templates`) of route records, by
+    view name, used to reverse URLs by formatting strings (see
+    :func:`reverse`).
+
+    View names whose records don't all have an URL template are not
+    stored (:func:`reverse` returns ``None`` for them, so that Django's
+    :func:`django.core.urlresolvers.reverse` can be used instead).
+
+    .. inheritance-diagram:: ReverseTable
+
+    >>> callback = lambda: None
+    >>> table = ReverseTable([
+    ...   RouteRecord('^(?P<pk>\\d+)$', 'detail', callback),
+    ...   RouteRecord('^(?P<slug>[\\w-]+)$', 'detail', callback),
+    ...   RouteRecord('^(a|b)$', 'complex', callback),
+    ... ])
+    >>> table.reverse('detail', kwargs={'pk': 42})
+    '42'
+    >>> table.reverse('detail', kwargs={'slug': 'a b'}) is None
+    True
+    >>> table.reverse('detail', kwargs={'slug': 'a-b'})
+    'a-b'
+    >>> table.reverse('detail', args=['a-b'])
+    'a-b'
+    >>> table.reverse('complex') is None
+    True
+
+    """
+    __slots__ = ('entries',)
+
+    def __init__(self, records=()):
+        """Initialize reverse table
+
+        :argument records: Route records
+        :type records: iterable of :class:`RouteRecord`
+        """
+        entries = {}
+        for record in records:
+            view_name = record.view_name
+            if view_name is None:
+                continue
+            templates = record.get_url_templates()
+            if templates is None:
+                entries[view_name] = None
+            elif view_name not in entries or entries[view_name] is not None:
+                regex = re.compile(record.full_regex)
+                # same order as Django (last pattern first)
+                entries[view_name] = [
+                    (url_template, arg_names, regex, record.kwargs or {})
+                    for url_template, arg_names in templates
+                ] + entries.get(view_name, [])
+        self.entries = entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return '<{} ({} view names)>'.format(
+            self.__class__.__name__, len(self.entries)
+        )
+
+    def reverse(self, view_name, args=None, kwargs=None):
+        """Return the URL path (without script prefix) for a view name and
+        arguments, using the first URL template whose arguments match
+        the given arguments (as
+        :func:`django.core.urlresolvers.reverse`)
+
+        :argument view_name: View name (URL name, prefixed by
+                             namespaces)
+        :type view_name: str
+        :argument args: Positional arguments
+        :type args: list
+        :argument kwargs: Keyword arguments
+        :type kwargs: dict
+
+        :returns: URL path, or ``None`` if the view name is not in the
+                  table, or if no URL template matches the arguments
+        :rtype: str
+        """
+        candidates = self.entries.get(view_name)
+        if candidates is None or (args and kwargs):
+            return None
+        for url_template, arg_names, regex, defaults in candidates:
+            if args:
+                if len(args) != len(arg_names):
+                    continue
+                values = dict(zip(arg_names, args))
+            else:
+                values = kwargs or {}
+                if (set(values) | set(defaults) !=
+                        set(arg_names) | set(defaults)):
+                    continue
+                if any(values.get(key, value) != value
+                       for key, value in defaults.items()):
+                    continue
+            path = url_template.format(**{
+                name: urlquote(force_text(values[name]))
+                for name in arg_names
+            })
+            if regex.match(path):
+                return path
+        return None
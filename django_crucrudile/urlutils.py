@@ -7,7 +7,7 @@ handling separators becomes a bit more complicated).
 """
 from copy import copy
 from itertools import chain
-from functools import partial, wraps
+from functools import partial, wraps, lru_cache
 
 
 def pass_tuple(count=1):
@@ -435,6 +435,106 @@ class OptionalPartList(Separated, Parsable, list):
             yield required, args
 
 
+COMPILED_URL_BUILDERS_CACHE_SIZE = 128
+"""
+:data COMPILED_URL_BUILDERS_CACHE_SIZE: Maximum number of compiled URL
+                                        builders kept (see
+                                        :func:`get_compiled_url_builder`)
+"""
+
+
+def compile_url_builder(separator, opt_separator, required_default):
+    """Return a function that builds an URL from a list of URL parts, as
+    :class:`URLBuilder` does with its parsers (see
+    :func:`URLBuilder.get_parsers`), but in a single loop : transform
+    the items to tuples, apply the default "required" flag, filter out
+    the empty items, get the "first item required" flag, and join the
+    items using the separators.
+
+    :argument separator: See :attr:`Separated.separator`
+    :type separator: str
+    :argument opt_separator: See :attr:`Separated.opt_separator`
+    :type opt_separator: str
+    :argument required_default: See :attr:`Separated.required_default`
+    :type required_default: bool
+
+    :returns: Compiled URL builder, returning the "first item
+              required" flag and the joined URL parts
+    :rtype: callable : iterable -> tuple : (bool, str)
+
+    >>> build = compile_url_builder('/', '/?', True)
+    >>> build(["<1>", (False, "<2>"), None, (True, "<3>")])
+    (True, '<1>/?<2>/<3>')
+    >>> build([(False, "<1>"), "", "<2>"])
+    (False, '<1>/<2>')
+    >>> build([])
+    (False, '')
+
+    """
+    def build(items):
+        """Compiled URL builder"""
+        parts = []
+        append = parts.append
+        first_item_required = False
+        for item in items:
+            if isinstance(item, tuple):
+                required, item = item
+                if required is None:
+                    required = required_default
+            else:
+                required = required_default
+            if not item:
+                continue
+            if parts:
+                append(separator if required else opt_separator)
+            else:
+                first_item_required = required
+            append(item)
+        return first_item_required, ''.join(parts)
+
+    return build
+
+
+@lru_cache(maxsize=COMPILED_URL_BUILDERS_CACHE_SIZE)
+def get_compiled_url_builder(builder_class, separator, opt_separator,
+                             required_default):
+    """Return the compiled URL builder (see :func:`compile_url_builder`)
+    for an URL builder class and a separator configuration, compiling
+    it only once.
+
+    :argument builder_class: URL builder class
+    :type builder_class: subclass of :class:`URLBuilder`
+    :argument separator: See :attr:`Separated.separator`
+    :type separator: str
+    :argument opt_separator: See :attr:`Separated.opt_separator`
+    :type opt_separator: str
+    :argument required_default: See :attr:`Separated.required_default`
+    :type required_default: bool
+
+    :returns: Compiled URL builder, or ``None`` if ``builder_class``
+              overrides the parsers of :class:`URLBuilder` (in which
+              case they should be used)
+    :rtype: callable
+
+    >>> get_compiled_url_builder(URLBuilder, '/', '/?', True) is (
+    ...   get_compiled_url_builder(URLBuilder, '/', '/?', True)
+    ... )
+    True
+    >>> class Builder(URLBuilder):
+    ...   def get_parsers(self):
+    ...     return super().get_parsers() + [str]
+    >>> get_compiled_url_builder(Builder, '/', '/?', True) is None
+    True
+
+    """
+    if any(
+            getattr(builder_class, name) is not getattr(URLBuilder, name)
+            for name in URLBuilder.compiled_attributes
+    ):
+        return None
+    return compile_url_builder(separator, opt_separator, required_default)
+
+
 class URLBuilder(OptionalPartList):
     """Allows building URLs from a list of URL parts. The parts can be
     required or optional, this information will be used to determine
@@ -489,6 +589,81 @@ class URLBuilder(OptionalPartList):
     TypeError: sequence item 2: expected str instance, int found
 
     """
+    compiled = True
+    """
+    :attribute compiled: If ``True``, the builder uses a compiled URL
+                         builder (see :func:`get_compiled_url_builder`)
+                         when called, instead of running the parsers
+                         returned by :func:`get_parsers` (the output is
+                         the same). The parsers are used if the
+                         subclass overrides one of the
+                         :attr:`compiled_attributes`.
+    :type compiled: bool
+    """
+    compiled_attributes = (
+        'get_parsers', 'get_separator',
+        'transform_to_tuple', 'apply_required_default',
+        'filter_empty_items', 'add_first_item_required_flag',
+        'flatten', 'join',
+    )
+    """
+    :attribute compiled_attributes: Names of the attributes implemented
+                                    by the compiled URL builder
+    :type compiled_attributes: tuple of str
+    """
+    def __call__(self):
+        """Build the URL using the compiled URL builder (see
+        :func:`get_compiled_url_builder`), if :attr:`compiled` is
+        ``True`` and if it can be used, or using the parsers (see
+        :func:`Parsable.__call__`).
+
+        :returns: "First item required" flag, and joined URL parts
+        :rtype: tuple : (bool, str)
+
+        >>> builder = URLBuilder(["<1>", (False, "<2>")])
+        >>> builder()
+        (True, '<1>/?<2>')
+        >>> builder.compiled = False
+        >>> builder()
+        (True, '<1>/?<2>')
+
+        """
+        build = self.get_compiled_builder()
+        if build is not None:
+            return build(self)
+        return super().__call__()
+
+    def get_compiled_builder(self):
+        """Return the compiled URL builder for the class and separators of
+        this builder (see :func:`get_compiled_url_builder`). Callers
+        that build many URLs with the same configuration can get it
+        once, and call it with each URL part list.
+
+        :returns: Compiled URL builder, or ``None`` if :attr:`compiled`
+                  is ``False`` or if it can't be used
+        :rtype: callable
+
+        >>> build = URLBuilder(separator='-').get_compiled_builder()
+        >>> build(["<1>", (False, "<2>")])
+        (True, '<1>/?<2>')
+        >>> build(["<1>", "<2>"])
+        (True, '<1>-<2>')
+        >>>
+        >>> builder = URLBuilder()
+        >>> builder.compiled = False
+        >>> builder.get_compiled_builder() is None
+        True
+
+        """
+        if not self.compiled:
+            return None
+        return get_compiled_url_builder(
+            self.__class__,
+            self.separator,
+            self.opt_separator,
+            self.required_default
+        )
+
     def get_parsers(self):
         """Complement :class:`OptionalPartList` parsers (from
         :func:`OptionalPartList.get_parsers`) with :func:`filter_empty_items`,
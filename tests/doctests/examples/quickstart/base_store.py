@@ -37,7 +37,7 @@ True
    - status @ ^status$ StatusView
 
 >>> list(router.patterns())
-[<RegexURLResolver <RegexURLPattern list> (None:None) ^>]
+[<DispatchResolver <RegexURLPattern list> (None:None) ^>]
 
 As the instances that are automatically registered when the router is
 instantiated may also be transformed by the register mappings, we can
@@ -61,6 +61,6 @@ True
    - status @ ^status$ StatusView
 
 >>> list(router.patterns())
-[<RegexURLResolver <RegexURLPattern list> (None:None) ^>]
+[<DispatchResolver <RegexURLPattern list> (None:None) ^>]
 
 """
@@ -47,6 +47,6 @@ True
      - version @ ^version$ VersionView
 
 >>> list(router.patterns())
-[<RegexURLResolver <RegexURLPattern list> (None:None) ^>]
+[<DispatchResolver <RegexURLPattern list> (None:None) ^>]
 
 """
@@ -1,6 +1,11 @@
 from django_crucrudile.routers import (
     Router,
 )
+from django_crucrudile.resolvers import TrieResolver, AlternationResolver
+from django_crucrudile.routes.mixins import GenericViewArgsMixin
+from django_crucrudile.routes.mixins.arguments import (
+    ArgumentsMixin, FoldingArgumentsParser
+)
 
 from .models import (
     DocumentModel,
@@ -27,18 +32,51 @@ class EntitiesRouter(BaseRouter):
     url_part = "entities"
 
 
-base_router = BaseRouter()
-documents_router = DocumentsRouter()
-entities_router = EntitiesRouter()
+def make_base_router(**router_kwargs):
+    base_router = BaseRouter(**router_kwargs)
+    documents_router = DocumentsRouter(**router_kwargs)
+    entities_router = EntitiesRouter(**router_kwargs)
+
+    documents_router.register(DocumentModel, index=True)
+    documents_router.register(GroupModel)
+    documents_router.register(PhaseModel)
+    base_router.register(documents_router, index=True)
+
+    entities_router.register(EntityModel, index=True)
+    entities_router.register(InterfaceModel)
+    base_router.register(entities_router)
+
+    base_router.register(CommentModel)
+    base_router.register(TaskModel)
+
+    return base_router
+
+
+base_router = make_base_router()
+lazy_base_router = make_base_router(lazy_patterns=True)
+trie_base_router = make_base_router(resolver_class=TrieResolver)
+alternation_base_router = make_base_router(
+    resolver_class=AlternationResolver
+)
+
+
+def make_collapsed_base_router(**router_kwargs):
+    router = make_base_router(**router_kwargs)
+    for entity in router.lookup():
+        if isinstance(entity, GenericViewArgsMixin):
+            entity.collapse_view_arguments = True
+    return router
+
+
+collapsed_base_router = make_collapsed_base_router()
+
 
-documents_router.register(DocumentModel, index=True)
-documents_router.register(GroupModel)
-documents_router.register(PhaseModel)
-base_router.register(documents_router, index=True)
+def make_folded_base_router(**router_kwargs):
+    router = make_base_router(**router_kwargs)
+    for entity in router.lookup():
+        if isinstance(entity, ArgumentsMixin):
+            entity.arguments_parser = FoldingArgumentsParser
+    return router
 
-entities_router.register(EntityModel, index=True)
-entities_router.register(InterfaceModel)
-base_router.register(entities_router)
 
-base_router.register(CommentModel)
-base_router.register(TaskModel)
+folded_base_router = make_folded_base_router()
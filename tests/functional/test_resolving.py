@@ -9,7 +9,19 @@ from django.views.generic import (
     DeleteView
 )
 
-from .routers import base_router
+from django_crucrudile.resolvers import LRUCacheResolver, DispatchResolver
+from django_crucrudile.routers import Router
+from django_crucrudile.routes import CallbackRoute
+from django_crucrudile.routes.mixins.arguments import FoldingArgumentsParser
+
+from .routers import (
+    base_router,
+    lazy_base_router,
+    trie_base_router,
+    alternation_base_router,
+    collapsed_base_router,
+    folded_base_router,
+)
 from .models import (
     DocumentModel,
     GroupModel,
@@ -111,3 +123,171 @@ class ResolveTestCase:
                             model_name, action_name,
                             view_name, None, prefix
                         )
+
+
+class LazyResolveTestCase(ResolveTestCase):
+    router = lazy_base_router
+
+
+class TrieResolveTestCase(ResolveTestCase):
+    router = trie_base_router
+
+
+class AlternationResolveTestCase(ResolveTestCase):
+    router = alternation_base_router
+
+
+class LRUCacheResolveTestCase(ResolveTestCase):
+    router = trie_base_router
+
+    def setUp(self):
+        self.patterns = list(self.router.patterns())
+        self.resolver = LRUCacheResolver(self.patterns)
+        self.url = url(
+            '^/',
+            include([self.resolver]),
+        )
+
+    def test_cache_info(self):
+        for _ in range(2):
+            self._test_model_view(
+                'documentmodel', 'detail', 'DetailView', '42', 'documents'
+            )
+        info = self.resolver.cache_info()
+        assert_equal((info['hits'], info['misses'], info['currsize']),
+                     (1, 1, 1))
+
+    def test_cache_resolve_shared_callback(self):
+        # routes sharing a callback don't share the cache_resolve flag
+        def callback():
+            pass
+        router = Router(namespace='ns')
+        uncached_route = CallbackRoute(name='uncached', callback=callback)
+        uncached_route.cache_resolve = False
+        router.register(CallbackRoute(name='cached', callback=callback))
+        router.register(uncached_route)
+        resolver = LRUCacheResolver(router.patterns())
+        for _ in range(2):
+            resolver.resolve('cached')
+            resolver.resolve('uncached')
+        info = resolver.cache_info()
+        assert_equal((info['hits'], info['misses'], info['currsize']),
+                     (1, 3, 1))
+        assert_equal(hasattr(callback, 'cache_resolve'), False)
+
+    def test_cache_resolve_lazy(self):
+        # resolving doesn't load the lazy routers that don't match
+        router = Router()
+        lazy_router = Router(namespace='lazy', url_part='lazy',
+                             lazy_patterns=True)
+        uncached_route = CallbackRoute(name='uncached',
+                                       callback=lambda: None)
+        uncached_route.cache_resolve = False
+        router.register(CallbackRoute(name='cached', callback=lambda: None))
+        router.register(uncached_route)
+        lazy_router.register(CallbackRoute(name='lazy',
+                                           callback=lambda: None))
+        router.register(lazy_router)
+        resolver = LRUCacheResolver(router.patterns())
+        lazy_pattern = next(router.patterns()).url_patterns[-1]
+        for _ in range(2):
+            resolver.resolve('cached')
+            resolver.resolve('uncached')
+        assert_equal(lazy_pattern.loaded, False)
+        info = resolver.cache_info()
+        assert_equal((info['hits'], info['misses'], info['currsize']),
+                     (1, 3, 1))
+
+
+class StaticResolveTestCase:
+    def setUp(self):
+        self.router = Router()
+        child = Router(namespace='help', url_part='help')
+        for name in ('home', 'status'):
+            self.router.register(
+                CallbackRoute(name=name, callback=lambda: None)
+            )
+        for name in ('help', 'version'):
+            child.register(CallbackRoute(name=name, callback=lambda: None))
+        self.router.register(child)
+
+    def test_dispatch_resolver(self):
+        # routers whose patterns are all static yield populated
+        # dispatch resolvers, without configuration
+        pattern = next(self.router.patterns())
+        assert_equal(type(pattern), DispatchResolver)
+        assert_equal(
+            sorted(path for matches in pattern._static_matches.values()
+                   for path in matches),
+            ['help/help', 'help/version', 'home', 'status']
+        )
+
+    def test_resolve(self):
+        resolver = url('^/', include(list(self.router.patterns())))
+        for path, view_name in [
+                ('/home', 'home'),
+                ('/help/version', 'help:version'),
+        ]:
+            assert_equal(resolver.resolve(path).view_name, view_name)
+
+
+class CollapsedResolveTestCase(ResolveTestCase):
+    router = collapsed_base_router
+
+    def test_pattern_count(self):
+        patterns = self.router.get_route_table()
+        assert_equal(
+            len(patterns),
+            len(base_router.get_route_table()) - 3 * len(
+                [model for models in MODEL_NAME_DICT.values()
+                 for model in models]
+            )
+        )
+
+    def test_kwargs(self):
+        match = self.url.resolve('/commentmodel/detail/slug-42')
+        assert_equal(match.kwargs, {'pk': None, 'slug': 'slug-42'})
+        # the callback drops the None keyword arguments
+        assert_equal(match.func.__wrapped__.__name__, 'DetailView')
+
+
+class FoldedResolveTestCase(ResolveTestCase):
+    router = folded_base_router
+
+    def test_pattern_count(self):
+        assert_equal(
+            len(self.router.get_route_table()),
+            len(collapsed_base_router.get_route_table())
+        )
+
+    def test_kwargs(self):
+        match = self.url.resolve('/commentmodel/detail/slug-42')
+        assert_equal(match.kwargs, {'pk': None, 'slug': 'slug-42'})
+        # the callback drops the None keyword arguments
+        assert_equal(match.func.__wrapped__.__name__, 'DetailView')
+
+    def test_view_kwargs(self):
+        # keyword arguments actually received by the view
+        def callback(request, *args, **kwargs):
+            return kwargs
+        route = CallbackRoute(
+            name='detail', callback=callback,
+            arguments_spec=[
+                ['(?P<pk>[0-9]+)', '(?P<slug>[a-z0-9-]+)'],
+                (False, '(?P<format>json|xml)'),
+            ]
+        )
+        route.arguments_parser = FoldingArgumentsParser
+        router = Router()
+        router.register(route)
+        resolver = url('^/', include(list(router.patterns())))
+        for path, kwargs in [
+                ('/detail/slug-42', {'slug': 'slug-42'}),
+                ('/detail/42', {'pk': '42'}),
+                ('/detail/42/json', {'pk': '42', 'format': 'json'}),
+        ]:
+            match = resolver.resolve(path)
+            assert_equal(
+                match.func(None, *match.args, **match.kwargs),
+                kwargs
+            )
@@ -0,0 +1,120 @@
+from types import ModuleType
+
+from nose.tools import assert_equal, assert_raises
+
+from django.conf.urls import url, include
+from django.core.urlresolvers import reverse, set_urlconf
+
+from .routers import (
+    base_router, collapsed_base_router, folded_base_router
+)
+
+
+URL_ARGS = [None, {'pk': 42}, {'slug': 'slug-test-42'}]
+
+
+class ReverseTestCase:
+    router = base_router
+
+    def setUp(self):
+        self.urlconf = ModuleType('urlconf')
+        self.urlconf.urlpatterns = list(self.router.patterns())
+        set_urlconf(self.urlconf)
+
+    def tearDown(self):
+        set_urlconf(None)
+
+    def _test_reverse(self, view_name, kwargs):
+        assert_equal(
+            self.router.reverse(view_name, **(kwargs or {})),
+            reverse(view_name, kwargs=kwargs)
+        )
+
+    def test_reverse(self):
+        reverse_table = self.router.get_reverse_table()
+        for view_name, candidates in sorted(reverse_table.entries.items()):
+            for kwargs in URL_ARGS:
+                arg_names = set(kwargs or ())
+                if any(set(candidate[1]) == arg_names
+                       for candidate in candidates):
+                    yield self._test_reverse, view_name, kwargs
+
+
+class MountedReverseTestCase(ReverseTestCase):
+    def setUp(self):
+        self.urlconf = ModuleType('urlconf')
+        self.urlconf.urlpatterns = [
+            url('^api/', include(list(self.router.patterns())))
+        ]
+        set_urlconf(self.urlconf)
+
+    def test_mount_prefix(self):
+        assert_equal(self.router.get_mount_prefix(), 'api/')
+
+
+class NamespacedReverseTestCase(ReverseTestCase):
+    def setUp(self):
+        self.urlconf = ModuleType('urlconf')
+        self.urlconf.urlpatterns = [
+            url('^api/', include(list(self.router.patterns()),
+                                 namespace='api'))
+        ]
+        set_urlconf(self.urlconf)
+
+    def test_reverse(self):
+        assert_raises(
+            ValueError,
+            self.router.reverse, 'documents:documentmodel-list'
+        )
+
+
+class CollapsedReverseTestCase(ReverseTestCase):
+    # Django reverses the collapsed routes using reverse-only patterns
+    router = collapsed_base_router
+
+    def test_reverse_detail(self):
+        for kwargs, path in [
+                ({'pk': 42}, '/documents/documentmodel/detail/42'),
+                ({'slug': 'slug-42'},
+                 '/documents/documentmodel/detail/slug-42'),
+        ]:
+            assert_equal(
+                reverse('documents:documentmodel-detail', kwargs=kwargs),
+                path
+            )
+
+
+def test_reverse_collapsed():
+    with_urlconf = ReverseTestCase()
+    with_urlconf.router = collapsed_base_router
+    with_urlconf.setUp()
+    try:
+        assert_equal(
+            collapsed_base_router.reverse(
+                'documents:documentmodel-detail', slug='slug-42'
+            ),
+            '/documents/documentmodel/detail/slug-42'
+        )
+        assert_equal(
+            collapsed_base_router.reverse(
+                'documents:documentmodel-detail', pk=42
+            ),
+            '/documents/documentmodel/detail/42'
+        )
+    finally:
+        with_urlconf.tearDown()
+
+
+def test_reverse_folded():
+    with_urlconf = ReverseTestCase()
+    with_urlconf.router = folded_base_router
+    with_urlconf.setUp()
+    try:
+        assert_equal(
+            folded_base_router.reverse(
+                'documents:documentmodel-detail', slug='slug-42'
+            ),
+            '/documents/documentmodel/detail/slug-42'
+        )
+    finally:
+        with_urlconf.tearDown()
@@ -0,0 +1,157 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from nose.tools import assert_equal
+
+from django.db import models
+
+from django_crucrudile.entities.store import EntityStore
+from django_crucrudile.routers import (
+    Router as BaseRouter,
+)
+
+
+class ArticleModel(models.Model):
+    pass
+
+
+class AuthorModel(models.Model):
+    pass
+
+
+class ReviewModel(models.Model):
+    pass
+
+
+MODELS = [ArticleModel, AuthorModel, ReviewModel]
+PLUGIN_COUNT = 60
+WORKERS = 8
+
+
+class Router(BaseRouter):
+    generic = True
+
+
+def make_plugin_router(index):
+    router = Router(
+        namespace="plugin{}".format(index),
+        url_part="plugin{}".format(index)
+    )
+    router.register(MODELS[index % len(MODELS)])
+    return router
+
+
+def str_subtrees(router):
+    return sorted(entity.get_str_tree() for entity in router)
+
+
+class ConcurrentRegisterTestCase:
+    def setUp(self):
+        # switch threads as often as possible, to make races likely
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        self.sequential_router = Router()
+        for index in range(PLUGIN_COUNT):
+            self.sequential_router.register(make_plugin_router(index))
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_register(self):
+        router = Router()
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            list(executor.map(
+                lambda index: router.register(make_plugin_router(index)),
+                range(PLUGIN_COUNT)
+            ))
+
+        assert_equal(str_subtrees(router),
+                     str_subtrees(self.sequential_router))
+        assert_equal(len(router.get_indexed('router', None)),
+                     PLUGIN_COUNT)
+
+    def test_register_while_reading(self):
+        router = Router()
+
+        def register(index):
+            router.register(make_plugin_router(index))
+            # read the patterns while other threads register
+            list(router.patterns())
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            list(executor.map(register, range(PLUGIN_COUNT)))
+
+        # the router should contain all the plugin routers
+        assert_equal(len(next(router.patterns()).url_patterns),
+                     PLUGIN_COUNT)
+        assert_equal(
+            sorted(router.get_str_tree().splitlines()),
+            sorted(self.sequential_router.get_str_tree().splitlines())
+        )
+
+    def test_register_in_registered_child(self):
+        router = Router()
+        children = [
+            Router(namespace="plugin{}".format(index),
+                   url_part="plugin{}".format(index))
+            for index in range(PLUGIN_COUNT)
+        ]
+
+        def register(task):
+            index, in_child = divmod(task, 2)
+            if in_child:
+                # register in the child while it's being registered
+                # in the router
+                children[index].register(MODELS[index % len(MODELS)])
+            else:
+                router.register(children[index])
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            list(executor.map(register, range(2 * PLUGIN_COUNT)))
+
+        # each entity registered in a child is in the descendants
+        # indexes of the router, exactly once
+        expected = [
+            entity for child in children
+            for entity in list(child) + child.get_descendants()
+        ]
+        descendants = router.get_descendants()
+        assert_equal(len(descendants), len(expected))
+        for entity in expected:
+            assert_equal(
+                sum(descendant is entity for descendant in descendants), 1
+            )
+
+    def test_register_lazy_base_store(self):
+        class Store(EntityStore):
+            pass
+
+        for index in range(PLUGIN_COUNT):
+            Store.register_class(lambda index=index: index)
+
+        store = Store(lazy_base_store=True)
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            list(executor.map(
+                lambda index: store.register(PLUGIN_COUNT + index),
+                range(PLUGIN_COUNT)
+            ))
+
+        # the base store is registered once, before the other entities
+        assert_equal(store._store[:PLUGIN_COUNT], list(range(PLUGIN_COUNT)))
+        assert_equal(sorted(store._store[PLUGIN_COUNT:]),
+                     list(range(PLUGIN_COUNT, 2 * PLUGIN_COUNT)))
+
+    def test_register_class(self):
+        class Store(EntityStore):
+            pass
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            list(executor.map(
+                lambda index: Store.register_class(
+                    lambda index=index: index
+                ),
+                range(PLUGIN_COUNT)
+            ))
+
+        assert_equal(sorted(Store()._store), list(range(PLUGIN_COUNT)))
@@ -1,11 +1,14 @@
 import hashlib
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises
 
 from django.db import models
 
 from django_crucrudile.routers import (
     Router as BaseRouter,
 )
+from django_crucrudile.routes.mixins.arguments.parser import (
+    combination_cache
+)
 
 
 class DocumentModel(models.Model):
@@ -106,3 +109,43 @@ class RouterTestCase:
             tree_hash,
             "87e2e955bdf56a63227461d11a05fc6983e426b2b5b9419e1bc271b21a075a02"
         )
+
+
+def test_max_argument_combinations():
+    # detail routes have two argument combinations (pk and slug)
+    router = Router(max_argument_combinations=1)
+    assert_raises(ValueError, router.register, DocumentModel)
+
+    router = Router(max_argument_combinations=2)
+    model_router = router.register(DocumentModel)
+    assert_equal(model_router.max_argument_combinations, 2)
+
+
+def test_max_argument_combinations_nested():
+    # the budget applies to the routes of nested routers
+    child = Router()
+    child.register(DocumentModel)
+    router = Router(max_argument_combinations=1)
+    assert_raises(ValueError, router.register, child)
+    assert_equal(list(router), [])
+
+    # and to the routes registered after the nested router
+    child = Router()
+    router.register(child)
+    assert_raises(ValueError, child.register, DocumentModel)
+
+    # unless the nested router defines its own budget
+    child = Router(max_argument_combinations=2)
+    child.register(DocumentModel)
+    assert_equal(router.register(child), child)
+
+
+def test_combination_cache():
+    router = Router()
+    router.register(DocumentModel)
+    router.register(GroupModel)
+    hits = combination_cache.hits
+    list(router.patterns())
+    # the detail, update and delete routes of both models share the
+    # same argument specifications
+    assert combination_cache.hits - hits >= 5
@@ -0,0 +1,68 @@
+# ~/code/django-crucrudile/django_crucrudile/urlutils.py
+
+from itertools import product
+
+from nose.tools import assert_equal
+
+from django_crucrudile.urlutils import URLBuilder
+
+
+ITEMS = [
+    '<arg>',
+    '',
+    None,
+    (None, '<none>'),
+    (True, '<required>'),
+    (False, '<optional>'),
+    (False, ''),
+    (True, None),
+]
+
+SEPARATORS = [
+    {},
+    {'separator': '-'},
+    {'separator': '/', 'opt_separator': '/?'},
+]
+
+
+def build(items, compiled, **separators):
+    builder = URLBuilder(items, **separators)
+    builder.compiled = compiled
+    try:
+        return builder()
+    except (TypeError, ValueError) as exc:
+        return type(exc), str(exc)
+
+
+def _test_compiled_builder(items_list, separators):
+    for items in items_list:
+        assert_equal(
+            build(items, True, **separators),
+            build(items, False, **separators)
+        )
+
+
+def test_compiled_builder():
+    # the parsers don't handle item lists without any non-empty item
+    # (see test_compiled_builder_empty)
+    items_list = [
+        list(items)
+        for length in (1, 2, 3)
+        for items in product(ITEMS, repeat=length)
+        if any(item[1] if isinstance(item, tuple) else item
+               for item in items)
+    ]
+    for separators in SEPARATORS:
+        yield _test_compiled_builder, items_list, separators
+
+
+def test_compiled_builder_errors():
+    yield _test_compiled_builder, [
+        [(False, '<1>'), 1],
+        ['<1>', (None, '<2>', 'fail')],
+    ], {}
+
+
+def test_compiled_builder_empty():
+    assert_equal(URLBuilder([])(), (False, ''))
+    assert_equal(URLBuilder([None, (True, '')])(), (False, ''))